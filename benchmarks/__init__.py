@@ -0,0 +1,2 @@
+"""Benchmarks of the collinear implementations, run with `python -m benchmarks.run --help`.
+"""
@@ -0,0 +1,156 @@
+"""Measure every implementation of `get_lines` on several input sizes and shapes, and save the results as JSON.
+Reports wall time, pairs per second, peak memory with tracemalloc and the memory blocks still allocated afterwards.
+The O(n^2) memory implementations are only measured up to `SIZE_LIMITS` points unless --no-size-limits is given, and
+NumPy rows that fell back to the pure Python engine, e.g. for coordinates beyond float64 precision, are marked.
+
+    $ python -m benchmarks.run --sizes 100,1000 --output before.json
+    $ python -m benchmarks.run --sizes 100,1000 --output after.json --compare before.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from random import Random
+from typing import Callable, Dict, List
+
+from benchmarks.shapes import SHAPES
+from collinear import get_collinears, get_collinears_oop, get_collinears_oop_dataset, scan_numpy
+from collinear.points import distinct_grid_points
+
+IMPLEMENTATIONS: Dict[str, Callable] = {
+    "get_collinears": get_collinears.get_lines,
+    "get_collinears[anchor]": partial(get_collinears.get_lines, engine="anchor"),
+    "get_collinears[numpy]": partial(get_collinears.get_lines, backend="numpy"),
+    "get_collinears_oop": get_collinears_oop.get_lines,
+    "get_collinears_oop_dataset": get_collinears_oop_dataset.get_lines,
+}
+
+# Implementations that use the NumPy backend, when it is installed and the coordinates fit it.
+NUMPY_IMPLEMENTATIONS = ("get_collinears[numpy]",)
+
+DEFAULT_SIZES = "100,1000,5000,20000"
+
+# Largest default sizes of the implementations with a table of every two-point line, which do not finish at 20k points.
+SIZE_LIMITS: Dict[str, int] = {
+    "get_collinears": 5000,
+    "get_collinears_oop": 5000,
+    "get_collinears_oop_dataset": 5000,
+}
+
+
+def measure(get_lines: Callable, points: List, repeat: int) -> Dict:
+    """Best wall time of `repeat` runs, then one more run under tracemalloc for memory."""
+    distinct = len(set(points))
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        lines = get_lines(points)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del lines
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    lines = get_lines(points)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+
+    pairs = distinct * (distinct - 1) // 2
+    return {
+        "seconds": best,
+        "pairs": pairs,
+        "pairs_per_second": pairs / best if best else None,
+        "peak_bytes": peak,
+        "retained_blocks": blocks,
+        "lines": len(lines),
+    }
+
+
+def run(
+    implementations: List[str], shapes: List[str], sizes: List[int], repeat: int, seed: int, size_limits: bool = True
+) -> Dict:
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            points = SHAPES[shape](size, Random(f"{seed}-{shape}-{size}"))
+            numpy_used = scan_numpy.available(distinct_grid_points(points)[0])
+            for name in implementations:
+                if size_limits and size > SIZE_LIMITS.get(name, size):
+                    print(f"{name:28} {shape:10} {size:>6} skipped, above {SIZE_LIMITS[name]} points", flush=True)
+                    continue
+                result = {"implementation": name, "shape": shape, "size": size}
+                result.update(measure(IMPLEMENTATIONS[name], points, repeat))
+                result["numpy_fallback"] = name in NUMPY_IMPLEMENTATIONS and not numpy_used
+                results.append(result)
+                print(
+                    f"{name:28} {shape:10} {size:>6} {result['seconds']:>10.4f}s "
+                    f"{result['pairs_per_second'] or 0:>14,.0f} pairs/s {result['peak_bytes']:>14,} B peak"
+                    f"{' (fell back to Python)' if result['numpy_fallback'] else ''}",
+                    flush=True,
+                )
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": scan_numpy.np.__version__ if scan_numpy.np is not None else None,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> None:
+    """Print the time and peak memory ratio of each measurement to the same one in baseline."""
+    before = {(r["implementation"], r["shape"], r["size"]): r for r in baseline["results"]}
+    for result in current["results"]:
+        old = before.get((result["implementation"], result["shape"], result["size"]))
+        if old is None:
+            continue
+        print(
+            f"{result['implementation']:28} {result['shape']:10} {result['size']:>6} "
+            f"time x{result['seconds'] / old['seconds']:.2f} "
+            f"peak x{result['peak_bytes'] / max(old['peak_bytes'], 1):.2f}"
+        )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--implementations", default=",".join(IMPLEMENTATIONS), help="comma separated names")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="comma separated shapes")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated numbers of points")
+    parser.add_argument("--no-size-limits", action="store_true", help="measure every size, see SIZE_LIMITS")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best time is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    implementations = args.implementations.split(",")
+    shapes = args.shapes.split(",")
+    for name in implementations:
+        if name not in IMPLEMENTATIONS:
+            parser.error(f"unknown implementation {name!r}, expected one of {', '.join(IMPLEMENTATIONS)}")
+    for shape in shapes:
+        if shape not in SHAPES:
+            parser.error(f"unknown shape {shape!r}, expected one of {', '.join(SHAPES)}")
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run(implementations, shapes, sizes, args.repeat, args.seed, not args.no_size_limits)
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
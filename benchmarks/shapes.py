@@ -0,0 +1,56 @@
+"""Seeded input shapes for the benchmarks, each a function of (n, rng) returning a list of n (x, y) points.
+"""
+
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from collinear.synthetic import workload
+
+BOUNDARY = 10 ** 9
+
+
+def all_random(n: int, rng: Random) -> List[Tuple[int, int]]:
+    """Random points, almost no collinear triples."""
+    return workload(num_lines=0, noise_points=n, boundary=BOUNDARY, seed=rng)
+
+
+def dense_collinear(n: int, rng: Random) -> List[Tuple[int, int]]:
+    """All points on about sqrt(n) random lines, the remainder of n as random points."""
+    num_lines = max(int(n ** 0.5), 1)
+    per_line = n // num_lines
+    return workload(
+        num_lines=num_lines if per_line else 0,
+        points_per_line=max(per_line, 1),
+        noise_points=n - num_lines * per_line,
+        boundary=BOUNDARY // 1000,
+        slope_boundary=1000,
+        seed=rng,
+    )
+
+
+def many_vertical(n: int, rng: Random) -> List[Tuple[int, int]]:
+    """Points on n / 10 lines parallel with y-axis, the remainder of n as random points."""
+    return workload(
+        num_lines=0,
+        points_per_line=10,
+        noise_points=n % 10,
+        vertical_lines=n // 10,
+        boundary=BOUNDARY,
+        seed=rng,
+    )
+
+
+def heavy_duplicates(n: int, rng: Random) -> List[Tuple[int, int]]:
+    """Every point repeated about 10 times."""
+    distinct = max(n // 10, 1)
+    return workload(
+        num_lines=0, noise_points=distinct, duplicate_fraction=1 - distinct / n, boundary=BOUNDARY, seed=rng
+    )
+
+
+SHAPES: Dict[str, Callable[[int, Random], List[Tuple[int, int]]]] = {
+    "random": all_random,
+    "dense": dense_collinear,
+    "vertical": many_vertical,
+    "duplicates": heavy_duplicates,
+}
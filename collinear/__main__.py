@@ -0,0 +1,3 @@
+from collinear.cli import main
+
+main()
@@ -0,0 +1,198 @@
+"""Opt-in cache of `get_lines` results by point-set fingerprint.
+The fingerprint hashes the sorted distinct grid points and their scale, so the same set of points in any order and with
+any duplicates is found again. Results are kept in a least recently used memory tier bounded by entries and bytes, and
+optionally in a directory of files that survives restarts, bounded by entries and evicted by last use as well.
+"""
+
+
+import os
+import tempfile
+from array import array  # Compact storage of cached lines.
+from collections import OrderedDict  # Least recently used order.
+from hashlib import blake2b
+from itertools import chain
+from typing import Any, Iterable, List, NamedTuple, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import find_lines, validate_options, validate_points
+from collinear.points import distinct_grid_points
+
+DEFAULT_MAX_ENTRIES = 128
+
+DEFAULT_MAX_DISK_ENTRIES = 4096
+
+# Suffix of the files of the disk tier.
+FILE_SUFFIX = ".lines"
+
+
+class CacheStats(NamedTuple):
+    """Counters of a `LineCache`, disk hits are counted in hits too."""
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+def fingerprint(xy_list: Iterable[Tuple[int, int]], scale: int = 1) -> str:
+    """Order-independent hex digest of distinct grid points and their scale."""
+    points = sorted(xy_list)
+    digest = blake2b(f"{scale};{len(points)};".encode(), digest_size=20)
+    try:
+        digest.update(array("q", chain.from_iterable(points)).tobytes())
+    except OverflowError:
+        # Coordinates beyond int64 are hashed by their decimal representation.
+        digest.update(b"big;" + ";".join(f"{x},{y}" for x, y in points).encode())
+    return digest.hexdigest()
+
+
+class LineCache:
+    """Least recently used cache in front of `get_lines`.
+    The memory tier holds up to max_entries results and, with max_bytes, up to max_bytes of lines, 16 bytes each.
+    With directory, every computed result is also written there and read back on a memory miss. The directory holds up
+    to max_disk_entries files, the least recently used ones are removed first. Unreadable files count as misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = None,
+        directory: str = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        if not isinstance(max_entries, int) or max_entries < 0:
+            raise ValueError(f"Expected max_entries is a non-negative int. {max_entries!r} received.")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+            raise ValueError(f"Expected max_bytes is a non-negative int. {max_bytes!r} received.")
+        if not isinstance(max_disk_entries, int) or max_disk_entries < 1:
+            raise ValueError(f"Expected max_disk_entries is a positive int. {max_disk_entries!r} received.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_lines(
+        self,
+        xy_list: List[Tuple[Any, Any]] = None,
+        engine: str = "pairs",
+        backend: str = "python",
+        workers: int = None,
+        min_points: int = 3,
+    ) -> List[Tuple[float, float]]:
+        """`get_lines` with cached results, options and exceptions are the same.
+        Lines of a cached result are in the order of the input that computed it first.
+        """
+
+        validate_points(xy_list)
+
+        validate_options(engine, backend, workers, min_points)
+
+        points, scale = distinct_grid_points(xy_list)
+        # Engines, backends and workers give identical output, only min_points changes the result.
+        key = f"{fingerprint(points, scale)}-{min_points}"
+
+        lines = self._entries.get(key)
+        if lines is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return _unpack(lines)
+
+        lines = self._read(key)
+        if lines is not None:
+            self._hits += 1
+            self._disk_hits += 1
+        else:
+            self._misses += 1
+            lines = array("d", chain.from_iterable(find_lines(points, scale, engine, backend, workers, min_points)))
+            self._write(key, lines)
+
+        self._store(key, lines)
+        return _unpack(lines)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._disk_hits, self._misses, self._evictions, len(self._entries), self._bytes)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the memory tier, and the files of the disk tier with disk=True. Counters are kept."""
+        self._entries.clear()
+        self._bytes = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(FILE_SUFFIX):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _store(self, key: str, lines: array) -> None:
+        size = lines.itemsize * len(lines)
+        if self.max_entries == 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return  # Would evict everything else and still not fit.
+
+        self._entries[key] = lines
+        self._bytes += size
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.itemsize * len(evicted)
+            self._evictions += 1
+
+    def _read(self, key: str) -> array:
+        if self.directory is None:
+            return None
+        path = os.path.join(self.directory, key + FILE_SUFFIX)
+        try:
+            with open(path, "rb") as cache_file:
+                data = cache_file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) % 16:
+            # Truncated or corrupt, lines are pairs of 8 bytes values.
+            _remove(path)
+            return None
+        os.utime(path)  # Last use, for the eviction order of the disk tier
+        lines = array("d")
+        lines.frombytes(data)
+        return lines
+
+    def _write(self, key: str, lines: array) -> None:
+        if self.directory is None:
+            return
+        # Write to a temporary file first, so readers never see a partial file.
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as cache_file:
+                lines.tofile(cache_file)
+            os.replace(temporary, os.path.join(self.directory, key + FILE_SUFFIX))
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(FILE_SUFFIX)]
+        if len(files) > self.max_disk_entries:
+            # The file just written is the most recently used one, also on file systems with coarse timestamps.
+            files.sort(key=lambda entry: (entry.name == key + FILE_SUFFIX, entry.stat().st_mtime_ns))
+            for entry in files[:len(files) - self.max_disk_entries]:
+                _remove(entry.path)
+
+
+def _remove(path: str) -> None:
+    # Another cache on the same directory may have removed it already.
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _unpack(lines: array) -> List[Tuple[float, float]]:
+    # A new list on every call, so callers may modify it without changing the cache.
+    return list(zip(lines[0::2], lines[1::2]))
@@ -0,0 +1,66 @@
+"""Command-line entry point, run as `python -m collinear points.csv`.
+Loads points with `collinear.loaders`, finds the lines of collinear points and writes them as CSV or JSON lines.
+JSON has no infinity, so lines parallel with y-axis are written with a null slope and their x as intercept.
+"""
+
+
+import argparse
+import csv
+import json
+import sys
+from math import inf  # Slope of lines parallel with y-axis.
+from typing import List, TextIO, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import BACKENDS, find_lines
+from collinear.loaders import BINARY_FORMATS, load_points
+from collinear.points import distinct_grid_points
+from collinear.scan import ENGINES
+
+
+def write_lines(lines: List[Tuple[float, float]], output: TextIO, output_format: str) -> None:
+    """Write (slope, y-intercept) lines, vertical lines as (inf, x) like `get_lines` in CSV and (null, x) in JSON."""
+    if output_format == "jsonl":
+        for slope, intercept in lines:
+            slope = None if slope == inf else slope
+            output.write(json.dumps({"slope": slope, "intercept": intercept}, allow_nan=False) + "\n")
+    else:
+        writer = csv.writer(output)
+        writer.writerow(("slope", "intercept"))
+        writer.writerows(lines)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m collinear", description="Find lines of collinear points.")
+    parser.add_argument("path", help="CSV, .npy or raw binary file of (x, y) points")
+    parser.add_argument("--format", choices=("csv", "npy", "binary"), help="input format, default by file extension")
+    parser.add_argument("--dtype", choices=tuple(BINARY_FORMATS), default="int64", help="values of raw binary files")
+    parser.add_argument("--output", help="file to write, default standard output")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--engine", choices=ENGINES, default="anchor")
+    parser.add_argument("--backend", choices=BACKENDS, default="python")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--min-points", type=int, default=3)
+    parser.add_argument("--memory-bytes", type=int, help="memory budget of the external engine")
+    parser.add_argument("--spill-directory", help="directory of the temporary files of the external engine")
+    args = parser.parse_args(argv)
+
+    try:
+        xy_list, scale = distinct_grid_points(load_points(args.path, args.format, args.dtype))
+        lines = find_lines(
+            xy_list,
+            scale,
+            args.engine,
+            args.backend,
+            args.workers,
+            args.min_points,
+            args.memory_bytes,
+            args.spill_directory,
+        )
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+
+    if args.output:
+        with open(args.output, "w", newline="") as output:
+            write_lines(lines, output, args.output_format)
+    else:
+        write_lines(lines, sys.stdout, args.output_format)
@@ -0,0 +1,83 @@
+"""Lines that changed between two versions of a point set, without scanning either version in full.
+Only lines through an added or removed point can change, and the lines through one point are found from its partners
+in O(n). Comparing the partners of every changed point in both versions costs O(changed points * n) instead of O(n^2).
+"""
+
+
+from typing import Any, Dict, List, NamedTuple, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import validate_min_points, validate_points
+from collinear.line_keys import Key, line_key, to_float_line
+from collinear.points import distinct_grid_points
+
+
+class LineDiff(NamedTuple):
+    """Lines with min_points or more points in either version, by how their number of distinct points changed."""
+    appeared: List[Tuple[Tuple[float, float], int]]  # (line, new points)
+    disappeared: List[Tuple[Tuple[float, float], int]]  # (line, old points)
+    changed: List[Tuple[Tuple[float, float], int, int]]  # (line, old points, new points)
+    added_points: int
+    removed_points: int
+
+
+def diff_lines(
+    old_points: List[Tuple[Any, Any]] = None, new_points: List[Tuple[Any, Any]] = None, min_points: int = 3
+) -> LineDiff:
+    """Return the lines that appeared in, disappeared from or changed points between old_points and new_points.
+    Lines are (slope, y-intercept) tuples like in `get_lines`, each list is in the order the lines are found.
+    """
+
+    validate_points(old_points)
+    validate_points(new_points)
+
+    validate_min_points(min_points)
+
+    old, old_scale = distinct_grid_points(old_points)
+    new, new_scale = distinct_grid_points(new_points)
+
+    # Both versions on the finer of the two grids.
+    scale = max(old_scale, new_scale)
+    if old_scale != scale:
+        old = [(x * (scale // old_scale), y * (scale // old_scale)) for x, y in old]
+    if new_scale != scale:
+        new = [(x * (scale // new_scale), y * (scale // new_scale)) for x, y in new]
+
+    old_set = set(old)
+    new_set = set(new)
+    removed = [xy for xy in old if xy not in new_set]
+    added = [xy for xy in new if xy not in old_set]
+
+    # Distinct points of every line through a changed point, in each version.
+    supports: Dict[Key, List[int]] = {}
+    for point in removed + added:
+        for version, (points, members) in enumerate(((old, old_set), (new, new_set))):
+            own = 1 if point in members else 0
+            for line, partners in _partners(point, points).items():
+                supports.setdefault(line, [0, 0])[version] = partners + own
+
+    appeared = []
+    disappeared = []
+    changed = []
+    for line, (before, after) in supports.items():
+        if before == after or (before < min_points and after < min_points):
+            continue
+        float_line = to_float_line(line, scale)
+        if before < min_points:
+            appeared.append((float_line, after))
+        elif after < min_points:
+            disappeared.append((float_line, before))
+        else:
+            changed.append((float_line, before, after))
+    return LineDiff(appeared, disappeared, changed, len(added), len(removed))
+
+
+def _partners(point: Tuple[int, int], points: List[Tuple[int, int]]) -> Dict[Key, int]:
+    """Number of other points of a version on each line through point."""
+    x0, y0 = point
+    partners = {}
+    for x1, y1 in points:
+        if x1 == x0 and y1 == y0:
+            continue
+        line = line_key(x0, y0, x1, y1)
+        partners[line] = partners.get(line, 0) + 1
+    return partners
@@ -0,0 +1,181 @@
+"""External-memory version of the pairs engine in `collinear.scan` for point sets whose table of lines exceeds memory.
+The line key of every pair of points is written as a fixed-size binary record to one of several temporary bucket
+files, partitioned by the hash of the key. Every bucket then holds all the pairs of its lines and is counted on its
+own, so only one bucket's table is in memory at a time. When the budget can not hold a buffer for every bucket at once,
+buckets whose distinct lines overflow a table are partitioned again by the next digits of the hash.
+"""
+
+
+import os
+import tempfile
+from array import array  # Buffered records.
+from math import ceil
+from typing import Any, Iterable, Iterator, List, Optional, Tuple  # Optional type deceleration.
+
+from collinear.line_keys import Key, line_key
+
+# Memory budget of the external engine, for the bucket buffers while writing and one bucket's table while counting.
+MEMORY_BYTES = 256 << 20
+
+# Approximate memory of one distinct line in a counting table, i.e. dict entry, key tuple, ints and list.
+BYTES_PER_LINE = 300
+
+# Records are (dy, dx, c, pair number) in int64, as |c| < 2^63 while every |grid coordinate| < 2^30. Larger
+# coordinates get wider records of signed little-endian fields, that are still of the same size in one scan.
+RECORD_ITEMS = 4
+COORDINATE_LIMIT = 2 ** 30
+
+# Bucket buffers are written in sequential chunks of this size range.
+MIN_BUFFER_BYTES = 64 << 10
+MAX_BUFFER_BYTES = 4 << 20
+READ_BYTES = 4 << 20
+
+# Bits of the hash of line keys, which run out after this many partitioning levels of 2 or more buckets.
+HASH_BITS = 64
+
+
+def external_scan(
+    xy_list: List[Tuple[int, int]], min_points: int = 3, memory_bytes: int = None, directory: str = None
+) -> List[Key]:
+    """Same lines in the same order as `collinear.scan.pair_scan`, within about memory_bytes of working memory.
+    Half of the budget holds the bucket buffers while writing, the other half one bucket's table while counting.
+    Bucket files are written to a temporary directory in directory, by default the system one, and removed afterwards.
+    """
+
+    validate_memory_bytes(memory_bytes)
+    memory_bytes = MEMORY_BYTES if memory_bytes is None else memory_bytes
+
+    # |dx|, |dy| < 2^(bits + 1) and |c| < 2^(2 * bits + 2), plus the sign bit.
+    bits = max((abs(coordinate).bit_length() for xy in xy_list for coordinate in xy), default=0)
+    field_bytes = 8 if bits < COORDINATE_LIMIT.bit_length() else (2 * bits + 3 + 7) // 8
+    record_bytes = 3 * field_bytes + 8
+
+    # Every distinct line of a bucket must fit the table half of the budget, in the worst case one per pair. The
+    # buffers of all buckets of one partitioning pass must fit the other half.
+    half = memory_bytes // 2
+    num_pairs = len(xy_list) * (len(xy_list) - 1) // 2
+    fan_out = min(max(ceil(num_pairs * BYTES_PER_LINE / half), 1), half // MIN_BUFFER_BYTES)
+    buffer_bytes = min(half // fan_out, MAX_BUFFER_BYTES)
+    read_bytes = min(READ_BYTES, half // 2)
+    read_bytes -= read_bytes % record_bytes
+    max_level = HASH_BITS // fan_out.bit_length()
+
+    with tempfile.TemporaryDirectory(prefix="collinear-", dir=directory) as spill_directory:
+        buckets = _write_buckets(
+            _pair_records(xy_list), os.path.join(spill_directory, "bucket"), fan_out, 0, buffer_bytes, field_bytes
+        )
+
+        # Lines by their first pair, which is the order of the dict of the pairs engine.
+        # A bucket is only partitioned again when its distinct lines overflow the table, not by its number of records,
+        # so the pairs of one long line stay in one bucket that is counted right away.
+        min_pairs = min_points * (min_points - 1) // 2
+        max_lines = max(half // BYTES_PER_LINE, 1)
+        found = []
+        pending = [(path, 0) for path in buckets]
+        while pending:
+            path, level = pending.pop()
+            splittable = fan_out > 1 and level < max_level
+            counted = _count_bucket(
+                _read_records(path, read_bytes, field_bytes), min_pairs, max_lines if splittable else None
+            )
+            if counted is None:
+                records = _read_records(path, read_bytes, field_bytes)
+                sub_buckets = _write_buckets(records, path, fan_out, level + 1, buffer_bytes, field_bytes)
+                pending.extend((sub_bucket, level + 1) for sub_bucket in sub_buckets)
+            else:
+                found.extend(counted)
+            os.remove(path)
+    found.sort()
+    return [line for _, line in found]
+
+
+def validate_memory_bytes(memory_bytes: int) -> None:
+    """Raise the same exception as `external_scan` for an invalid memory_bytes option, None is the default budget."""
+    smallest = 4 * MIN_BUFFER_BYTES
+    if memory_bytes is not None and (not isinstance(memory_bytes, int) or memory_bytes < smallest):
+        raise ValueError(f"Expected memory_bytes is an int of at least {smallest}. {memory_bytes!r} received.")
+
+
+def _pair_records(xy_list: List[Tuple[int, int]]) -> Iterator[Tuple[Key, int]]:
+    """(line, pair number) of every pair of points, in the order of the pairs engine."""
+    pair = 0
+    for i, (x0, y0) in enumerate(xy_list[:-1]):
+        for x1, y1 in xy_list[i+1:]:
+            yield line_key(x0, y0, x1, y1), pair
+            pair += 1
+
+
+def _write_buckets(
+    records: Iterable[Tuple[Key, int]], prefix: str, fan_out: int, level: int, buffer_bytes: int, field_bytes: int
+) -> List[str]:
+    """Partition records into fan_out bucket files by the level-th digit of the hash of their line, in base fan_out."""
+    paths = [f"{prefix}.{bucket}" for bucket in range(fan_out)]
+    wide = field_bytes != 8
+    buffers = [bytearray() if wide else array("q") for _ in paths]
+    buffer_items = buffer_bytes if wide else buffer_bytes // 8
+    divisor = fan_out ** level
+    for line, pair in records:
+        bucket = hash(line) // divisor % fan_out
+        buffer = buffers[bucket]
+        if wide:
+            for value in line:
+                buffer += value.to_bytes(field_bytes, "little", signed=True)
+            buffer += pair.to_bytes(8, "little")
+        else:
+            buffer.extend(line)
+            buffer.append(pair)
+        if len(buffer) >= buffer_items:
+            _append(paths[bucket], buffer)
+            del buffer[:]
+
+    for path, buffer in zip(paths, buffers):
+        _append(path, buffer)
+    return paths
+
+
+def _append(path: str, records: Any) -> None:
+    with open(path, "ab") as bucket_file:
+        bucket_file.write(records)
+
+
+def _read_records(path: str, read_bytes: int, field_bytes: int) -> Iterator[Tuple[Key, int]]:
+    with open(path, "rb") as bucket_file:
+        while True:
+            chunk = bucket_file.read(read_bytes)
+            if not chunk:
+                break
+            yield from _records(chunk, field_bytes)
+
+
+def _count_bucket(
+    records: Iterable[Tuple[Key, int]], min_pairs: int, max_lines: int = None
+) -> Optional[List[Tuple[int, Key]]]:
+    """(first pair, line) of the lines of a bucket with min_pairs or more pairs.
+    None as soon as the bucket has more than max_lines distinct lines, when given.
+    """
+    lines = {}
+    for line, pair in records:
+        counted = lines.get(line)
+        if counted is None:
+            if max_lines is not None and len(lines) == max_lines:
+                return None
+            lines[line] = [1, pair]
+        else:
+            counted[0] += 1
+    return [(first_pair, line) for line, (pairs, first_pair) in lines.items() if pairs >= min_pairs]
+
+
+def _records(chunk: bytes, field_bytes: int) -> Iterator[Tuple[Key, int]]:
+    if field_bytes == 8:
+        records = array("q", chunk)
+        for start in range(0, len(records), RECORD_ITEMS):
+            yield (records[start], records[start + 1], records[start + 2]), records[start + 3]
+        return
+
+    record_bytes = 3 * field_bytes + 8
+    for start in range(0, len(chunk), record_bytes):
+        line = tuple(
+            int.from_bytes(chunk[field:field + field_bytes], "little", signed=True)
+            for field in range(start, start + 3 * field_bytes, field_bytes)
+        )
+        yield line, int.from_bytes(chunk[start + 3 * field_bytes:start + record_bytes], "little")
@@ -4,81 +4,368 @@ Each line is represented with a tuple of two floats as (slop, y-intercept) in Ca
 """
 
 
-from decimal import \
-    Decimal  # To avoid inherent floating-point binary representation error.
-from math import inf  # Represent infinity for vertical lines slops.
-from random import choice  # Choose a random element when examining input args.
-from typing import Any, List, Tuple  # Optional type deceleration.
+from array import array  # Compact index lists of line members.
+from concurrent.futures import ProcessPoolExecutor  # Spread batches of point sets across processes.
+from functools import partial
+from numbers import Real  # Tolerance values.
+from typing import (  # Optional type deceleration.
+    Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple)
 
+from collinear import instrument, scan_numpy
+from collinear.external import external_scan, validate_memory_bytes
+from collinear.hough import hough_lines
+from collinear.line_keys import Key, to_float_line
+from collinear.parallel import parallel_scan
+from collinear.points import distinct_grid_points, grid_points, is_columns, validate_type
+from collinear.scan import ENGINES, anchor_groups, anchor_scan, first_triple, pair_scan, top_scan
 
-def get_lines(xy_list: List[Tuple[Any, Any]] = None) -> List[Tuple[float, float]]:
+BACKENDS = ("python", "numpy")
 
-    if xy_list == []:  # Do not refactor with `if not xy_list:`
-        return []
+# Chunks of point sets per worker process of `get_lines_batch`, more chunks smooth out uneven set sizes.
+BATCH_CHUNKS_PER_WORKER = 4
 
-    # Pass (raise) exceptions to invoking caller if input is erroneous.
-    if xy_list is None:
-        raise ValueError("Expected input argument is missing.")
 
-    if not isinstance(xy_list, list):
-        raise TypeError(f"Expected input type is list. {type(xy_list)} received.")
+class LineGroup(NamedTuple):
+    """A line of collinear points, its input point indices and the number of distinct points on it."""
+    slope: float
+    intercept: float
+    indices: array
+    count: int
 
-    try:
-        x, y = choice(xy_list)
-        _ = x + y
-    except TypeError:
-        raise
-    except ValueError:
-        raise
-
-    # Ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
-    xy_list = list(set(xy_list))
-
-    # Algorithm:
-    # This is a O(n^2) runtime improved algorithm over the trivial O(n^3). The straight-forward approach is verify
-    # collinear points in each possible combination of 3 points, i.e. brut-forcing, which is O(n^3).
-    # Instead we travers points two times saving all possible lines in between two points in a hashtable/dictionary and
-    # assign two-pointer lines them with False value. {(slope, y-intercept): False}
-    # During this double travers if a line already exist it indicates there are more than collinear points in our input
-    # for than line. We change the value of those lines as True to filter the False lines from return value.
-
-
-    # To exactly represent Decimal numbers and avoid floating-point representation error.
+
+def get_lines(
+    xy_list: List[Tuple[Any, Any]] = None,
+    engine: str = "pairs",
+    backend: str = "python",
+    workers: int = None,
+    min_points: int = 3,
+    tolerance: float = None,
+    memory_bytes: int = None,
+    directory: str = None,
+) -> List[Tuple[float, float]]:
+    """Return (slope, y-intercept) of every line with min_points or more of the input points.
+    `engine="pairs"` keeps every two-point line in one table, `engine="anchor"` needs only O(n) working memory.
+    `engine="external"` spills the table of the pairs engine to temporary files within a memory budget of
+    memory_bytes, in directory, see `collinear.external.external_scan`.
+    `backend="numpy"` vectorizes the anchor engine and falls back to the pure Python `engine` when NumPy is missing.
+    `workers=k` shards the anchors of the anchor engine across k processes.
+    All engines and backends return identical output.
+    `tolerance=eps` finds lines with min_points or more points within distance eps of each instead, see
+    `collinear.hough.hough_lines`. It needs NumPy, and engine, backend and workers do not apply.
+    Calls are reported to the hooks of `collinear.instrument`, if any.
+    """
+
+    if instrument.hooks:
+        return _instrumented_lines(xy_list, engine, backend, workers, min_points, tolerance, memory_bytes, directory)
+
+    validate_points(xy_list)
+
+    validate_options(engine, backend, workers, min_points)
+
+    _validate_tolerance(tolerance)
+
+    validate_memory_bytes(memory_bytes)
+
+    # Scale all points to a shared integer grid once, e.g. 0.25 and 1.5 become 25 and 150 with scale 100.
+    # To exactly represent Decimal-like numbers and avoid floating-point representation error.
     # Prevents including fake distinct lines in results because of the floating-point representation error.
     # Example:
     #       n = 0.1 + 0.1 + 0.1
     #       n = 0.30000000000000004
     #
-    #       n = Decimal('0.1') + Decimal('0.1') + Decimal('0.1')
-    #       float(n) = 0.3
-    xy_list = [(Decimal(str(xy[0])), Decimal(str(xy[1]))) for xy in xy_list]
-
-    lines = {}
-    for i, xy in enumerate(xy_list[:-1]):
-        x0, y0 = xy
-        for x1, y1 in xy_list[i+1:]:
-
-            # Special case: parallel lines with y-axis
-            if not x1 - x0:
-                slope = inf
-                # There is no mathematical intercept for parallel lines with y-axis, but
-                # We use (inf, x) to represent this special case to identify distinct vertical lines.
-                intercept = x0
-            # All other cases:
-            else:
-                slope = (y1 - y0) / (x1 - x0)
-                intercept = y1 - slope * x1
-
-            line = (slope, intercept)
-            if line not in lines:
-                # Add line between two points with False as value indicating no 3rd or more points yet on this line.
-                lines[line] = False
-            else:
-                # When line already exist with new points it indicate there are more than 2 points or collinear points.
-                lines[line] = True
-
-    # Return all lines with 3 or more collinears
-    return [(float(line[0]), float(line[1])) for line in lines.keys() if lines[line]]
+    #       on the grid 1 + 1 + 1 == 3 with scale 10
+    # Also ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
+    # Every coordinate is validated during this single pass over the input.
+    xy_list, scale = distinct_grid_points(xy_list)
+
+    if tolerance is not None:
+        return hough_lines(xy_list, scale, float(tolerance), min_points)
+
+    return find_lines(xy_list, scale, engine, backend, workers, min_points, memory_bytes, directory)
+
+
+def iter_lines(
+    xy_list: List[Tuple[Any, Any]] = None, backend: str = "python", min_points: int = 3
+) -> Iterator[Tuple[float, float]]:
+    """Iterate the lines of `get_lines` in the same order, each one as soon as it is final.
+    A line is final when its lowest index point is processed as the anchor of the anchor engine, so the first lines
+    come early in the scan and only lines found so far are kept. Input errors are raised by this call, not by the
+    iteration.
+    """
+
+    validate_points(xy_list)
+
+    validate_options("anchor", backend, None, min_points)
+
+    xy_list, scale = distinct_grid_points(xy_list)
+
+    lines = scan_lines(xy_list, "anchor", backend, None, min_points)
+    return (to_float_line(line, scale) for line in lines)
+
+
+def find_lines(
+    xy_list: List[Tuple[int, int]],
+    scale: int = 1,
+    engine: str = "pairs",
+    backend: str = "python",
+    workers: int = None,
+    min_points: int = 3,
+    memory_bytes: int = None,
+    directory: str = None,
+) -> List[Tuple[float, float]]:
+    """`get_lines` for distinct points already on the integer grid, see `collinear.points.distinct_grid_points`.
+    Bulk loaders feed the engines through it without building and validating a list of input tuples.
+    """
+
+    validate_options(engine, backend, workers, min_points)
+
+    validate_memory_bytes(memory_bytes)
+
+    lines = scan_lines(xy_list, engine, backend, workers, min_points, None, memory_bytes, directory)
+
+    # Return all lines with min_points or more collinears
+    # There is no mathematical intercept for parallel lines with y-axis, but
+    # we use (inf, x) to represent this special case to identify distinct vertical lines.
+    return [to_float_line(line, scale) for line in lines]
+
+
+def scan_lines(
+    xy_list: List[Tuple[int, int]],
+    engine: str = "pairs",
+    backend: str = "python",
+    workers: int = None,
+    min_points: int = 3,
+    table: Dict[Key, int] = None,
+    memory_bytes: int = None,
+    directory: str = None,
+) -> Iterable[Key]:
+    """Line keys of distinct grid points from the engine, backend and workers chosen by the options.
+    The table of the pairs engine is kept in table, when given, see `collinear.scan.pair_scan`. memory_bytes and
+    directory apply to the external engine, see `collinear.external.external_scan`.
+    """
+    if workers is not None and workers > 1:
+        return parallel_scan(xy_list, workers, backend, min_points)
+    if backend == "numpy" and scan_numpy.available(xy_list):
+        return scan_numpy.numpy_scan(xy_list, min_points=min_points)
+    if engine == "pairs":
+        return pair_scan(xy_list, min_points, table)
+    if engine == "external":
+        return external_scan(xy_list, min_points, memory_bytes, directory)
+    return anchor_scan(xy_list, min_points=min_points)
+
+
+def get_lines_batch(
+    point_sets: Sequence[Any] = None,
+    engine: str = "anchor",
+    backend: str = "python",
+    workers: int = None,
+    min_points: int = 3,
+) -> List[List[Tuple[float, float]]]:
+    """Return `get_lines` of each of many independent point sets, in input order.
+    Options are validated once, and each set goes straight from its single validating grid pass to the engine.
+    `backend="numpy"` scans the pairs of many sets in vectorized segments, `workers=k` spreads chunks of sets across
+    k processes.
+    """
+
+    if point_sets is None:
+        raise ValueError("Expected input argument is missing.")
+
+    validate_options(engine, backend, workers, min_points)
+
+    if workers is None or workers == 1:
+        return _batch_lines(point_sets, engine, backend, min_points)
+
+    point_sets = list(point_sets)
+    chunk_size = max(len(point_sets) // (workers * BATCH_CHUNKS_PER_WORKER), 1)
+    chunks = [point_sets[start:start + chunk_size] for start in range(0, len(point_sets), chunk_size)]
+    with ProcessPoolExecutor(workers) as pool:
+        batch_lines = partial(_batch_lines, engine=engine, backend=backend, min_points=min_points)
+        return [lines for chunk in pool.map(batch_lines, chunks) for lines in chunk]
+
+
+def top_lines(
+    xy_list: List[Tuple[Any, Any]] = None, k: int = 1, min_points: int = 3
+) -> List[Tuple[Tuple[float, float], int]]:
+    """Return up to k lines with the most distinct points, at least min_points each, as ((slope, y-intercept), points).
+    Lines are in descending number of points. Only a heap of k lines is kept, and the scan stops as soon as no
+    remaining anchor can start a line with more points than the weakest of them.
+    """
+
+    validate_points(xy_list)
+
+    if not isinstance(k, int) or k < 1:
+        raise ValueError(f"Expected k is a positive int. {k!r} received.")
+
+    validate_min_points(min_points)
+
+    xy_list, scale = distinct_grid_points(xy_list)
+    return [(to_float_line(line, scale), points) for line, points in top_scan(xy_list, k, min_points)]
+
+
+def has_collinear(xy_list: List[Tuple[Any, Any]] = None) -> bool:
+    """Whether any 3 distinct input points are collinear, see `first_collinear_triple`."""
+    return first_collinear_triple(xy_list) is not None
+
+
+def first_collinear_triple(xy_list: List[Tuple[Any, Any]] = None) -> Optional[Tuple[Tuple[Any, Any], ...]]:
+    """Return the first 3 distinct collinear input points found, or None if there are none.
+    The scan stops at the first hit instead of finding every line, with O(n) memory. Points are ints, or floats on
+    inputs with decimal values.
+    """
+
+    validate_points(xy_list)
+
+    xy_list, scale = distinct_grid_points(xy_list)
+    triple = first_triple(xy_list)
+    if triple is None:
+        return None
+    if scale == 1:
+        return tuple(xy_list[i] for i in triple)
+    return tuple((xy_list[i][0] / scale, xy_list[i][1] / scale) for i in triple)
+
+
+def get_line_groups(xy_list: List[Tuple[Any, Any]] = None) -> List[LineGroup]:
+    """Return every line with 3 or more of the input points together with its member points.
+    Each `LineGroup` holds the ascending indices of all input points on the line, duplicates included, and the number
+    of distinct points on it. Lines are in the same order as `get_lines(xy_list, engine="anchor")`.
+    """
+
+    validate_points(xy_list)
+    grid, scale = grid_points(xy_list)
+
+    # Distinct points in order of their first index, and the extra indices of duplicate points.
+    first_index = {}
+    duplicates = {}
+    for i, xy in enumerate(grid):
+        if xy in first_index:
+            duplicates.setdefault(first_index[xy], []).append(i)
+        else:
+            first_index[xy] = i
+    points = list(first_index)
+    indices = array("q", first_index.values())
+
+    # The anchor engine already sees every member of a line, so memberships come from the same pass.
+    groups = []
+    for line, members in anchor_groups(points):
+        slope, intercept = to_float_line(line, scale)
+        group = array("q", (indices[member] for member in members))
+        if duplicates:
+            for member in members:
+                group.extend(duplicates.get(indices[member], ()))
+            group = array("q", sorted(group))
+        groups.append(LineGroup(slope, intercept, group, len(members)))
+    return groups
+
+
+def validate_points(xy_list: List[Tuple[Any, Any]]) -> None:
+    """Raise the same exceptions as `get_lines` for missing or erroneous input."""
+
+    # Pass (raise) exceptions to invoking caller if input is erroneous.
+    if xy_list is None:
+        raise ValueError("Expected input argument is missing.")
+
+    # Raises TypeError for unsupported input types.
+    # Each point and coordinate is checked later, while it is scaled to the grid.
+    validate_type(xy_list)
+
+
+def validate_options(engine: str, backend: str, workers: int, min_points: int) -> None:
+    """Raise the same exceptions as `get_lines` for invalid engine, backend, workers or min_points options."""
+
+    if engine not in ENGINES:
+        raise ValueError(f"Expected engine is one of {ENGINES}. {engine!r} received.")
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Expected backend is one of {BACKENDS}. {backend!r} received.")
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError(f"Expected workers is a positive int. {workers!r} received.")
+
+    validate_min_points(min_points)
+
+
+def validate_min_points(min_points: int) -> None:
+    """Raise the same exception as `get_lines` for an invalid min_points option."""
+    if not isinstance(min_points, int) or min_points < 2:
+        raise ValueError(f"Expected min_points is an int of 2 or more. {min_points!r} received.")
+
+
+def _instrumented_lines(
+    xy_list: Any,
+    engine: str,
+    backend: str,
+    workers: int,
+    min_points: int,
+    tolerance: float,
+    memory_bytes: int,
+    directory: str,
+) -> List[Tuple[float, float]]:
+    """`get_lines` in the phases of `collinear.instrument.PHASES`."""
+    timer = instrument.PhaseTimer()
+    try:
+        validate_points(xy_list)
+        validate_options(engine, backend, workers, min_points)
+        _validate_tolerance(tolerance)
+        validate_memory_bytes(memory_bytes)
+        timer.lap("validate")
+
+        points, scale = distinct_grid_points(xy_list)
+        timer.lap("grid")
+
+        table = {}
+        if tolerance is not None:
+            lines = hough_lines(points, scale, float(tolerance), min_points)
+            engine = "tolerance"
+        else:
+            lines = list(scan_lines(points, engine, backend, workers, min_points, table, memory_bytes, directory))
+        timer.lap("scan")
+
+        if tolerance is None:
+            lines = [to_float_line(line, scale) for line in lines]
+        timer.lap("output")
+
+        timer.report(
+            points=len(xy_list[0]) if is_columns(xy_list) else len(xy_list),
+            distinct_points=len(points),
+            pairs=len(points) * (len(points) - 1) // 2,
+            table_size=len(table) if table else None,
+            lines=len(lines),
+            engine=engine,
+            backend=backend,
+        )
+        return lines
+    finally:
+        timer.close()
+
+
+def _batch_lines(
+    point_sets: Sequence[Any], engine: str, backend: str, min_points: int
+) -> List[List[Tuple[float, float]]]:
+    grids = []
+    for xy_list in point_sets:
+        validate_points(xy_list)
+        grids.append(distinct_grid_points(xy_list))
+
+    batch = []
+    if backend == "numpy" and scan_numpy.np is not None:
+        batch = [i for i, (xy_list, _) in enumerate(grids) if scan_numpy.batch_available(xy_list)]
+    batch_lines = dict(zip(batch, scan_numpy.batch_pair_scan([grids[i][0] for i in batch], min_points)))
+
+    results = []
+    for i, (xy_list, scale) in enumerate(grids):
+        if i in batch_lines:
+            lines = batch_lines[i]
+        elif engine == "pairs":
+            lines = pair_scan(xy_list, min_points)
+        else:
+            lines = anchor_scan(xy_list, min_points=min_points)
+        results.append([to_float_line(line, scale) for line in lines])
+    return results
+
+
+def _validate_tolerance(tolerance: float) -> None:
+    if tolerance is not None and (not isinstance(tolerance, Real) or not 0 < tolerance < float("inf")):
+        raise ValueError(f"Expected tolerance is a positive finite number. {tolerance!r} received.")
 
 
 if __name__ == "__main__":
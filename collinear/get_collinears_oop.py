@@ -4,27 +4,40 @@ Each line is represented with a tuple of two floats as (slop, y-intercept) in Ca
 """
 
 
-from decimal import \
-    Decimal  # To avoid inherent floating-point binary representation error.
-from math import inf  # Represent infinity for vertical lines slops.
 from random import choice  # Choose a random element when examining input args.
 from typing import Any, List, Tuple  # Optional type deceleration.
 
+from collinear.line_keys import line_key, to_grid
+from collinear.line_table import LineTable
+
 
 class Line:
-    """"""
-    def __init__(self, slope, intercept):
-        self.slope = slope
-        self.intercept = intercept
-        self.contains_collinear = False
+    """Lightweight view of one row of a `LineTable`."""
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: LineTable, row: int):
+        self.table = table
+        self.row = row
+
+    @property
+    def slope(self) -> float:
+        return self.table.slopes[self.row]
+
+    @property
+    def intercept(self) -> float:
+        return self.table.intercepts[self.row]
+
+    @property
+    def contains_collinear(self) -> bool:
+        return self.table.pairs[self.row] > 1
 
     def __hash__(self):
         return hash((self.slope, self.intercept))
 
-    # def __eq__(self, other):
-    #     if other.__class__ is not self.__class__:
-    #         return NotImplemented
-    #     return (self.slope, self.intercept) == (other.slope, other.intercept)
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.slope, self.intercept) == (other.slope, other.intercept)
 
 
 def get_lines(xy_list: List[Tuple[Any, Any]] = None) -> List[Tuple[float, float]]:
@@ -48,38 +61,21 @@ def get_lines(xy_list: List[Tuple[Any, Any]] = None) -> List[Tuple[float, float]
     except ValueError:
         raise
 
-    # Ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
-    xy_list = list(set(xy_list))
     # Prevents including fake distinct lines in results because of the floating-point representation error.
-    xy_list = [(Decimal(str(xy[0])), Decimal(str(xy[1]))) for xy in xy_list]
-    lines = {}
+    xy_list, scale = to_grid(xy_list)
+    # Ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
+    xy_list = list(dict.fromkeys(xy_list))
+    # Lines are rows of a compact table keyed by the exact integer line, so different lines never merge.
+    lines = LineTable(scale, max((abs(v) for xy in xy_list for v in xy), default=0).bit_length())
     for i, xy in enumerate(xy_list[:-1]):
         x0, y0 = xy
         for x1, y1 in xy_list[i+1:]:
-
-            # Special case: parallel lines with y-axis
-            if not x1 - x0:
-                slope = inf
-                # There is no mathematical intercept for parallel lines with y-axis, but
-                # We use (inf, x) to represent this special case to identify distinct vertical lines.
-                intercept = x0
-            # All other cases:
-            else:
-                slope = (y1 - y0) / (x1 - x0)
-                intercept = y1 - slope * x1
-
-            line = Line(slope, intercept)
-
-            key =  line.__hash__()
-            if key in lines:
-                line.contains_collinear = True
-            lines[key] = line
-
+            lines.add(line_key(x0, y0, x1, y1))
 
     return [
-        (float(lines[key].slope), float(lines[key].intercept))
-        for key in lines.keys()
-        if lines[key].contains_collinear
+        (line.slope, line.intercept)
+        for line in (Line(lines, row) for row in range(len(lines)))
+        if line.contains_collinear
     ]
 
 
@@ -4,22 +4,31 @@ Each line is represented with a tuple of two floats as (slop, y-intercept) in Ca
 """
 
 from dataclasses import dataclass
-from decimal import \
-    Decimal  # To avoid inherent floating-point binary representation error.
-from math import inf  # Represent infinity for vertical lines slops.
 from random import choice  # Choose a random element when examining input args.
 from typing import Any, List, Tuple  # Optional type deceleration.
 
+from collinear.line_keys import line_key, to_grid
+from collinear.line_table import LineTable
 
-@dataclass
+
+@dataclass(frozen=True)
 class Line:
-    """"""
-    slope: Decimal
-    intercept: Decimal
-    contains_collinear: bool = False
+    """Lightweight view of one row of a `LineTable`."""
+    __slots__ = ("table", "row")
+    table: LineTable
+    row: int
+
+    @property
+    def slope(self) -> float:
+        return self.table.slopes[self.row]
 
-    def __hash__(self):
-        return hash((self.slope, self.intercept))
+    @property
+    def intercept(self) -> float:
+        return self.table.intercepts[self.row]
+
+    @property
+    def contains_collinear(self) -> bool:
+        return self.table.pairs[self.row] > 1
 
 
 def get_lines(xy_list: List[Tuple[Any, Any]] = None) -> List[Tuple[float, float]]:
@@ -42,37 +51,21 @@ def get_lines(xy_list: List[Tuple[Any, Any]] = None) -> List[Tuple[float, float]
     except ValueError:
         raise
 
-    # Ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
-    xy_list = list(set(xy_list))
     # Prevents including fake distinct lines in results because of the floating-point representation error.
-    xy_list = [(Decimal(str(xy[0])), Decimal(str(xy[1]))) for xy in xy_list]
-    lines = {}
+    xy_list, scale = to_grid(xy_list)
+    # Ensure a unique collection of Cartesian points. Duplicates do not contribute to desired return.
+    xy_list = list(dict.fromkeys(xy_list))
+    # Lines are rows of a compact table keyed by the exact integer line, so different lines never merge.
+    lines = LineTable(scale, max((abs(v) for xy in xy_list for v in xy), default=0).bit_length())
     for i, xy in enumerate(xy_list[:-1]):
         x0, y0 = xy
         for x1, y1 in xy_list[i+1:]:
-
-            # Special case: parallel lines with y-axis
-            if not x1 - x0:
-                slope = inf
-                # There is no mathematical intercept for parallel lines with y-axis, but
-                # We use (inf, x) to represent this special case to identify distinct vertical lines.
-                intercept = x0
-            # All other cases:
-            else:
-                slope = (y1 - y0) / (x1 - x0)
-                intercept = y1 - slope * x1
-
-            line = Line(slope, intercept)
-
-            key =  line.__hash__()
-            if key in lines:
-                line.contains_collinear = True
-            lines[key] = line
+            lines.add(line_key(x0, y0, x1, y1))
 
     return [
-        (float(lines[key].slope), float(lines[key].intercept))
-        for key in lines.keys()
-        if lines[key].contains_collinear
+        (line.slope, line.intercept)
+        for line in (Line(lines, row) for row in range(len(lines)))
+        if line.contains_collinear
     ]
 
 
@@ -0,0 +1,184 @@
+"""Near-collinear points within a distance tolerance, with a quantized Hough accumulator.
+Every point votes for the (angle, offset) cells of the lines x*cos(angle) + y*sin(angle) = offset through it. Cells
+with enough votes are only candidates. On large spans a cell is many tolerances wide, so the points of each candidate
+vote again at finer angles around it until the densest line is pinned down within tolerance, and only the points
+within tolerance of that line are refined by a total least squares fit. Candidates are taken by descending votes,
+each one costs a projection of the points plus O(points in its cells) as only its own cells are searched and refined,
+and candidates whose cells mostly hold points of one line already found are skipped. NumPy is needed for this mode.
+"""
+
+
+from math import atan2, ceil, hypot, inf, pi  # Grid resolution, fits and vertical lines slopes.
+from typing import List, Tuple  # Optional type deceleration.
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Number of angles of the accumulator, in [0, pi). More angles make the offset cells narrower.
+MIN_ANGLES = 180
+MAX_ANGLES = 1024
+
+# Votes of at most this many (point, angle) pairs are computed at once.
+VOTE_BLOCK = 1 << 22
+
+# Finer angles per round of the search for the densest line of a candidate.
+SEED_ANGLES = 32
+
+# Total least squares fits per candidate, each one on the points within tolerance of the previous one.
+REFINE_ROUNDS = 4
+
+
+def hough_lines(
+    xy_list: List[Tuple[int, int]], scale: int = 1, tolerance: float = 1.0, min_points: int = 3
+) -> List[Tuple[float, float]]:
+    """(slope, y-intercept) of lines with min_points or more distinct grid points within tolerance of each, in input
+    units. Lines are in descending number of points, and a line sharing more than half of its points with a stronger
+    line is the same line. Lines parallel with y-axis, within tolerance, are represented as (inf, x).
+    """
+
+    if np is None:  # pragma: no cover
+        raise ImportError("Expected NumPy for tolerance mode, install numpy.")
+    if len(xy_list) < min_points:
+        return []
+
+    points = np.array(xy_list, dtype=np.float64).reshape(-1, 2) / scale
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    center = (low + high) / 2
+    points = points - center
+    diagonal = max(hypot(*(high - low)), tolerance)
+
+    # Offsets of points within tolerance of a line spread by 2 * tolerance, plus up to diagonal * step / 2 at the
+    # nearest angle of the grid. Cells are that wide, so every line is within two neighboring cells.
+    num_angles = min(MAX_ANGLES, max(MIN_ANGLES, ceil(pi * diagonal / tolerance)))
+    angles = np.arange(num_angles) * (pi / num_angles)
+    width = 2 * tolerance + diagonal * (pi / num_angles) / 2
+    num_cells = int(ceil(diagonal / width)) + 2
+    shift = (num_cells - 2) * width / 2  # Cell k holds offsets in [(k - 1) * width - shift, k * width - shift)
+
+    votes = _votes(points, np.cos(angles), np.sin(angles), width, shift, num_cells)
+
+    # Candidates are pairs of neighboring cells with enough votes, that are a local maximum of the accumulator.
+    window = votes[:, :-1] + votes[:, 1:]
+    padded = np.pad(window, 1)
+    neighbors = np.max([
+        padded[1 + da:1 + da + window.shape[0], 1 + dr:1 + dr + window.shape[1]]
+        for da in (-1, 0, 1) for dr in (-1, 0, 1)
+    ], axis=0)
+    candidates = np.argwhere((window >= min_points) & (window == neighbors))
+    candidates = candidates[np.argsort(-window[candidates[:, 0], candidates[:, 1]], kind="stable")]
+
+    lines = {}
+    first_found = np.full(len(points), -1, dtype=np.int64)  # The first line found through each point
+    for angle, cell in candidates.tolist():
+        normal = np.array((np.cos(angles[angle]), np.sin(angles[angle])))
+        offsets = points @ normal
+        lowest = (cell - 1) * width - shift
+        members = np.flatnonzero((offsets >= lowest) & (offsets < lowest + 2 * width))
+        # Cells mostly on one line found already only find that line again, from a weaker candidate.
+        owners = first_found[members]
+        owners = owners[owners >= 0]
+        if len(owners) * 2 > len(members) and np.bincount(owners).max() * 2 > len(members):
+            continue
+        seed = _seed(points[members], angles[angle], pi / num_angles, tolerance, diagonal, min_points)
+        line = None if seed is None else _refine(points[members], *seed, tolerance, min_points)
+        if line is not None:
+            normal, offset, inliers = line
+            inliers = members[inliers]
+            if inliers.tobytes() not in lines:
+                first_found[inliers[first_found[inliers] < 0]] = len(lines)
+                lines[inliers.tobytes()] = (normal, offset, inliers)
+
+    # Strongest lines first, each one claims its points.
+    found = []
+    claimed = [[] for _ in range(len(points))]  # The found lines through each point
+    for normal, offset, inliers in sorted(lines.values(), key=lambda line: (-len(line[2]), line[2][0])):
+        shared = [line for point in inliers.tolist() for line in claimed[point]]
+        if len(shared) * 2 > len(inliers) and np.bincount(shared).max() * 2 > len(inliers):
+            continue
+        for point in inliers.tolist():
+            claimed[point].append(len(found))
+        found.append(_to_float_line(normal, offset, points[inliers], center, tolerance))
+    return found
+
+
+def _votes(points, cosines, sines, width: float, shift: float, num_cells: int):
+    num_points = len(points)
+    votes = np.zeros(len(cosines) * num_cells, dtype=np.int64)
+    block = max(VOTE_BLOCK // max(num_points, 1), 1)
+    for first in range(0, len(cosines), block):
+        offsets = np.outer(cosines[first:first + block], points[:, 0])
+        offsets += np.outer(sines[first:first + block], points[:, 1])
+        cells = np.floor((offsets + shift) / width).astype(np.int64) + 1
+        cells += (np.arange(first, first + len(offsets)) * num_cells)[:, None]
+        votes += np.bincount(cells.ravel(), minlength=len(votes))
+    return votes.reshape(len(cosines), num_cells)
+
+
+def _seed(members, angle: float, step: float, tolerance: float, diagonal: float, min_points: int):
+    """(normal, offset) of the densest line among the members of a candidate, with its angle within step of angle.
+    Each round votes at SEED_ANGLES angles over the current range and keeps the members of the best pair of cells,
+    until the angle is close enough to move offsets by at most tolerance / 2 over the diagonal. None as soon as no pair
+    of cells holds min_points members, as the points within tolerance of a line are in one pair at its nearest angle.
+    """
+    while step * diagonal > tolerance and len(members) > 1:
+        seed_angles = angle + np.linspace(-step, step, SEED_ANGLES)
+        step = 2 * step / (SEED_ANGLES - 1)
+        width = 2 * tolerance + diagonal * step / 2
+        offsets = np.outer(np.cos(seed_angles), members[:, 0]) + np.outer(np.sin(seed_angles), members[:, 1])
+        cells = np.floor(offsets / width).astype(np.int64)
+        cells -= cells.min()
+        num_cells = int(cells.max()) + 2
+        votes = np.bincount((cells + (np.arange(SEED_ANGLES) * num_cells)[:, None]).ravel(),
+                            minlength=SEED_ANGLES * num_cells).reshape(SEED_ANGLES, num_cells)
+        window = votes[:, :-1] + votes[:, 1:]
+        if window.max() < min_points:
+            return None
+        # Angles near the line keep all its points in a pair of cells, the middle one of them is the closest.
+        rows = np.flatnonzero(window.max(axis=1) == window.max())
+        best = rows[len(rows) // 2]
+        cell = np.argmax(window[best])
+        angle = seed_angles[best]
+        members = members[(cells[best] == cell) | (cells[best] == cell + 1)]
+
+    normal = np.array((np.cos(angle), np.sin(angle)))
+    return normal, float(np.median(members @ normal))
+
+
+def _refine(points, normal, offset: float, tolerance: float, min_points: int):
+    """Fitted (normal, offset, inliers) of the points within tolerance of a seed line, or None for fewer than
+    min_points of them. The seed is off by up to tolerance / 2, so its inliers are the points within 2 * tolerance.
+    """
+    inliers = np.flatnonzero(np.abs(points @ normal - offset) <= 2 * tolerance)
+    for _ in range(REFINE_ROUNDS):
+        if len(inliers) < min_points:
+            return None
+        fitted = points[inliers]
+        centroid = fitted.mean(axis=0)
+        # The total least squares line runs along the major axis of the 2x2 scatter matrix, at half the angle of
+        # (sxx - syy, 2 * sxy), and its normal is perpendicular to it.
+        (sxx, sxy), (_, syy) = ((fitted - centroid).T @ (fitted - centroid)).tolist()
+        angle = atan2(2 * sxy, sxx - syy) / 2
+        normal = np.array((-np.sin(angle), np.cos(angle)))
+        offset = centroid @ normal
+        within = np.flatnonzero(np.abs(points @ normal - offset) <= tolerance)
+        if np.array_equal(within, inliers):
+            break
+        inliers = within
+    if len(inliers) < min_points:
+        return None
+    return normal, offset, inliers
+
+
+def _to_float_line(normal, offset: float, inliers, center, tolerance: float) -> Tuple[float, float]:
+    cos, sin = normal.tolist()
+    # The fitted line is parallel with y-axis within tolerance when turning it upright moves no inlier by more than
+    # tolerance, i.e. |sin| times the extent of the inliers along the line.
+    along = inliers @ np.array((-sin, cos))
+    if abs(sin) * (along.max() - along.min()) <= tolerance:
+        return inf, float(inliers[:, 0].mean() + center[0])
+    # x*cos + y*sin = offset around the center
+    slope = -cos / sin + 0.0  # No -0.0
+    return slope, float(offset / sin + center[1] - slope * center[0])
@@ -0,0 +1,113 @@
+"""Incrementally maintained lines of 3 or more collinear points.
+`CollinearIndex` keeps the distinct points and the lines of 3 or more of them with their number of points. The lines
+through a changed point and their numbers of points follow from its partners in O(n), so adding or removing a point
+costs O(n) time and no table of every two-point line, instead of a new O(n^2) `get_lines` call. Lines use the exact
+keys of `collinear.line_keys`.
+"""
+
+
+from typing import Any, Dict, Iterable, List, Tuple  # Optional type deceleration.
+
+from collinear.line_keys import Key, line_key, to_fixed, to_float_line
+
+
+class CollinearIndex:
+    """Points with multiplicity and the lines of 3 or more distinct collinear points among them.
+    Duplicate points are counted, but like in `get_lines` they do not add support to a line.
+    """
+
+    def __init__(self, xy_list: Iterable[Tuple[Any, Any]] = ()):
+        self._places = 0  # Decimal places of the integer grid, grid x == x * 10 ** places
+        self._multiplicity: Dict[Tuple[int, int], int] = {}
+        self._collinear: Dict[Key, int] = {}  # Distinct points of the lines with 3 or more, in the order they appeared
+        for xy in xy_list:
+            self.add_point(xy)
+
+    def __len__(self) -> int:
+        return sum(self._multiplicity.values())
+
+    def __contains__(self, xy) -> bool:
+        try:
+            return self._to_grid(xy, rescale=False) in self._multiplicity
+        except (TypeError, ValueError):
+            return False
+
+    def add_point(self, xy: Tuple[Any, Any]) -> List[Tuple[float, float]]:
+        """Add a point in O(n) and return the lines that reached 3 points because of it."""
+        point = self._to_grid(xy, rescale=True)
+        if point in self._multiplicity:
+            self._multiplicity[point] += 1
+            return []
+
+        appeared = []
+        for line, partners in self._partners(point).items():
+            if partners == 2:
+                appeared.append(to_float_line(line, 10 ** self._places))
+            if partners >= 2:
+                self._collinear[line] = partners + 1
+
+        self._multiplicity[point] = 1
+        return appeared
+
+    def remove_point(self, xy: Tuple[Any, Any]) -> List[Tuple[float, float]]:
+        """Remove one occurrence of a point in O(n) and return the lines that dropped below 3 points because of it."""
+        try:
+            point = self._to_grid(xy, rescale=False)
+        except ValueError:
+            point = None
+        if point not in self._multiplicity:
+            raise ValueError(f"Point {xy!r} is not in the index.")
+
+        self._multiplicity[point] -= 1
+        if self._multiplicity[point]:
+            return []
+        del self._multiplicity[point]
+
+        disappeared = []
+        for line, partners in self._partners(point).items():
+            if partners == 2:
+                del self._collinear[line]
+                disappeared.append(to_float_line(line, 10 ** self._places))
+            elif partners > 2:
+                self._collinear[line] = partners
+        return disappeared
+
+    def lines(self) -> List[Tuple[float, float]]:
+        """Current lines of 3 or more collinear points, without recomputation."""
+        scale = 10 ** self._places
+        return [to_float_line(line, scale) for line in self._collinear]
+
+    def line_counts(self) -> List[Tuple[Tuple[float, float], int]]:
+        """Current lines, in the order of `lines`, with the number of distinct points on each, not recomputed."""
+        scale = 10 ** self._places
+        return [(to_float_line(line, scale), count) for line, count in self._collinear.items()]
+
+    def _partners(self, point: Tuple[int, int]) -> Dict[Key, int]:
+        """Number of other distinct points on each line through point."""
+        x0, y0 = point
+        partners = {}
+        for x1, y1 in self._multiplicity:
+            if (x1, y1) == point:
+                continue
+            line = line_key(x0, y0, x1, y1)
+            partners[line] = partners.get(line, 0) + 1
+        return partners
+
+    def _to_grid(self, xy: Tuple[Any, Any], rescale: bool) -> Tuple[int, int]:
+        x, y = xy
+        (x, x_places), (y, y_places) = to_fixed(x), to_fixed(y)
+
+        places = max(x_places, y_places)
+        if places > self._places:
+            if not rescale:
+                # Finer than the grid, so it can not be any of the points already in the index.
+                raise ValueError(f"Point {xy!r} is not on the grid of the index.")
+            self._rescale(places)
+        return x * 10 ** (self._places - x_places), y * 10 ** (self._places - y_places)
+
+    def _rescale(self, places: int) -> None:
+        # Directions do not change on a finer grid, only the intercept terms c of dy*x - dx*y = c are scaled.
+        factor = 10 ** (places - self._places)
+        self._places = places
+        self._multiplicity = {(x * factor, y * factor): m for (x, y), m in self._multiplicity.items()}
+        self._collinear = {(dy, dx, c * factor): count for (dy, dx, c), count in self._collinear.items()}
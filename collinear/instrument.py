@@ -0,0 +1,106 @@
+"""Optional per-phase instrumentation of `get_lines` calls.
+Instrumentation is off until a hook is added: `get_lines` only checks whether `hooks` is empty and otherwise runs
+exactly the uninstrumented code. With hooks, every call reports a `CallStats` to each of them, e.g. for metrics.
+
+    with collect() as calls:
+        get_lines(points)
+    calls[0].seconds  # {'validate': ..., 'grid': ..., 'scan': ..., 'output': ...}
+"""
+
+
+import tracemalloc  # Peak memory of instrumented calls.
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple  # Optional type deceleration.
+
+# Phases of a `get_lines` call in order. Validating coordinates, deduplication and decimal conversion are one single
+# pass over the input, the grid phase.
+PHASES = ("validate", "grid", "scan", "output")
+
+
+class CallStats(NamedTuple):
+    """What one `get_lines` call did and where its time went."""
+    seconds: Dict[str, float]  # Wall time by phase
+    points: int  # Input points, duplicates included
+    distinct_points: int
+    pairs: int  # Pairs of distinct points
+    table_size: int  # Distinct two-point lines of the pairs engine, None for the other engines and without pairs
+    lines: int  # Lines returned
+    peak_bytes: int  # Peak traced memory of the call, None unless memory is traced
+    engine: str  # "tolerance" for tolerance mode
+    backend: str
+
+
+hooks: List[Callable[[CallStats], None]] = []
+_memory_tracers = 0
+
+
+def add_hook(hook: Callable[[CallStats], None], trace_memory: bool = False) -> None:
+    """Call hook with the `CallStats` of every following `get_lines` call.
+    trace_memory reports peak memory with tracemalloc, which slows calls down noticeably.
+    """
+    global _memory_tracers
+    hooks.append(hook)
+    if trace_memory:
+        _memory_tracers += 1
+
+
+def remove_hook(hook: Callable[[CallStats], None], trace_memory: bool = False) -> None:
+    """Remove a hook added with the same arguments."""
+    global _memory_tracers
+    hooks.remove(hook)
+    if trace_memory:
+        _memory_tracers -= 1
+
+
+@contextmanager
+def collect(trace_memory: bool = False) -> Iterator[List[CallStats]]:
+    """List of the `CallStats` of the calls within the context."""
+    calls = []
+    add_hook(calls.append, trace_memory)
+    try:
+        yield calls
+    finally:
+        remove_hook(calls.append, trace_memory)
+
+
+class PhaseTimer:
+    """Wall time of consecutive phases of one call, and its peak memory while any hook traces memory.
+    When tracemalloc already traces, its peak is reset for the call, which needs Python 3.9. On older versions the peak
+    of such a call is not reported.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self._started_tracing = False
+        self._peak_reset = False
+        if _memory_tracers:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+                self._peak_reset = True
+        self._start = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """End the phase that started with the previous lap."""
+        now = perf_counter()
+        self.seconds[phase] = now - self._start
+        self._start = now
+
+    def report(self, **counts) -> None:
+        """Call every hook with the phase timings and the counts of `CallStats`."""
+        peak_bytes = None
+        if self._started_tracing or self._peak_reset:
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+
+        stats = CallStats(seconds=self.seconds, peak_bytes=peak_bytes, **counts)
+        for hook in list(hooks):
+            hook(stats)
+
+    def close(self) -> None:
+        """Stop memory tracing started for this call, also when the call raised."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
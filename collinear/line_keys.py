@@ -0,0 +1,97 @@
+"""Exact integer representation of input points and of the lines between them.
+Points are scaled to a shared fixed-point integer grid once, so every line can be keyed by integers only.
+A line key is a tuple of three ints (dy, dx, c) describing the line dy*x - dx*y = c on the grid, where (dy, dx) is
+the direction reduced by gcd with dx > 0, or (1, 0) for lines parallel with y-axis.
+"""
+
+
+from decimal import Decimal, InvalidOperation  # Exact parsing of non-integer coordinates.
+from math import gcd, inf  # Reduce directions and represent vertical lines slopes.
+from numbers import Number  # Accept any numeric coordinate type.
+from typing import Any, Iterable, List, Tuple  # Optional type deceleration.
+
+Key = Tuple[int, int, int]
+
+
+def to_fixed(value: Any) -> Tuple[int, int]:
+    """Split a coordinate into an integer mantissa and the number of decimal places it needs."""
+    if isinstance(value, int):
+        return value, 0
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value), 0
+
+    if not isinstance(value, Number) or isinstance(value, complex):
+        raise TypeError(f"Expected numeric coordinates. {type(value)} received.")
+
+    # str() keeps the shortest decimal representation of floats, e.g. 0.1 and not 0.1000000000000000055...
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Expected decimal coordinates. {value!r} received.") from None
+    if not number.is_finite():
+        raise ValueError(f"Expected finite coordinates. {value!r} received.")
+
+    sign, digits, exponent = number.as_tuple()
+    mantissa = int("".join(map(str, digits))) * (-1 if sign else 1)
+    if exponent >= 0:
+        return mantissa * 10 ** exponent, 0
+    return mantissa, -exponent
+
+
+def to_grid(xy_list: Iterable[Tuple[Any, Any]]) -> Tuple[List[Tuple[int, int]], int]:
+    """Scale (x, y) points to a shared integer grid.
+    Returns the grid points, in input order, and the scale that maps them back, i.e. x == grid_x / scale.
+    """
+    points, places = to_grid_places(xy_list)
+    return points, 10 ** places
+
+
+def to_grid_places(xy_list: Iterable[Tuple[Any, Any]]) -> Tuple[List[Tuple[int, int]], int]:
+    """`to_grid` with the decimal places of the grid instead of its scale, i.e. scale == 10 ** places."""
+    points = []
+    fractional = {}  # Decimal places of the points that need any, by index
+    for x, y in xy_list:
+        if x.__class__ is int and y.__class__ is int:
+            points.append((x, y))
+            continue
+        (x, x_places), (y, y_places) = to_fixed(x), to_fixed(y)
+        if x_places or y_places:
+            fractional[len(points)] = (x_places, y_places)
+        points.append((x, y))
+
+    if not fractional:
+        return points, 0
+
+    places = max(max(point_places) for point_places in fractional.values())
+    for i, (x, y) in enumerate(points):
+        x_places, y_places = fractional.get(i, (0, 0))
+        points[i] = (x * 10 ** (places - x_places), y * 10 ** (places - y_places))
+    return points, places
+
+
+def direction(dx: int, dy: int) -> Tuple[int, int]:
+    """Canonical (dy, dx) direction of a non-zero vector, reduced by gcd with dx > 0, or (1, 0) for the y-axis."""
+    divisor = gcd(dx, dy)
+    dx //= divisor
+    dy //= divisor
+    if dx < 0 or (not dx and dy < 0):
+        return -dy, -dx
+    return dy, dx
+
+
+def line_key(x0: int, y0: int, x1: int, y1: int) -> Key:
+    """Canonical key of the line through two distinct grid points."""
+    dy, dx = direction(x1 - x0, y1 - y0)
+    return dy, dx, dy * x0 - dx * y0
+
+
+def to_float_line(key: Key, scale: int = 1) -> Tuple[float, float]:
+    """Convert a line key to the public (slope, y-intercept) tuple of floats.
+    Lines parallel with y-axis are represented as (inf, x).
+    """
+    dy, dx, c = key
+    if not dx:
+        return inf, c / scale
+    # int / int true division is correctly rounded, so no Decimal or Fraction is needed here.
+    return dy / dx, -c / (dx * scale)
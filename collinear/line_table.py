@@ -0,0 +1,48 @@
+"""Compact struct-of-arrays table of distinct lines.
+Each exact line key maps to a row index, and the rows are stored in parallel arrays of slope, intercept and the number
+of point pairs on the line, instead of one Python object per line.
+"""
+
+
+from array import array  # Packed columns of the table.
+from typing import Any, Dict  # Optional type deceleration.
+
+from collinear.line_keys import Key, to_float_line
+
+
+class LineTable:
+    """Distinct lines by exact key, with (slope, y-intercept) and number of point pairs in row-aligned arrays."""
+    __slots__ = ("scale", "rows", "slopes", "intercepts", "pairs", "_bits")
+
+    def __init__(self, scale: int = 1, coordinate_bits: int = None):
+        """With coordinate_bits, i.e. every |grid coordinate| < 2 ** coordinate_bits, keys are packed into one int."""
+        self.scale = scale
+        self.rows: Dict[Any, int] = {}
+        self.slopes = array("d")
+        self.intercepts = array("d")
+        self.pairs = array("Q")
+        self._bits = coordinate_bits
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def add(self, key: Key) -> int:
+        """Count one more pair of points on the line and return its row."""
+        packed = key if self._bits is None else self._pack(key)
+        row = self.rows.get(packed)
+        if row is None:
+            row = self.rows[packed] = len(self.pairs)
+            slope, intercept = to_float_line(key, self.scale)
+            self.slopes.append(slope)
+            self.intercepts.append(intercept)
+            self.pairs.append(1)
+        else:
+            self.pairs[row] += 1
+        return row
+
+    def _pack(self, key: Key) -> int:
+        # One int of about 4 * coordinate_bits is several times smaller than a tuple of three ints.
+        # |dx|, |dy| < 2 ** (bits + 1) and |c| < 2 ** (2 * bits + 2), so the offset fields never overlap.
+        dy, dx, c = key
+        bits = self._bits
+        return (((dy + (1 << (bits + 1))) << (bits + 1) | dx) << (2 * bits + 3)) | (c + (1 << (2 * bits + 2)))
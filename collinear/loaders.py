@@ -0,0 +1,126 @@
+"""Bulk loaders of (x, y) points from CSV, raw binary and `.npy` files.
+CSV files are streamed in chunks of parsed rows. Binary files are memory-mapped and read through `memoryview` columns
+without copying, so no intermediate list of input tuples is built before the points are scaled to the integer grid.
+"""
+
+
+import ast
+import csv
+import mmap
+import struct
+import sys
+from decimal import Decimal, InvalidOperation  # Exact parsing of non-integer CSV values.
+from itertools import chain
+from typing import Any, Iterator, List, Tuple  # Optional type deceleration.
+
+CSV_CHUNK_ROWS = 65536
+
+# Raw binary files hold little-endian x0, y0, x1, y1, ... values of one of these types.
+BINARY_FORMATS = {"int64": "q", "float64": "d"}
+
+# Supported `.npy` dtypes and their `memoryview` formats.
+NPY_FORMATS = {"<i8": "q", "<f8": "d", "<i4": "i", "<f4": "f"}
+NPY_MAGIC = b"\x93NUMPY"
+
+
+def parse_number(text: str) -> Any:
+    """An int, or a Decimal to keep decimal values exact."""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        number = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Expected a number. {text!r} received.") from None
+    if not number.is_finite():
+        raise ValueError(f"Expected finite coordinates. {text!r} received.")
+    return number
+
+
+def iter_csv_chunks(path: str, chunk_rows: int = CSV_CHUNK_ROWS, delimiter: str = ",") -> Iterator[List[Tuple]]:
+    """Stream (x, y) rows of a CSV file in chunks of up to chunk_rows points.
+    The first two columns are used, a first row that is not numeric is skipped as header.
+    """
+    with open(path, newline="") as csv_file:
+        chunk = []
+        for row_number, row in enumerate(csv.reader(csv_file, delimiter=delimiter)):
+            if not row:
+                continue
+            try:
+                x, y = row[0], row[1]
+                chunk.append((parse_number(x.strip()), parse_number(y.strip())))
+            except (IndexError, ValueError):
+                if row_number == 0:
+                    continue  # Header
+                raise ValueError(f"Expected x{delimiter}y numbers in line {row_number + 1}. {row!r} received.")
+            if len(chunk) == chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def iter_csv_points(path: str, chunk_rows: int = CSV_CHUNK_ROWS, delimiter: str = ",") -> Iterator[Tuple]:
+    """Points of a CSV file, see `iter_csv_chunks`."""
+    return chain.from_iterable(iter_csv_chunks(path, chunk_rows, delimiter))
+
+
+def map_binary(path: str, dtype: str = "int64", offset: int = 0) -> Tuple[memoryview, memoryview]:
+    """Memory-map a raw binary file of interleaved little-endian x, y values and return its (xs, ys) columns.
+    The columns are strided views into the mapped file, nothing is copied.
+    """
+    if dtype not in BINARY_FORMATS:
+        raise ValueError(f"Expected dtype is one of {tuple(BINARY_FORMATS)}. {dtype!r} received.")
+    return _map_columns(path, BINARY_FORMATS[dtype], offset)
+
+
+def map_npy(path: str) -> Tuple[memoryview, memoryview]:
+    """Memory-map a `.npy` file of a C-ordered (n, 2) array and return its (xs, ys) columns, NumPy is not needed."""
+    with open(path, "rb") as npy_file:
+        magic = npy_file.read(8)
+        if magic[:6] != NPY_MAGIC:
+            raise ValueError(f"Expected a .npy file. {path!r} received.")
+        header_size_bytes = 2 if magic[6] == 1 else 4
+        header_size = int.from_bytes(npy_file.read(header_size_bytes), "little")
+        header = ast.literal_eval(npy_file.read(header_size).decode("latin1"))
+
+    shape = header["shape"]
+    if header["descr"] not in NPY_FORMATS or header["fortran_order"] or len(shape) != 2 or shape[1] != 2:
+        raise ValueError(f"Expected a C-ordered (n, 2) array of {tuple(NPY_FORMATS)}. {header!r} received.")
+    return _map_columns(path, NPY_FORMATS[header["descr"]], 8 + header_size_bytes + header_size)
+
+
+def load_points(path: str, file_format: str = None, dtype: str = "int64") -> Any:
+    """Points of a file by format, one of csv, npy or binary, by default from the file extension.
+    Memory-mapped npy and binary files are returned as their (xs, ys) columns, which `get_lines` and
+    `collinear.points.distinct_grid_points` take directly, CSV files as an iterator of streamed (x, y) points.
+    """
+    if file_format is None:
+        file_format = "npy" if path.endswith(".npy") else "csv" if path.endswith((".csv", ".txt")) else "binary"
+    if file_format == "csv":
+        return iter_csv_points(path)
+    if file_format == "npy":
+        return map_npy(path)
+    if file_format == "binary":
+        return map_binary(path, dtype)
+    raise ValueError(f"Expected file format is one of ('csv', 'npy', 'binary'). {file_format!r} received.")
+
+
+def _map_columns(path: str, item_format: str, offset: int) -> Tuple[memoryview, memoryview]:
+    if sys.byteorder != "little":  # pragma: no cover
+        raise RuntimeError("Memory-mapped little-endian files need a little-endian machine.")
+
+    with open(path, "rb") as binary_file:
+        size = binary_file.seek(0, 2)
+        if size == offset:
+            return memoryview(b"").cast(item_format), memoryview(b"").cast(item_format)
+        # The mapping stays open as long as a view of it is referenced.
+        mapped = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    values = memoryview(mapped)[offset:]
+    item_size = struct.calcsize(item_format)
+    if len(values) % (2 * item_size):
+        raise ValueError(f"Expected whole (x, y) pairs of {item_size} bytes values in {path!r}.")
+    values = values.cast(item_format)
+    return values[0::2], values[1::2]
@@ -0,0 +1,109 @@
+"""Queryable lines of collinear points, with the lines through each point and the lines by key.
+`get_line_lookup` keeps the members of every line that the anchor engine sees while detecting it, so the point to lines
+index is built in the same pass. Lines are looked up by their (slope, y-intercept), or (inf, x) for lines parallel with
+y-axis, and by direction for points that are not among the input points.
+"""
+
+
+from typing import Any, Dict, List, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import validate_min_points, validate_points
+from collinear.line_keys import Key, to_fixed, to_float_line
+from collinear.points import distinct_grid_places
+from collinear.scan import anchor_groups
+
+
+class LineLookup:
+    """Detected lines, in `get_lines(engine="anchor")` order, with O(1) expected lookups by point and by line."""
+
+    def __init__(self, places: int = 0):
+        self.places = places  # Decimal places of the grid of the lines
+        self.scale = 10 ** places
+        self.lines: List[Tuple[float, float]] = []
+        self._support: List[int] = []  # Distinct points on each line
+        self._rows: Dict[Key, int] = {}  # Row of each line by its exact key
+        self._float_rows: Dict[Tuple[float, float], List[int]] = {}  # Rows of the lines with each float representation
+        self._by_point: Dict[Tuple[int, int], List[int]] = {}  # Rows of the lines through each input point
+        self._by_direction: Dict[Tuple[int, int], Dict[int, int]] = {}  # Rows of lines by direction and c
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __contains__(self, line: Tuple[float, float]) -> bool:
+        return line in self._float_rows
+
+    def add(self, key: Key, points: List[Tuple[int, int]]) -> None:
+        """Add a line by its exact key and its grid points."""
+        row = len(self.lines)
+        line = to_float_line(key, self.scale)
+        self.lines.append(line)
+        self._support.append(len(points))
+        self._rows[key] = row
+        self._float_rows.setdefault(line, []).append(row)
+        dy, dx, c = key
+        self._by_direction.setdefault((dy, dx), {})[c] = row
+        for point in points:
+            self._by_point.setdefault(point, []).append(row)
+
+    def support(self, line: Tuple[float, float]) -> int:
+        """Number of distinct input points on a detected line, 0 for other lines. Of different exact lines that round
+        to the same floats, the largest number.
+        """
+        return max((self._support[row] for row in self._float_rows.get(line, ())), default=0)
+
+    def key_support(self, key: Key) -> int:
+        """Number of distinct input points on a detected line by its exact key on the grid, 0 for other lines."""
+        row = self._rows.get(key)
+        return 0 if row is None else self._support[row]
+
+    def lines_through(self, xy: Tuple[Any, Any]) -> List[Tuple[float, float]]:
+        """Detected lines that have the input point xy among their points, in O(1) expected time."""
+        point = self._to_grid(xy)
+        if point is None:
+            return []
+        x, y, factor = point
+        if factor != 1:
+            return []  # Finer than the grid, so not an input point.
+        return [self.lines[row] for row in self._by_point.get((x, y), ())]
+
+    def lines_containing(self, xy: Tuple[Any, Any]) -> List[Tuple[float, float]]:
+        """Detected lines that pass through any point xy exactly, in O(distinct directions) expected time."""
+        point = self._to_grid(xy)
+        if point is None:
+            return []
+        x, y, factor = point
+        if factor == 1 and (x, y) in self._by_point:
+            return [self.lines[row] for row in self._by_point[(x, y)]]
+
+        rows = []
+        for (dy, dx), intercepts in self._by_direction.items():
+            # On a finer grid of the point, c of each line is scaled by factor as well.
+            c, remainder = divmod(dy * x - dx * y, factor)
+            if not remainder and c in intercepts:
+                rows.append(intercepts[c])
+        return [self.lines[row] for row in sorted(rows)]
+
+    def _to_grid(self, xy: Tuple[Any, Any]):
+        """Point on the grid of the lines, or a finer one, as (x, y, factor of the finer grid), None if not numeric."""
+        try:
+            x, y = xy
+            (x, x_places), (y, y_places) = to_fixed(x), to_fixed(y)
+        except (TypeError, ValueError):
+            return None
+        places = max(x_places, y_places, self.places)
+        return x * 10 ** (places - x_places), y * 10 ** (places - y_places), 10 ** (places - self.places)
+
+
+def get_line_lookup(xy_list: List[Tuple[Any, Any]] = None, min_points: int = 3) -> LineLookup:
+    """Return the lines with min_points or more of the input points as a `LineLookup`, raises like `get_lines`."""
+
+    validate_points(xy_list)
+
+    validate_min_points(min_points)
+
+    xy_list, places = distinct_grid_places(xy_list)
+
+    lookup = LineLookup(places)
+    for key, members in anchor_groups(xy_list, min_points):
+        lookup.add(key, [xy_list[member] for member in members])
+    return lookup
@@ -0,0 +1,88 @@
+"""Run the anchor-local engine of `collinear.scan` on a pool of processes.
+Anchors are independent, so anchor ranges are scanned in parallel and the partial results merged in anchor order.
+The points are shared with each worker once, through shared memory when every coordinate fits an int64.
+"""
+
+
+from array import array  # Pack int64 coordinates for shared memory.
+from concurrent.futures import ProcessPoolExecutor  # Pool of worker processes.
+from multiprocessing import shared_memory  # Share the points with workers without pickling them per task.
+from typing import List, Tuple  # Optional type deceleration.
+
+from collinear import scan_numpy
+from collinear.line_keys import Key
+from collinear.scan import anchor_scan
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# Ranges per worker, more ranges than workers smooth out uneven line counts between ranges.
+RANGES_PER_WORKER = 4
+
+# Points, backend and threshold of the current worker process, set once by `_init_worker`.
+_xy_list: List[Tuple[int, int]] = []
+_backend = "python"
+_min_points = 3
+
+
+def anchor_ranges(num_points: int, num_ranges: int, min_points: int = 3) -> List[Tuple[int, int]]:
+    """Split the anchors into consecutive (start, stop) ranges with about the same number of pairs each.
+    Anchor i is paired with the n - 1 - i points after it, so early ranges are shorter than late ones.
+    """
+    num_anchors = max(num_points - min_points + 1, 0)
+    total = num_anchors * (2 * num_points - num_anchors - 1) // 2
+    ranges = []
+    start = 0
+    done = 0
+    for i in range(num_anchors):
+        done += num_points - 1 - i
+        if done * num_ranges >= total * (len(ranges) + 1) or i == num_anchors - 1:
+            ranges.append((start, i + 1))
+            start = i + 1
+    return ranges
+
+
+def _init_worker(points, num_points: int, backend: str, min_points: int) -> None:
+    global _xy_list, _backend, _min_points
+    if isinstance(points, str):
+        shared = shared_memory.SharedMemory(name=points)
+        flat = shared.buf[:num_points * 2 * 8].cast("q").tolist()
+        shared.close()
+        points = list(zip(flat[0::2], flat[1::2]))
+    _xy_list = points
+    _backend = backend
+    _min_points = min_points
+
+
+def _scan_range(anchors: Tuple[int, int]) -> List[Key]:
+    start, stop = anchors
+    if _backend == "numpy" and scan_numpy.available(_xy_list):
+        return list(scan_numpy.numpy_scan(_xy_list, start, stop, _min_points))
+    return list(anchor_scan(_xy_list, start, stop, _min_points))
+
+
+def parallel_scan(
+    xy_list: List[Tuple[int, int]], workers: int, backend: str = "python", min_points: int = 3
+) -> List[Key]:
+    """Same lines in the same order as `collinear.scan.anchor_scan`, scanned by `workers` processes."""
+    ranges = anchor_ranges(len(xy_list), workers * RANGES_PER_WORKER, min_points)
+
+    shared = None
+    points = xy_list
+    if all(INT64_MIN <= x <= INT64_MAX and INT64_MIN <= y <= INT64_MAX for x, y in xy_list):
+        packed = array("q", (v for xy in xy_list for v in xy))
+        shared = shared_memory.SharedMemory(create=True, size=max(len(packed) * 8, 1))
+        shared.buf[:len(packed) * 8] = packed.tobytes()
+        points = shared.name
+
+    try:
+        initargs = (points, len(xy_list), backend, min_points)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+            partials = list(pool.map(_scan_range, ranges))
+    finally:
+        if shared is not None:
+            shared.close()
+            shared.unlink()
+
+    # A line is found first in the range of its lowest index point, later ranges may report it again with fewer points.
+    return list(dict.fromkeys(line for partial in partials for line in partial))
@@ -0,0 +1,110 @@
+"""Input points in any supported layout, scaled to the integer grid of `collinear.line_keys` in a single pass.
+Supported inputs are sequences of (x, y) points, a pair of (xs, ys) columns as `array.array` or 1-D `memoryview`,
+(n, 2) `memoryview`s and NumPy (n, 2) arrays. Columnar and array inputs are deduplicated on their packed binary
+representation with NumPy when it is installed, without building a Python tuple per input point first.
+"""
+
+
+from array import array  # Columnar input.
+from collections.abc import Sequence  # Row input.
+from typing import Any, List, Tuple  # Optional type deceleration.
+
+from collinear.line_keys import to_grid_places
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Integer coordinates of packed inputs within this range are exact in int64 and in float64.
+INT64_SAFE = 2 ** 62
+
+EXPECTED_TYPES = "a sequence of (x, y) points, a pair of (xs, ys) array columns, an (n, 2) memoryview or array"
+
+
+def is_columns(xy_list: Any) -> bool:
+    """Whether the input is a pair of (xs, ys) columns rather than a sequence of points."""
+    return (
+        isinstance(xy_list, tuple)
+        and len(xy_list) == 2
+        and all(isinstance(column, (array, memoryview)) for column in xy_list)
+    )
+
+
+def is_array(xy_list: Any) -> bool:
+    """Whether the input is an (n, 2) memoryview or NumPy-like array."""
+    if isinstance(xy_list, memoryview):
+        return True
+    return hasattr(xy_list, "shape") and hasattr(xy_list, "dtype") and hasattr(xy_list, "tolist")
+
+
+def validate_type(xy_list: Any) -> None:
+    """Raise TypeError for input of an unsupported type or layout."""
+    if is_columns(xy_list):
+        xs, ys = xy_list
+        if len(xs) != len(ys) or (isinstance(xs, memoryview) and xs.ndim != 1):
+            raise ValueError("Expected (xs, ys) columns are 1-D and of the same length.")
+        return
+    if is_array(xy_list):
+        if len(xy_list.shape) != 2 or xy_list.shape[1] != 2:
+            raise ValueError(f"Expected array shape is (n, 2). {tuple(xy_list.shape)} received.")
+        return
+    if not isinstance(xy_list, Sequence) or isinstance(xy_list, (str, bytes, bytearray)):
+        raise TypeError(f"Expected input type is {EXPECTED_TYPES}. {type(xy_list)} received.")
+
+
+def grid_points(xy_list: Any) -> Tuple[List[Tuple[int, int]], int]:
+    """Grid points in input order and their scale, see `collinear.line_keys.to_grid`."""
+    points, places = _grid_places(xy_list)
+    return points, 10 ** places
+
+
+def distinct_grid_points(xy_list: Any) -> Tuple[List[Tuple[int, int]], int]:
+    """Distinct grid points in order of first occurrence and their scale."""
+    points, places = distinct_grid_places(xy_list)
+    return points, 10 ** places
+
+
+def distinct_grid_places(xy_list: Any) -> Tuple[List[Tuple[int, int]], int]:
+    """Distinct grid points in order of first occurrence and the decimal places of the grid."""
+    packed = _packed_integers(xy_list)
+    if packed is not None:
+        # Each (x, y) row is one opaque 16 bytes value, so np.unique sorts and compares rows without Python objects.
+        rows = packed.view(np.dtype((np.void, packed.dtype.itemsize * 2))).ravel()
+        _, first = np.unique(rows, return_index=True)
+        return list(map(tuple, packed[np.sort(first)].tolist())), 0
+
+    points, places = _grid_places(xy_list)
+    return list(dict.fromkeys(points)), places
+
+
+def _grid_places(xy_list: Any) -> Tuple[List[Tuple[int, int]], int]:
+    if is_columns(xy_list):
+        return to_grid_places(zip(*xy_list))
+    if is_array(xy_list):
+        return to_grid_places(xy_list.tolist())
+    return to_grid_places(xy_list)
+
+
+def _packed_integers(xy_list: Any):
+    """A C-contiguous int64 (n, 2) NumPy array of the input, when it has only integral values in int64 range."""
+    if np is None or not (is_columns(xy_list) or is_array(xy_list)):
+        return None
+
+    if is_columns(xy_list):
+        values = np.stack([np.asarray(column) for column in xy_list], axis=1)
+    else:
+        values = np.asarray(xy_list)
+
+    if values.dtype.kind in "iu":
+        if values.size and (values.max() >= INT64_SAFE or values.min() <= -INT64_SAFE):
+            return None
+    elif values.dtype.kind == "f":
+        # Integral floats, e.g. of binary files, are exact on the grid with scale 1.
+        if not np.isfinite(values).all() or not (values == np.trunc(values)).all():
+            return None
+        if values.size and np.abs(values).max() >= INT64_SAFE:
+            return None
+    else:
+        return None
+    return np.ascontiguousarray(values, dtype=np.int64).reshape(-1, 2)
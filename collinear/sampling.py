@@ -0,0 +1,117 @@
+"""Randomized (RANSAC-style) detection of lines that hold a large fraction of the points.
+Exact detection is O(n^2) pairs, which is not feasible for millions of points. Instead random pairs of points propose
+candidate lines, and every candidate is verified exactly against the points, so there are no false positives. A line
+holding at least `min_fraction` of the points is found with probability `confidence`.
+"""
+
+
+from math import ceil, log  # Number of samples for a confidence target.
+from random import Random  # Seedable source of sampled pairs.
+from typing import Any, Dict, List, NamedTuple, Set, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import validate_points
+from collinear.line_keys import Key, line_key, to_float_line
+from collinear.points import distinct_grid_points
+
+
+class SampleResult(NamedTuple):
+    """Lines found by `sample_lines` and what was sampled to find them."""
+    lines: List[Tuple[Tuple[float, float], int]]  # ((slope, y-intercept), points) in descending points
+    min_points: int  # Threshold derived from min_fraction
+    samples: int  # Pairs of points drawn
+    candidates: int  # Distinct candidate lines verified
+    confidence: float  # Probability of sampling any given line that holds min_fraction of the points
+
+
+def samples_needed(min_fraction: float, confidence: float, num_points: int) -> int:
+    """Number of random pairs that include a pair from a line of min_fraction of the points with given confidence."""
+    hit = _hit_probability(min_fraction, num_points)
+    if hit >= 1:
+        return 1
+    return ceil(log(1 - confidence) / log(1 - hit))
+
+
+def _hit_probability(min_fraction: float, num_points: int) -> float:
+    """Probability that one random pair of distinct points is on a given line of min_fraction of the points."""
+    on_line = max(ceil(min_fraction * num_points), 2)
+    return on_line * (on_line - 1) / (num_points * (num_points - 1))
+
+
+def sample_lines(
+    xy_list: List[Tuple[Any, Any]] = None,
+    min_fraction: float = 0.1,
+    confidence: float = 0.99,
+    max_samples: int = None,
+    seed: Any = None,
+) -> SampleResult:
+    """Find the lines with 3 or more points that hold at least min_fraction of the distinct input points.
+    Up to `samples_needed(...)` pairs are drawn, or max_samples if lower, the returned confidence is the one achieved.
+    """
+
+    validate_points(xy_list)
+
+    if not 0 < min_fraction <= 1:
+        raise ValueError(f"Expected min_fraction is in (0, 1]. {min_fraction!r} received.")
+
+    if not 0 < confidence < 1:
+        raise ValueError(f"Expected confidence is in (0, 1). {confidence!r} received.")
+
+    points, scale = distinct_grid_points(xy_list)
+    num_points = len(points)
+    min_points = max(ceil(min_fraction * num_points), 3)
+    if num_points < min_points:
+        return SampleResult([], min_points, 0, 0, 1.0)
+
+    samples = samples_needed(min_fraction, confidence, num_points)
+    if max_samples is not None:
+        samples = min(samples, max_samples)
+
+    achieved = 1 - (1 - _hit_probability(min_fraction, num_points)) ** samples
+
+    rng = Random(seed)
+    lookup = set(points)
+    bounds = _bounds(points)
+    support: Dict[Key, int] = {}
+    for _ in range(samples):
+        i, j = rng.sample(range(num_points), 2)
+        line = line_key(*points[i], *points[j])
+        if line not in support:
+            support[line] = _verify(line, points, lookup, bounds)
+
+    lines = sorted(
+        ((to_float_line(line, scale), count) for line, count in support.items() if count >= min_points),
+        key=lambda line_count: -line_count[1],
+    )
+    return SampleResult(lines, min_points, samples, len(support), achieved)
+
+
+def _verify(
+    line: Key, points: List[Tuple[int, int]], lookup: Set[Tuple[int, int]], bounds: Tuple[int, int, int, int]
+) -> int:
+    """Exact number of points on a line, by probing the hashed points when the line has few grid points in range."""
+    dy, dx, c = line
+    x_min, x_max, y_min, y_max = bounds
+
+    if not dx:
+        # Lines parallel with y-axis, c is x.
+        if y_max - y_min + 1 > len(points):
+            return sum(1 for x, _ in points if x == c)
+        return sum(1 for y in range(y_min, y_max + 1) if (c, y) in lookup)
+
+    # Integer solutions of dy*x - dx*y = c are x = x0 + t*dx, where x0 solves dy*x0 == c (mod dx) as gcd(dy, dx) == 1.
+    x0 = c * pow(dy, -1, dx) % dx if dx > 1 else 0
+    first = x_min + (x0 - x_min) % dx
+    if first > x_max or (x_max - first) // dx + 1 > len(points):
+        return sum(1 for x, y in points if dy * x - dx * y == c)
+
+    count = 0
+    for x in range(first, x_max + 1, dx):
+        if (x, (dy * x - c) // dx) in lookup:
+            count += 1
+    return count
+
+
+def _bounds(points: List[Tuple[int, int]]) -> Tuple[int, int, int, int]:
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), max(xs), min(ys), max(ys)
@@ -0,0 +1,161 @@
+"""Engines that find the lines with 3 or more collinear points among distinct grid points.
+The engines take a list of distinct (x, y) integer points, see `collinear.line_keys.to_grid`, and produce exact line
+keys (dy, dx, c) in the same order: by the lowest index point of each line, then by the second lowest one.
+"""
+
+
+from heapq import heappush, heappushpop  # Bounded heap of the best lines.
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # Optional type deceleration.
+
+from collinear.line_keys import Key, direction, line_key
+
+ENGINES = ("pairs", "anchor", "external")  # External, see `collinear.external`
+
+
+def pair_scan(xy_list: List[Tuple[int, int]], min_points: int = 3, lines: Dict[Key, int] = None) -> List[Key]:
+    """Global pairs engine, O(n^2) runtime and up to n(n-1)/2 distinct lines in memory.
+    The table of pairs by line is kept in lines, when given, for inspection.
+    """
+
+    # Algorithm:
+    # This is a O(n^2) runtime improved algorithm over the trivial O(n^3). The straight-forward approach is verify
+    # collinear points in each possible combination of 3 points, i.e. brut-forcing, which is O(n^3).
+    # Instead we travers points two times saving all possible lines in between two points in a hashtable/dictionary and
+    # count the pairs of points on each line. {(dy, dx, c): pairs}
+    # During this double travers if a line already exist it indicates there are more than collinear points in our input
+    # for than line. A line of m points is seen by m(m-1)/2 pairs, which filters the lines with fewer than min_points.
+    #
+    # Each line is keyed exactly by integers: the direction (dy, dx) reduced by gcd with dx > 0 (or (1, 0) for lines
+    # parallel with y-axis) and the intercept term c of dy*x - dx*y = c, see `collinear.line_keys.line_key`. No
+    # division happens in the loop.
+    if lines is None:
+        lines = {}
+    for i, (x0, y0) in enumerate(xy_list[:-1]):
+        for x1, y1 in xy_list[i+1:]:
+            line = line_key(x0, y0, x1, y1)
+            lines[line] = lines.get(line, 0) + 1
+
+    # Return all lines with min_points or more collinears
+    min_pairs = min_points * (min_points - 1) // 2
+    return [line for line, pairs in lines.items() if pairs >= min_pairs]
+
+
+def anchor_scan(
+    xy_list: List[Tuple[int, int]], start: int = 0, stop: int = None, min_points: int = 3
+) -> Iterator[Key]:
+    """Anchor-local engine, O(n^2) runtime and O(n + number of output lines) memory.
+    Lines are yielded as soon as they are found, i.e. when their lowest index point is processed as the anchor.
+    Only anchors in range(start, stop) are processed, their partners are still all the points after them.
+    """
+
+    # Algorithm:
+    # Process one anchor point at a time and group only the points after it by the direction from the anchor. Two or
+    # more points in the same direction are collinear with the anchor. The per-anchor table is dropped afterwards, so
+    # there is no global table of every two-point line. A line is first found from its lowest index point and the
+    # later anchors on the same line see it again with fewer points, therefore a set of already reported lines is all
+    # we keep across anchors.
+    # Anchors with fewer than min_points - 1 points after them can not start a line any more and are pruned.
+    last = len(xy_list) - min_points + 1
+    stop = last if stop is None else min(stop, last)
+
+    for line, _ in _anchor_lines(xy_list, range(start, stop), min_points):
+        yield line
+
+
+def top_scan(xy_list: List[Tuple[int, int]], k: int, min_points: int = 3) -> List[Tuple[Key, int]]:
+    """Up to k lines with the most points, and at least min_points each, as (key, points) in descending points.
+    Lines with the same number of points are in the order `anchor_scan` finds them.
+    """
+
+    # Algorithm:
+    # Keep the best k lines found so far in a min-heap. A line is complete when its lowest index point is the anchor,
+    # and anchor i can not start a line of more than n - i points, so once the heap is full the scan stops as soon as
+    # no remaining anchor can beat the weakest line in it. A line found again from a later anchor has fewer points than
+    # the weakest line ever dropped from the heap, so only the lines in the heap need to be checked for duplicates.
+    heap = []  # (points, -order, key), the weakest and latest found line on top
+    in_heap = set()
+    order = 0
+    for i, xy in enumerate(xy_list):
+        needed = max(min_points, heap[0][0] + 1) if len(heap) == k else min_points
+        if len(xy_list) - i < needed:
+            break
+
+        x0, y0 = xy
+        directions, _ = _anchor_directions(xy_list, i)
+        for (dy, dx), partners in directions.items():
+            points = 2 if partners.__class__ is int else len(partners)
+            if points < min_points or (len(heap) == k and points <= heap[0][0]):
+                continue
+            line = (dy, dx, dy * x0 - dx * y0)
+            if line in in_heap:
+                continue
+            order += 1
+            if len(heap) == k:
+                in_heap.discard(heappushpop(heap, (points, -order, line))[2])
+            else:
+                heappush(heap, (points, -order, line))
+            in_heap.add(line)
+
+    return [(line, points) for points, _, line in sorted(heap, reverse=True)]
+
+
+def anchor_groups(xy_list: List[Tuple[int, int]], min_points: int = 3) -> Iterator[Tuple[Key, List[int]]]:
+    """Same lines in the same order as `anchor_scan`, each with the ascending indices of all its points."""
+    return _anchor_lines(xy_list, range(len(xy_list) - min_points + 1), min_points)
+
+
+def first_triple(xy_list: List[Tuple[int, int]]) -> Optional[Tuple[int, int, int]]:
+    """Ascending indices of the first three collinear points the anchor engine sees, None if there are none.
+    The scan stops at the first direction seen twice from an anchor, with O(n) memory.
+    """
+    for i in range(len(xy_list) - 2):
+        directions, repeated = _anchor_directions(xy_list, i, stop_at_repeat=True)
+        if repeated is not None:
+            return tuple(directions[repeated])
+    return None
+
+
+def _anchor_lines(
+    xy_list: List[Tuple[int, int]], anchors: range, min_points: int
+) -> Iterator[Tuple[Key, List[int]]]:
+    """Lines of min_points or more points first found from the anchors, with the ascending indices of their points."""
+    reported = set()
+    for i in anchors:
+        x0, y0 = xy_list[i]
+        directions, _ = _anchor_directions(xy_list, i)
+        for (dy, dx), partners in directions.items():
+            if partners.__class__ is int:
+                if min_points > 2:
+                    continue
+                partners = [i, partners]
+            elif len(partners) < min_points:
+                continue
+            line = (dy, dx, dy * x0 - dx * y0)
+            if line not in reported:
+                reported.add(line)
+                yield line, partners
+
+
+def _anchor_directions(
+    xy_list: List[Tuple[int, int]], i: int, stop_at_repeat: bool = False
+) -> Tuple[Dict[Tuple[int, int], Any], Optional[Tuple[int, int]]]:
+    """Points after anchor i grouped by their direction from it, see `collinear.line_keys.direction`.
+    Each direction has the index of its only point, or the ascending indices of the anchor and all its points.
+    Returns the groups and, when stop_at_repeat, the first direction seen twice, as soon as it is seen.
+    """
+    x0, y0 = xy_list[i]
+    directions = {}
+    for j, (x1, y1) in enumerate(xy_list[i+1:], i + 1):
+        key = direction(x1 - x0, y1 - y0)
+
+        # Most directions have a single point, keep its index and make a list only for the second one.
+        partners = directions.get(key)
+        if partners is None:
+            directions[key] = j
+        elif partners.__class__ is int:
+            directions[key] = [i, partners, j]
+            if stop_at_repeat:
+                return directions, key
+        else:
+            partners.append(j)
+    return directions, None
@@ -0,0 +1,191 @@
+"""NumPy vectorized version of the anchor-local engine in `collinear.scan`.
+All slopes from an anchor to the points after it are computed in one vectorized operation and sorted to find
+repeats, only the few repeated ones are grouped by exact integer directions in Python.
+NumPy is optional, `available()` tells whether this engine can be used.
+"""
+
+
+from typing import Iterator, List, Tuple  # Optional type deceleration.
+
+from collinear.line_keys import Key, line_key
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Float slopes of equal directions are equal only while coordinate differences are exact in float64, i.e. below 2^53.
+FLOAT_EXACT = 2 ** 52
+
+
+def available(xy_list: List[Tuple[int, int]]) -> bool:
+    """Whether NumPy is installed and every grid coordinate fits the vectorized float64 arithmetic."""
+    if np is None:
+        return False
+    return all(-FLOAT_EXACT < x < FLOAT_EXACT and -FLOAT_EXACT < y < FLOAT_EXACT for x, y in xy_list)
+
+
+def numpy_scan(
+    xy_list: List[Tuple[int, int]], start: int = 0, stop: int = None, min_points: int = 3
+) -> Iterator[Key]:
+    """Same lines in the same order as `collinear.scan.anchor_scan`, including its anchors and min_points pruning."""
+
+    # Algorithm:
+    # Points in the same direction from the anchor have exactly the same float slope dy / dx, because each division is
+    # correctly rounded from the same exact ratio. Sorting the slopes of all points after the anchor puts them next to
+    # each other, so most anchors are rejected without any Python level work. Different directions may round to the
+    # same float, therefore the few candidates with a repeated slope are grouped again by exact integer directions.
+    # With min_points of 2 every partner is on a line, so there is nothing to reject and all of them are grouped.
+    points = np.array(xy_list, dtype=np.int64).reshape(-1, 2)
+    xs = points[:, 0]
+    ys = points[:, 1]
+
+    last = len(points) - min_points + 1
+    stop = last if stop is None else min(stop, last)
+
+    reported = set()
+    for i in range(start, stop):
+        if min_points > 2:
+            dx = xs[i+1:] - xs[i]
+            dy = ys[i+1:] - ys[i]
+            flip = (dx < 0) | ((dx == 0) & (dy < 0))
+            np.negative(dx, out=dx, where=flip)
+            np.negative(dy, out=dy, where=flip)
+            with np.errstate(divide="ignore"):
+                slopes = dy / dx  # inf for lines parallel with y-axis
+
+            order = np.argsort(slopes, kind="stable")
+            repeated = slopes[order[1:]] == slopes[order[:-1]]
+            if not repeated.any():
+                continue
+            candidates = np.zeros(len(order), dtype=bool)
+            candidates[1:] |= repeated
+            candidates[:-1] |= repeated
+            partners = np.sort(order[candidates]).tolist()
+        else:
+            partners = range(len(points) - i - 1)  # Every partner makes a line of 2 points
+
+        x0, y0 = xy_list[i]
+        directions = {}
+        for j in partners:
+            x1, y1 = xy_list[i + 1 + j]
+            direction = line_key(x0, y0, x1, y1)[:2]
+            directions[direction] = directions.get(direction, 0) + 1
+
+        for direction, partners in directions.items():
+            if partners < min_points - 1:
+                continue
+            dy, dx = direction
+            line = (dy, dx, dy * x0 - dx * y0)
+            if line not in reported:
+                reported.add(line)
+                yield line
+
+
+# Vectorized pairs of many small point sets are keyed in int64, so |c| of dy*x - dx*y = c must stay below 2^63.
+BATCH_SAFE = 2 ** 30
+
+# Pairs of points processed in one vectorized segment of `batch_pair_scan`.
+SEGMENT_PAIRS = 1 << 21
+
+# Odd 64-bit multiplier mixing the key columns into one hash.
+HASH_MULTIPLIER = -7046029254386353131
+
+
+def batch_available(xy_list: List[Tuple[int, int]]) -> bool:
+    """Whether NumPy is installed and the point set fits the int64 line keys of `batch_pair_scan`."""
+    if np is None:
+        return False
+    return all(-BATCH_SAFE < x < BATCH_SAFE and -BATCH_SAFE < y < BATCH_SAFE for x, y in xy_list)
+
+
+def batch_pair_scan(point_sets: List[List[Tuple[int, int]]], min_points: int = 3) -> List[List[Key]]:
+    """Same lines in the same order as `collinear.scan.pair_scan` of each point set, for many small sets at once.
+    Each set must be `batch_available`. Sets of more than SEGMENT_PAIRS pairs are scanned alone by `numpy_scan`, with
+    memory for one anchor at a time instead of every pair.
+    """
+
+    # Algorithm:
+    # The pairs of many sets are concatenated into one segment and each pair is keyed by (set, dy, dx, c) in int64.
+    # Sorting one int64 hash of the keys puts the pairs of every line of every set next to each other, in place of one
+    # Python loop and one dict per set. Runs of equal hashes are checked against the full keys, the rare runs that mix
+    # different keys are grouped exactly in Python.
+    min_pairs = min_points * (min_points - 1) // 2
+    results = [[] for _ in point_sets]
+    segment = []
+    pairs = 0
+    for set_index, xy_list in enumerate(point_sets):
+        set_pairs = len(xy_list) * (len(xy_list) - 1) // 2
+        if set_pairs > SEGMENT_PAIRS:
+            results[set_index] = list(numpy_scan(xy_list, min_points=min_points))
+            continue
+        segment.append(set_index)
+        pairs += set_pairs
+        if pairs >= SEGMENT_PAIRS:
+            _scan_segment(point_sets, segment, min_pairs, results)
+            segment = []
+            pairs = 0
+    if segment:
+        _scan_segment(point_sets, segment, min_pairs, results)
+    return results
+
+
+def _scan_segment(point_sets, segment: List[int], min_pairs: int, results: List[List[Key]]) -> None:
+    sets = [set_index for set_index in segment if len(point_sets[set_index]) >= 2]
+    if not sets:
+        return
+
+    firsts, seconds, set_ids = [], [], []
+    offset = 0
+    for set_index in sets:
+        size = len(point_sets[set_index])
+        first, second = np.triu_indices(size, 1)
+        firsts.append(first + offset)
+        seconds.append(second + offset)
+        set_ids.append(np.full(len(first), set_index, dtype=np.int64))
+        offset += size
+
+    points = np.array([xy for set_index in sets for xy in point_sets[set_index]], dtype=np.int64)
+    first = np.concatenate(firsts)
+    second = np.concatenate(seconds)
+    x0 = points[first, 0]
+    y0 = points[first, 1]
+    dx = points[second, 0] - x0
+    dy = points[second, 1] - y0
+    divisor = np.gcd(dx, dy)
+    dx //= divisor
+    dy //= divisor
+    flip = (dx < 0) | ((dx == 0) & (dy < 0))
+    np.negative(dx, out=dx, where=flip)
+    np.negative(dy, out=dy, where=flip)
+
+    keys = np.stack((np.concatenate(set_ids), dy, dx, dy * x0 - dx * y0), axis=1)
+    hashes = keys[:, 0].copy()
+    for column in range(1, 4):
+        hashes *= HASH_MULTIPLIER  # Wraps around in int64
+        hashes ^= keys[:, column]
+
+    order = np.argsort(hashes)
+    sorted_hashes = hashes[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_hashes[1:] != sorted_hashes[:-1])))
+    lengths = np.diff(np.append(starts, len(order)))
+    sorted_keys = keys[order]
+    exact = (sorted_keys == np.repeat(sorted_keys[starts], lengths, axis=0)).all(axis=1)
+    exact_runs = np.logical_and.reduceat(exact, starts)
+
+    # Lines by their first pair, which keeps the order of the pure Python engine.
+    lines = {}
+    first_pairs = np.minimum.reduceat(order, starts)
+    found = exact_runs & (lengths >= min_pairs)
+    for first_pair, key in zip(first_pairs[found].tolist(), keys[first_pairs[found]].tolist()):
+        lines[first_pair] = key
+    for start, length in zip(starts[~exact_runs].tolist(), lengths[~exact_runs].tolist()):
+        mixed = {}
+        for pair in sorted(order[start:start + length].tolist()):
+            mixed.setdefault(tuple(keys[pair].tolist()), []).append(pair)
+        for key, pairs in mixed.items():
+            if len(pairs) >= min_pairs:
+                lines[pairs[0]] = list(key)
+
+    for _, (set_index, dy, dx, c) in sorted(lines.items()):
+        results[set_index].append((dy, dx, c))
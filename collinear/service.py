@@ -0,0 +1,319 @@
+"""Local asyncio service of `get_lines` over a Unix socket or TCP, and its client.
+Scans run on a pool of processes, so the event loop keeps serving while they run and concurrent requests run in
+parallel. Parsing, validating and fingerprinting the points of a request runs on a thread, off the event loop as well.
+Requests for the same points, in any order, and min_points share one computation while it is in flight. At most
+max_pending computations run or wait at a time, further requests are rejected with `ServiceBusy` before they are parsed
+or prepared, and every request can have a time budget. A connection stops reading requests while max_pending of its
+requests are in flight.
+
+The protocol is one JSON object per line in both directions, e.g. {"id": 1, "points": [[0, 0], [1, 1], [2, 2]]}
+answered by {"id": 1, "lines": [[1.0, 0.0]]}, or by {"id": 1, "error": "ValueError", "message": "..."}. Slopes of
+lines parallel with y-axis are null, as JSON has no infinity. Busy requests are answered with the id they start with.
+
+    $ python -m collinear.service --socket /tmp/collinear.sock --workers 4
+"""
+
+
+import argparse
+import asyncio
+import itertools
+import json
+import re
+from concurrent.futures import Future, ProcessPoolExecutor  # Scans off the event loop.
+from functools import partial
+from math import inf  # Slopes of lines parallel with y-axis.
+from typing import Any, Dict, List, Optional, Set, Tuple  # Optional type deceleration.
+
+from collinear.cache import fingerprint
+from collinear.get_collinears import find_lines, validate_min_points, validate_points
+from collinear.points import distinct_grid_points
+from collinear.scan import ENGINES
+
+DEFAULT_MAX_PENDING = 64
+
+# Longest request line, i.e. a JSON request of a few million points.
+MAX_REQUEST_BYTES = 256 << 20
+
+# Leading id of a request line, read without parsing the request.
+REQUEST_ID = re.compile(rb'\s*\{\s*"id"\s*:\s*(-?\d+)\s*[,}]')
+
+
+class ServiceBusy(RuntimeError):
+    """The service already runs its maximum number of computations."""
+
+
+# Exceptions re-raised by the client by name, any other error is a RuntimeError.
+ERRORS = {error.__name__: error for error in (ValueError, TypeError, TimeoutError, ServiceBusy)}
+
+
+class LineService:
+    """Coalescing, bounded front of `find_lines` on a process pool."""
+
+    def __init__(
+        self,
+        workers: int = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        timeout: float = None,
+        engine: str = "anchor",
+    ):
+        """timeout is the default time budget of a request in seconds, None waits until the lines are found.
+        A computation keeps running when its requests run out of time, as a running process can not be interrupted.
+        """
+        if not isinstance(max_pending, int) or max_pending < 1:
+            raise ValueError(f"Expected max_pending is a positive int. {max_pending!r} received.")
+        if engine not in ENGINES:
+            raise ValueError(f"Expected engine is one of {ENGINES}. {engine!r} received.")
+
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.engine = engine
+        self.computations = 0
+        self.coalesced = 0
+        self._pool = ProcessPoolExecutor(workers)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._scans: Set[Future] = set()
+
+    @property
+    def busy(self) -> bool:
+        """Whether max_pending computations are in flight, i.e. requests are rejected."""
+        return len(self._pending) >= self.max_pending
+
+    async def get_lines(
+        self, xy_list: List[Tuple[Any, Any]] = None, min_points: int = 3, timeout: float = None
+    ) -> List[Tuple[float, float]]:
+        """`get_lines` of the points, raises `ServiceBusy` when max_pending computations are in flight and
+        TimeoutError when the time budget runs out. Coalesced requests get the lines in the order of the first one.
+        """
+
+        self._check_busy()
+
+        loop = asyncio.get_running_loop()
+        points, scale, key = await loop.run_in_executor(None, _prepare, xy_list, min_points)
+
+        computation = self._pending.get(key)
+        if computation is None:
+            self._check_busy()
+            scan = self._pool.submit(find_lines, points, scale, self.engine, min_points=min_points)
+            self._scans.add(scan)
+            scan.add_done_callback(self._scans.discard)
+            computation = asyncio.wrap_future(scan)
+            self._pending[key] = computation
+            computation.add_done_callback(partial(self._done, key))
+            self.computations += 1
+        else:
+            self.coalesced += 1
+
+        # Shielded, so one request running out of time does not cancel the computation of the others.
+        budget = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(computation), budget)
+        except asyncio.TimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            raise TimeoutError(f"Lines not found within {budget} seconds.") from None
+
+    def close(self) -> None:
+        """Stop the pool, scans that did not start yet are cancelled."""
+        for scan in list(self._scans):
+            scan.cancel()
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self) -> "LineService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _check_busy(self) -> None:
+        if self.busy:
+            raise ServiceBusy(f"Service is busy with {len(self._pending)} computations, retry later.")
+
+    def _done(self, key: str, computation: asyncio.Future) -> None:
+        del self._pending[key]
+        if not computation.cancelled():
+            computation.exception()  # Retrieved, also when every request ran out of time.
+
+
+def _prepare(xy_list: List[Tuple[Any, Any]], min_points: int) -> Tuple[List[Tuple[int, int]], int, str]:
+    """Distinct grid points, their scale and the coalescing key of a request, raises like `get_lines`."""
+
+    validate_points(xy_list)
+
+    validate_min_points(min_points)
+
+    points, scale = distinct_grid_points(xy_list)
+    return points, scale, f"{fingerprint(points, scale)}-{min_points}"
+
+
+async def serve(
+    service: LineService, path: str = None, host: str = "127.0.0.1", port: int = 0
+) -> asyncio.AbstractServer:
+    """Start serving requests on a Unix socket at path, or on TCP host and port otherwise."""
+    handler = partial(_handle_connection, service)
+    if path is not None:
+        return await asyncio.start_unix_server(handler, path, limit=MAX_REQUEST_BYTES)
+    return await asyncio.start_server(handler, host, port, limit=MAX_REQUEST_BYTES)
+
+
+async def _handle_connection(
+    service: LineService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    # Requests of a connection are answered as soon as each one is done, not in order.
+    responses = set()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError as error:  # Longer than MAX_REQUEST_BYTES
+                await _write(writer, {"id": None, "error": "ValueError", "message": str(error)})
+                break
+            if not line:
+                break
+            if len(responses) >= service.max_pending:
+                await asyncio.wait(responses, return_when=asyncio.FIRST_COMPLETED)
+            response = asyncio.create_task(_respond(service, line, writer))
+            responses.add(response)
+            response.add_done_callback(responses.discard)
+        if responses:
+            await asyncio.gather(*responses)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _respond(service: LineService, line: bytes, writer: asyncio.StreamWriter) -> None:
+    request_id = _request_id(line)
+    try:
+        service._check_busy()
+        request = await asyncio.get_running_loop().run_in_executor(None, json.loads, line)
+        request_id = request.get("id")
+        lines = await service.get_lines(request.get("points"), request.get("min_points", 3), request.get("timeout"))
+        lines = [[None if slope == inf else slope, intercept] for slope, intercept in lines]
+        response = {"id": request_id, "lines": lines}
+    except Exception as error:
+        response = {"id": request_id, "error": type(error).__name__, "message": str(error)}
+    await _write(writer, response)
+
+
+def _request_id(line: bytes) -> Optional[int]:
+    match = REQUEST_ID.match(line)
+    return None if match is None else int(match.group(1))
+
+
+async def _write(writer: asyncio.StreamWriter, message: Dict) -> None:
+    writer.write(json.dumps(message, allow_nan=False).encode() + b"\n")
+    await writer.drain()  # Backpressure of slow readers
+
+
+class LineClient:
+    """Client of `serve`. Requests of one client may be in flight concurrently.
+
+        async with await LineClient.connect("/tmp/collinear.sock") as client:
+            lines = await client.get_lines(points)
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._receiving = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, path: str = None, host: str = "127.0.0.1", port: int = None) -> "LineClient":
+        """Connect to a Unix socket at path, or to TCP host and port otherwise."""
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_REQUEST_BYTES)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_REQUEST_BYTES)
+        return cls(reader, writer)
+
+    async def get_lines(
+        self, xy_list: List[Tuple[Any, Any]], min_points: int = 3, timeout: float = None
+    ) -> List[Tuple[float, float]]:
+        """Lines of the points found by the service, exceptions of the service are raised here.
+        Coordinates are sent as JSON numbers, i.e. ints and floats.
+        """
+        request_id = next(self._ids)
+        response = self._waiting[request_id] = asyncio.get_running_loop().create_future()
+        request = {"id": request_id, "points": [[x, y] for x, y in xy_list], "min_points": min_points}
+        if timeout is not None:
+            request["timeout"] = timeout
+        try:
+            await _write(self._writer, request)
+            message = await response
+        finally:
+            self._waiting.pop(request_id, None)
+
+        if "error" in message:
+            raise ERRORS.get(message["error"], RuntimeError)(message["message"])
+        return [(inf if slope is None else slope, intercept) for slope, intercept in message["lines"]]
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiving.cancel()
+
+    async def __aenter__(self) -> "LineClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _receive(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                response = self._waiting.get(message["id"])
+                if response is not None and not response.done():
+                    response.set_result(message)
+        finally:
+            for response in self._waiting.values():
+                if not response.done():
+                    response.set_exception(ConnectionError("Connection to the service closed."))
+
+
+def request_lines(
+    xy_list: List[Tuple[Any, Any]],
+    path: str = None,
+    host: str = "127.0.0.1",
+    port: int = None,
+    min_points: int = 3,
+    timeout: float = None,
+) -> List[Tuple[float, float]]:
+    """Blocking single request, see `LineClient`."""
+
+    async def request() -> List[Tuple[float, float]]:
+        async with await LineClient.connect(path, host, port) as client:
+            return await client.get_lines(xy_list, min_points, timeout)
+
+    return asyncio.run(request())
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m collinear.service", description="Serve get_lines locally.")
+    parser.add_argument("--socket", help="Unix socket path, TCP otherwise")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="processes, default the number of CPUs")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING)
+    parser.add_argument("--timeout", type=float, help="default time budget of a request in seconds")
+    parser.add_argument("--engine", choices=ENGINES, default="anchor")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        with LineService(args.workers, args.max_pending, args.timeout, args.engine) as service:
+            server = await serve(service, args.socket, args.host, args.port)
+            async with server:
+                await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Binary snapshot of detected lines and their member points, opened with `mmap` without parsing.
+A snapshot is a fixed header followed by packed little-endian sections of 8 bytes values:
+
+    points          num_points (x, y) int64 grid points on any line, sorted
+    slopes          num_lines float64
+    intercepts      num_lines float64, x for lines parallel with y-axis like `get_lines`
+    line_offsets    num_lines + 1 uint64, members of line i are line_members[line_offsets[i]:line_offsets[i + 1]]
+    line_members    num_members uint64 indices of points
+    point_offsets   num_points + 1 uint64, lines of point j are point_lines[point_offsets[j]:point_offsets[j + 1]]
+    point_lines     num_members uint64 line rows
+
+Opening a snapshot maps the file read-only, so worker processes that open the same file share its pages.
+"""
+
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array  # Packed sections.
+from typing import Any, List, Tuple  # Optional type deceleration.
+
+from collinear.get_collinears import validate_min_points, validate_points
+from collinear.line_keys import to_fixed, to_float_line
+from collinear.points import distinct_grid_places
+from collinear.scan import anchor_groups
+
+MAGIC = b"COLLSNAP"
+VERSION = 1
+
+# Magic, version, decimal places of the grid, numbers of points, lines and members, padded to 64 bytes.
+HEADER = struct.Struct("<8sIIQQQ24x")
+
+
+def write_snapshot(path: str, xy_list: List[Tuple[Any, Any]] = None, min_points: int = 3) -> int:
+    """Detect the lines with min_points or more of the input points and write them to a snapshot at path.
+    Returns the number of lines, raises like `get_lines`. The file is replaced atomically.
+    """
+
+    validate_points(xy_list)
+
+    validate_min_points(min_points)
+
+    xy_list, places = distinct_grid_places(xy_list)
+    scale = 10 ** places
+
+    # Members come from the detection pass itself, as in `collinear.lookup`.
+    lines = []
+    members = []
+    for key, group in anchor_groups(xy_list, min_points):
+        lines.append(to_float_line(key, scale))
+        members.append(group)
+
+    on_lines = sorted({member for group in members for member in group}, key=xy_list.__getitem__)
+    position = {member: j for j, member in enumerate(on_lines)}
+    points = array("q")
+    try:
+        for member in on_lines:
+            points.extend(xy_list[member])
+    except OverflowError:
+        raise ValueError("Expected grid coordinates within int64 in snapshots.") from None
+
+    line_offsets = array("Q", [0])
+    line_members = array("Q")
+    point_lines: List[List[int]] = [[] for _ in on_lines]
+    for row, group in enumerate(members):
+        indices = sorted(position[member] for member in group)
+        line_members.extend(indices)
+        line_offsets.append(len(line_members))
+        for j in indices:
+            point_lines[j].append(row)
+
+    point_offsets = array("Q", [0])
+    flat_point_lines = array("Q")
+    for rows in point_lines:
+        flat_point_lines.extend(rows)
+        point_offsets.append(len(flat_point_lines))
+
+    sections = (
+        points,
+        array("d", (slope for slope, _ in lines)),
+        array("d", (intercept for _, intercept in lines)),
+        line_offsets,
+        line_members,
+        point_offsets,
+        flat_point_lines,
+    )
+    if sys.byteorder != "little":  # pragma: no cover
+        for section in sections:
+            section.byteswap()
+
+    header = HEADER.pack(MAGIC, VERSION, places, len(on_lines), len(lines), len(line_members))
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as snapshot_file:
+            snapshot_file.write(header)
+            for section in sections:
+                section.tofile(snapshot_file)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return len(lines)
+
+
+class Snapshot:
+    """Read-only view of a snapshot file, queries read the mapped sections directly."""
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":  # pragma: no cover
+            raise RuntimeError("Memory-mapped little-endian snapshots need a little-endian machine.")
+
+        with open(path, "rb") as snapshot_file:
+            size = snapshot_file.seek(0, 2)
+            if size < HEADER.size:
+                raise ValueError(f"Expected a snapshot file. {path!r} received.")
+            self._mapped = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, places, num_points, num_lines, num_members = HEADER.unpack_from(self._mapped)
+        if magic != MAGIC or version != VERSION:
+            self._mapped.close()
+            raise ValueError(f"Expected a version {VERSION} snapshot file. {path!r} received.")
+        counts = (2 * num_points, num_lines, num_lines, num_lines + 1, num_members, num_points + 1, num_members)
+        if size != HEADER.size + 8 * sum(counts):
+            self._mapped.close()
+            raise ValueError(f"Expected a complete snapshot file of {num_lines} lines. {path!r} received.")
+
+        self.places = places
+        self.scale = 10 ** places
+        sections = []
+        start = HEADER.size
+        view = memoryview(self._mapped)
+        for count, item_format in zip(counts, "qddQQQQ"):
+            sections.append(view[start:start + 8 * count].cast(item_format))
+            start += 8 * count
+        points, self._slopes, self._intercepts, self._line_offsets, self._line_members, \
+            self._point_offsets, self._point_lines = sections
+        self._xs = points[0::2]
+        self._ys = points[1::2]
+        self._views = [self._xs, self._ys] + sections + [view]  # Released before the mapping is closed
+
+    def __len__(self) -> int:
+        return len(self._slopes)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def lines(self) -> List[Tuple[float, float]]:
+        """(slope, y-intercept) of every line, in `get_lines(engine="anchor")` order."""
+        return list(zip(self._slopes, self._intercepts))
+
+    def line(self, row: int) -> Tuple[float, float]:
+        return self._slopes[row], self._intercepts[row]
+
+    def members(self, row: int) -> List[Tuple[Any, Any]]:
+        """Distinct input points of a line in ascending (x, y) order, as floats on grids with decimal places."""
+        indices = self._line_members[self._line_offsets[row]:self._line_offsets[row + 1]]
+        if self.scale == 1:
+            return [(self._xs[j], self._ys[j]) for j in indices]
+        return [(self._xs[j] / self.scale, self._ys[j] / self.scale) for j in indices]
+
+    def lines_through(self, xy: Tuple[Any, Any]) -> List[Tuple[float, float]]:
+        """Lines that have the input point xy among their points, in O(log n) time."""
+        try:
+            x, y = xy
+            (x, x_places), (y, y_places) = to_fixed(x), to_fixed(y)
+        except (TypeError, ValueError):
+            return []
+        if max(x_places, y_places) > self.places:
+            return []  # Finer than the grid, so not an input point.
+        point = (x * 10 ** (self.places - x_places), y * 10 ** (self.places - y_places))
+
+        # Binary search of the sorted points.
+        low, high = 0, len(self._xs)
+        while low < high:
+            middle = (low + high) // 2
+            if (self._xs[middle], self._ys[middle]) < point:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(self._xs) or (self._xs[low], self._ys[low]) != point:
+            return []
+        rows = self._point_lines[self._point_offsets[low]:self._point_offsets[low + 1]]
+        return [(self._slopes[row], self._intercepts[row]) for row in rows]
+
+    def close(self) -> None:
+        """Release the sections and unmap the file."""
+        for view in self._views:
+            view.release()
+        self._mapped.close()
+
+
+def open_snapshot(path: str) -> Snapshot:
+    """Map a snapshot written by `write_snapshot`, without reading its sections."""
+    return Snapshot(path)
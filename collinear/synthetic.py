@@ -0,0 +1,168 @@
+"""Seeded synthetic workloads of (x, y) points for tests, benchmarks and load tests.
+A workload is a number of random lines with a number of distinct points each, lines parallel with the axes, random
+noise points and duplicates, with int, float or Decimal coordinates. The same seed always gives the same points, with
+or without NumPy. Points are generated in batches, one line or one batch of noise points at a time, so very large
+workloads are streamed to disk in the formats of `collinear.loaders` without holding them in memory.
+"""
+
+
+import csv
+import sys
+from array import array  # Packed binary output.
+from decimal import Decimal  # Decimal-like coordinates.
+from random import Random  # Seedable source of all random values.
+from typing import Any, Iterator, List, Tuple, Union  # Optional type deceleration.
+
+BOUNDARY = 10 ** 10
+
+# Float coordinates stay exactly collinear, i.e. keep their decimal value, with at most 15 significant digits, so
+# every |m*x + b| of float workloads is below FLOAT_LIMIT and the default boundary is lower for them.
+FLOAT_LIMIT = 10 ** 15
+FLOAT_BOUNDARY = 10 ** 7
+
+# Points per generated batch, i.e. per write of streamed workloads.
+BATCH_POINTS = 65536
+
+COORDINATES = ("int", "float", "decimal")
+
+
+def iter_batches(
+    num_lines: int = 3,
+    points_per_line: Union[int, Tuple[int, int]] = 3,
+    noise_points: int = 0,
+    noise_fraction: float = None,
+    duplicate_fraction: float = 0.0,
+    vertical_lines: int = 0,
+    horizontal_lines: int = 0,
+    coordinates: str = "int",
+    places: int = 0,
+    boundary: int = None,
+    slope_boundary: int = None,
+    seed: Any = None,
+    batch_points: int = BATCH_POINTS,
+) -> Iterator[List[Tuple[Any, Any]]]:
+    """Batches of the points of a workload, lines first, then the noise points.
+    num_lines lines y = m*x + b with m and b in [-slope_boundary, slope_boundary) and [-boundary, boundary) hold
+    points_per_line distinct points each, an int or a (min, max) range. Lines parallel with y-axis and x-axis are
+    extra. Noise points are random in [-boundary, boundary)^2, either noise_points of them or noise_fraction of all the
+    points. Each batch gets duplicate_fraction of its points as copies of its points. With places, coordinates are
+    multiples of 10^-places and the bounds count in 10^-places units. boundary is BOUNDARY by default, FLOAT_BOUNDARY
+    for float coordinates, whose slope_boundary * boundary + boundary must be at most FLOAT_LIMIT.
+    seed is anything `random.Random` accepts, or a `random.Random` to draw from.
+    """
+
+    if coordinates not in COORDINATES:
+        raise ValueError(f"Expected coordinates is one of {COORDINATES}. {coordinates!r} received.")
+    if places and coordinates == "int":
+        raise ValueError("Expected float or decimal coordinates for decimal places.")
+    if noise_fraction is not None and (noise_points or not 0 <= noise_fraction < 1):
+        raise ValueError(f"Expected noise_fraction in [0, 1) instead of noise_points. {noise_fraction!r} received.")
+    if not 0 <= duplicate_fraction < 1:
+        raise ValueError(f"Expected duplicate_fraction in [0, 1). {duplicate_fraction!r} received.")
+    if boundary is None:
+        boundary = FLOAT_BOUNDARY if coordinates == "float" else BOUNDARY
+    slope_boundary = boundary if slope_boundary is None else slope_boundary
+    if coordinates == "float" and slope_boundary * boundary + boundary > FLOAT_LIMIT:
+        raise ValueError(
+            f"Expected slope_boundary * boundary + boundary of at most {FLOAT_LIMIT} for float coordinates. "
+            f"{slope_boundary * boundary + boundary!r} received."
+        )
+    if isinstance(points_per_line, int):
+        points_per_line = (points_per_line, points_per_line)
+    if not 0 < points_per_line[0] <= points_per_line[1] <= 2 * boundary:
+        raise ValueError(f"Expected points_per_line in [1, 2 * boundary]. {points_per_line!r} received.")
+
+    rng = seed if isinstance(seed, Random) else Random(seed)
+    counts = [rng.randint(*points_per_line) for _ in range(num_lines + vertical_lines + horizontal_lines)]
+    if noise_fraction is not None:
+        noise_points = round(sum(counts) * noise_fraction / (1 - noise_fraction))
+    convert = _converter(coordinates, places)
+
+    batch = []
+    for line, count in enumerate(counts):
+        # Distinct positions along each line, drawn without a set of the ones seen before.
+        positions = rng.sample(range(-boundary, boundary), count)
+        if line < num_lines:
+            m = rng.randrange(-slope_boundary, slope_boundary)
+            b = rng.randrange(-boundary, boundary)
+            batch.extend((x, m * x + b) for x in positions)
+        elif line < num_lines + vertical_lines:
+            x = rng.randrange(-boundary, boundary)
+            batch.extend((x, y) for y in positions)
+        else:
+            y = rng.randrange(-boundary, boundary)
+            batch.extend((x, y) for x in positions)
+        if len(batch) >= batch_points:
+            yield _finish(batch, duplicate_fraction, convert, rng)
+            batch = []
+
+    randrange = rng.randrange
+    while noise_points:
+        size = min(noise_points, max(batch_points - len(batch), 1))
+        batch.extend((randrange(-boundary, boundary), randrange(-boundary, boundary)) for _ in range(size))
+        noise_points -= size
+        yield _finish(batch, duplicate_fraction, convert, rng)
+        batch = []
+    if batch:
+        yield _finish(batch, duplicate_fraction, convert, rng)
+
+
+def workload(*args, shuffle: bool = False, **kwargs) -> List[Tuple[Any, Any]]:
+    """All the points of `iter_batches` in one list, shuffled with shuffle=True."""
+    kwargs.setdefault("seed", None)
+    if not isinstance(kwargs["seed"], Random):
+        kwargs["seed"] = Random(kwargs["seed"])
+    points = [xy for batch in iter_batches(*args, **kwargs) for xy in batch]
+    if shuffle:
+        kwargs["seed"].shuffle(points)
+    return points
+
+
+def write_workload(path: str, file_format: str = "csv", **kwargs) -> int:
+    """Stream the points of `iter_batches` to a CSV file, or a raw little-endian int64 or float64 binary file.
+    Returns the number of points written.
+    """
+    if file_format not in ("csv", "binary"):
+        raise ValueError(f"Expected file format is one of ('csv', 'binary'). {file_format!r} received.")
+
+    written = 0
+    if file_format == "csv":
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(("x", "y"))
+            for batch in iter_batches(**kwargs):
+                writer.writerows(batch)
+                written += len(batch)
+        return written
+
+    coordinates = kwargs.get("coordinates", "int")
+    if coordinates == "decimal":
+        raise ValueError("Expected int or float coordinates for binary files.")
+    with open(path, "wb") as binary_file:
+        for batch in iter_batches(**kwargs):
+            try:
+                values = array("q" if coordinates == "int" else "d", (value for xy in batch for value in xy))
+            except OverflowError:
+                raise ValueError("Expected int64 coordinates, lower boundary or slope_boundary.") from None
+            if sys.byteorder != "little":  # pragma: no cover
+                values.byteswap()
+            values.tofile(binary_file)
+            written += len(batch)
+    return written
+
+
+def _converter(coordinates: str, places: int):
+    if coordinates == "int":
+        return None
+    if coordinates == "decimal":
+        return lambda value: Decimal(value).scaleb(-places)
+    return lambda value: float(Decimal(value).scaleb(-places))
+
+
+def _finish(batch: List[Tuple[int, int]], duplicate_fraction: float, convert, rng: Random) -> List[Tuple[Any, Any]]:
+    if duplicate_fraction:
+        copies = round(len(batch) * duplicate_fraction / (1 - duplicate_fraction))
+        batch.extend(rng.choices(batch, k=copies))
+    if convert is None:
+        return batch
+    return [(convert(x), convert(y)) for x, y in batch]
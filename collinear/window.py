@@ -0,0 +1,108 @@
+"""Lines of 3 or more collinear points among the most recent points of a timestamped stream.
+`SlidingWindow` keeps the points of the last seconds and/or the last max_points events in a `CollinearIndex`, so each
+event costs O(window) to add its point and evict expired ones, and reports the lines that appeared or disappeared.
+"""
+
+
+from collections import deque  # Points in arrival order.
+from numbers import Real  # Timestamps.
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Tuple  # Optional type deceleration.
+
+from collinear.index import CollinearIndex
+from collinear.line_keys import to_fixed
+
+APPEARED = "appeared"
+DISAPPEARED = "disappeared"
+
+
+class WindowEvent(NamedTuple):
+    """A line of the window that reached 3 points, or dropped below, at time t."""
+    kind: str  # APPEARED or DISAPPEARED
+    line: Tuple[float, float]  # (slope, y-intercept), (inf, x) for lines parallel with y-axis
+    t: float
+
+
+class SlidingWindow:
+    """Collinear lines of the points of the last seconds, i.e. with t > now - seconds, and at most max_points of them.
+    Events must arrive in non-decreasing time order.
+    """
+
+    def __init__(self, seconds: float = None, max_points: int = None):
+        if seconds is None and max_points is None:
+            raise ValueError("Expected seconds, max_points or both.")
+        if seconds is not None and (not isinstance(seconds, Real) or not seconds > 0):
+            raise ValueError(f"Expected seconds is a positive number. {seconds!r} received.")
+        if max_points is not None and (not isinstance(max_points, int) or max_points < 1):
+            raise ValueError(f"Expected max_points is a positive int. {max_points!r} received.")
+
+        self.seconds = seconds
+        self.max_points = max_points
+        self.now = None
+        self._index = CollinearIndex()
+        self._points: Deque[Tuple[Any, Tuple[Any, Any]]] = deque()  # (t, (x, y)) in arrival order
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def push(self, t: float, x: Any, y: Any) -> List[WindowEvent]:
+        """Add the point (x, y) seen at time t, evict the expired points and return the lines that changed."""
+        # The point is checked before anything is evicted, so a rejected point leaves the window as it was.
+        to_fixed(x)
+        to_fixed(y)
+        self._advance_to(t)
+
+        changes = {}
+        self._evict_expired(changes)
+        self._points.append((t, (x, y)))
+        for line in self._index.add_point((x, y)):
+            _record(changes, line, APPEARED)
+        while self.max_points is not None and len(self._points) > self.max_points:
+            self._evict_oldest(changes)
+        return [WindowEvent(kind, line, t) for line, kind in changes.items()]
+
+    def advance(self, t: float) -> List[WindowEvent]:
+        """Move the window to time t without a new point and return the lines that disappeared."""
+        self._advance_to(t)
+        changes = {}
+        self._evict_expired(changes)
+        return [WindowEvent(kind, line, t) for line, kind in changes.items()]
+
+    def process(self, events: Iterable[Tuple[float, Any, Any]]) -> Iterator[WindowEvent]:
+        """Push (t, x, y) events and iterate the line events they cause."""
+        for t, x, y in events:
+            yield from self.push(t, x, y)
+
+    def lines(self) -> List[Tuple[float, float]]:
+        """Current lines of the window, in the order they appeared."""
+        return self._index.lines()
+
+    def line_counts(self) -> List[Tuple[Tuple[float, float], int]]:
+        """Current lines of the window with the number of distinct points on each, see `CollinearIndex.line_counts`."""
+        return self._index.line_counts()
+
+    def _advance_to(self, t: float) -> None:
+        if not isinstance(t, Real) or t != t:
+            raise ValueError(f"Expected time is a number. {t!r} received.")
+        if self.now is not None and t < self.now:
+            raise ValueError(f"Expected time {t!r} is not before the last event at {self.now!r}.")
+        self.now = t
+
+    def _evict_expired(self, changes: Dict[Tuple[float, float], str]) -> None:
+        if self.seconds is None:
+            return
+        expired = self.now - self.seconds
+        while self._points and self._points[0][0] <= expired:
+            self._evict_oldest(changes)
+
+    def _evict_oldest(self, changes: Dict[Tuple[float, float], str]) -> None:
+        _, xy = self._points.popleft()
+        for line in self._index.remove_point(xy):
+            _record(changes, line, DISAPPEARED)
+
+
+def _record(changes: Dict[Tuple[float, float], str], line: Tuple[float, float], kind: str) -> None:
+    # A line that disappears and appears again within one event did not change.
+    if changes.get(line, kind) != kind:
+        del changes[line]
+    else:
+        changes[line] = kind
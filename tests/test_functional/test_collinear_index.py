@@ -0,0 +1,81 @@
+"""
+"""
+
+from decimal import Decimal
+from math import inf
+from random import shuffle
+
+import pytest
+
+from collinear.get_collinears import get_line_groups, get_lines
+from collinear.index import CollinearIndex
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_add_point_reports_new_lines():
+    index = CollinearIndex()
+    assert index.add_point((0, 0)) == []
+    assert index.add_point((1, 1)) == []
+    assert index.add_point((2, 2)) == [(1, 0)]
+    assert index.add_point((3, 3)) == []  # Line already has 3 points
+    assert index.add_point((0, 5)) == []
+    assert index.add_point((0, 7)) == [(inf, 0)]
+    assert index.lines() == [(1, 0), (inf, 0)]
+    assert index.line_counts() == [((1, 0), 4), ((inf, 0), 3)]
+
+
+def test_remove_point_reports_dropped_lines():
+    index = CollinearIndex([(0, 0), (1, 1), (2, 2), (3, 3), (0, 5), (0, 7)])
+    assert index.remove_point((3, 3)) == []
+    assert index.line_counts() == [((1, 0), 3), ((inf, 0), 3)]
+    assert index.remove_point((0, 0)) == [(1, 0), (inf, 0)]
+    assert index.lines() == []
+
+    with pytest.raises(ValueError) as exception_info:
+        index.remove_point((0, 0))
+    assert "is not in the index" in str(exception_info.value)
+
+
+def test_duplicate_points_by_multiplicity():
+    index = CollinearIndex([(0, 0), (1, 1), (2, 2), (2, 2)])
+    assert len(index) == 4
+    assert index.remove_point((2, 2)) == []
+    assert index.lines() == [(1, 0)]
+    assert index.remove_point((2, 2)) == [(1, 0)]
+    assert (2, 2) not in index
+
+
+def test_decimal_like_points_rescale_grid():
+    index = CollinearIndex([(0, 0), (1, 2), (3, 7)])
+    assert index.add_point((0.5, 1)) == [(2, 0)]
+    assert index.add_point((0.25, 1.5)) == []
+    assert index.add_point((0.25, 0.5)) == []
+    assert index.line_counts() == [((2, 0), 4)]
+    assert (0.5, 1.0) in index and (0.125, 0) not in index
+    assert index.lines() == get_lines([(0, 0), (1, 2), (3, 7), (0.5, 1), (0.25, 1.5), (0.25, 0.5)])
+
+
+def test_mixed_decimal_and_float_coordinates():
+    points = [(Decimal("0.5"), 1.5), (1, 2), (2, 3)]
+    assert CollinearIndex(points).lines() == get_lines(points) == [(1.0, 1.0)]
+    with pytest.raises(TypeError):
+        CollinearIndex([("1", 2)])
+
+
+def test_same_lines_as_get_lines_after_updates():
+    collinear_points = random_collinear_points(
+        num_lines=20, min_collinear_points_per_line=3, max_collinear_points_per_line=5
+    )
+    mixed_points = collinear_points + random_non_collinear_points(num_non_collinears=100)
+    shuffle(mixed_points)
+
+    index = CollinearIndex(mixed_points)
+    assert sorted(index.lines()) == sorted(get_lines(mixed_points))
+
+    for xy in collinear_points[:10]:
+        index.remove_point(xy)
+        mixed_points.remove(xy)
+    assert sorted(index.lines()) == sorted(get_lines(mixed_points))
+    groups = get_line_groups(mixed_points)
+    assert sorted(index.line_counts()) == sorted(((group.slope, group.intercept), group.count) for group in groups)
@@ -0,0 +1,51 @@
+"""
+"""
+
+from math import inf
+from random import Random
+
+import pytest
+
+from collinear.diff import diff_lines
+from collinear.get_collinears import get_line_groups
+
+
+def line_points(points):
+    return {(group.slope, group.intercept): group.count for group in get_line_groups(points)}
+
+
+def test_raise_exception_if_missing_or_invalid_input():
+    with pytest.raises(ValueError):
+        diff_lines([(0, 0)])
+    with pytest.raises(TypeError):
+        diff_lines({(0, 0)}, [(0, 0)])
+    with pytest.raises(ValueError):
+        diff_lines([], [], min_points=1)
+
+
+def test_appeared_disappeared_and_changed_lines():
+    old = [(0, 0), (1, 1), (2, 2), (0, 5), (0, 7), (0, 9), (5, 0)]
+    new = [(0, 0), (1, 1), (2, 2), (3, 3), (0, 5), (5, 0), (6, 0), (0.5, 0.5)]
+    diff = diff_lines(old, new)
+    assert diff.appeared == [((0, 0), 3)]
+    assert diff.disappeared == [((inf, 0), 4)]
+    assert diff.changed == [((1, 0), 3, 5)]
+    assert (diff.added_points, diff.removed_points) == (3, 2)
+
+    assert diff_lines(old, old[::-1] + old[:2]) == ([], [], [], 0, 0)
+
+
+def test_same_as_diff_of_full_scans():
+    random = Random(23)
+    old = [(random.randint(0, 12), random.randint(0, 12)) for _ in range(60)]
+    new = [xy for xy in old if random.random() > 0.1]
+    new += [(random.randint(0, 12), random.randint(0, 12)) for _ in range(6)]
+
+    before = line_points(old)
+    after = line_points(new)
+    diff = diff_lines(old, new)
+    assert dict(diff.appeared) == {line: points for line, points in after.items() if line not in before}
+    assert dict(diff.disappeared) == {line: points for line, points in before.items() if line not in after}
+    assert {line: (old_points, new_points) for line, old_points, new_points in diff.changed} == {
+        line: (before[line], after[line]) for line in before.keys() & after.keys() if before[line] != after[line]
+    }
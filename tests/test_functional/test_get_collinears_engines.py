@@ -0,0 +1,34 @@
+"""
+"""
+
+from random import shuffle
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_unknown_engine():
+    with pytest.raises(ValueError) as exception_info:
+        get_lines([(0, 0), (1, 1), (2, 2)], engine="triples")
+    assert "Expected engine is one of" in str(exception_info.value)
+
+
+def test_anchor_engine_same_output_as_pairs_engine():
+    mixed_points = random_collinear_points(
+        num_lines=50, min_collinear_points_per_line=3, max_collinear_points_per_line=6
+    ) + random_non_collinear_points(num_non_collinears=200)
+    shuffle(mixed_points)
+
+    lines = get_lines(mixed_points, engine="anchor")
+    assert len(lines) == 50
+    assert lines == get_lines(mixed_points, engine="pairs")
+
+
+def test_anchor_engine_grid_lines():
+    # Many overlapping lines, including lines parallel with both axes and diagonals.
+    grid = [(x, y) for x in range(6) for y in range(6)]
+    shuffle(grid)
+    assert get_lines(grid, engine="anchor") == get_lines(grid, engine="pairs")
@@ -0,0 +1,65 @@
+"""
+"""
+
+import os
+
+import pytest
+
+from collinear import external
+from collinear.external import external_scan
+from collinear.get_collinears import get_lines
+from collinear.points import distinct_grid_points
+from collinear.scan import pair_scan
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_invalid_budget():
+    with pytest.raises(ValueError):
+        external_scan([(0, 0), (1, 1), (2, 2)], memory_bytes=1024)
+    with pytest.raises(ValueError):
+        get_lines([(0, 0), (1, 1), (2, 2)], engine="external", memory_bytes=1024)
+    with pytest.raises(ValueError):
+        get_lines([(0, 0), (1, 1), (2, 2)], engine="externals")
+
+
+def test_same_as_pairs_engine():
+    points = random_collinear_points(num_lines=8) + random_non_collinear_points(30) + [(0.5, 0.5), (1.5, 1.5)]
+    assert get_lines(points, engine="external") == get_lines(points)
+    assert get_lines(points, engine="external", min_points=5) == get_lines(points, min_points=5)
+
+    small = [(x % 7, x * x % 11) for x in range(40)]
+    assert get_lines(small, engine="external") == get_lines(small)
+
+
+def test_many_buckets_in_given_directory(tmp_path, monkeypatch):
+    points, _ = distinct_grid_points(random_collinear_points(num_lines=10) + random_non_collinear_points(50))
+    monkeypatch.setattr(external, "MIN_BUFFER_BYTES", 64)
+    monkeypatch.setattr(external, "BYTES_PER_LINE", 4096)  # About one bucket per 32 pairs
+
+    assert external_scan(points, memory_bytes=256 << 10, directory=str(tmp_path)) == pair_scan(points)
+    assert external_scan(points, 4, memory_bytes=256 << 10, directory=str(tmp_path)) == pair_scan(points, 4)
+    assert os.listdir(tmp_path) == []
+
+
+def test_buckets_partitioned_again_within_budget(tmp_path, monkeypatch):
+    points, _ = distinct_grid_points(random_collinear_points(num_lines=10) + random_non_collinear_points(50))
+    monkeypatch.setattr(external, "MIN_BUFFER_BYTES", 32 << 10)  # Buffers of 4 buckets at once
+    monkeypatch.setattr(external, "BYTES_PER_LINE", 4096)
+
+    written = []
+    write_buckets = external._write_buckets
+    monkeypatch.setattr(external, "_write_buckets", lambda *args: written.append(args[3]) or write_buckets(*args))
+    assert external_scan(points, memory_bytes=256 << 10, directory=str(tmp_path)) == pair_scan(points)
+    assert max(written) >= 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_one_long_line_not_partitioned_again(tmp_path, monkeypatch):
+    points = [(x, 2 * x + 1) for x in range(300)]
+    written = []
+    write_buckets = external._write_buckets
+    monkeypatch.setattr(external, "_write_buckets", lambda *args: written.append(args[3]) or write_buckets(*args))
+    assert get_lines(points, engine="external", memory_bytes=256 << 10, directory=str(tmp_path)) == [(2, 1)]
+    assert written == [0]
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,57 @@
+"""
+"""
+
+from array import array
+from math import inf
+
+import pytest
+
+from collinear import points
+from collinear.get_collinears import get_line_groups, get_lines
+
+POINTS = [(0, 0), (1, 1), (2, 2), (1, 1), (7, 0), (7, 5), (7, -2), (3, 9)]
+LINES = [(1, 0), (inf, 7)]
+
+
+def test_tuple_and_sequence_inputs():
+    assert get_lines(tuple(POINTS)) == LINES
+    assert get_lines(tuple(POINTS), engine="anchor") == LINES
+    assert get_lines(()) == []
+
+
+def test_array_columns_and_memoryview_inputs():
+    xs = array("q", [x for x, _ in POINTS])
+    ys = array("q", [y for _, y in POINTS])
+    assert get_lines((xs, ys)) == LINES
+    assert get_lines((memoryview(xs), memoryview(ys))) == LINES
+    assert get_lines((array("d", [0.5, 0.5, 0.5]), array("d", [0, 1, 2]))) == [(inf, 0.5)]
+
+    flat = array("q", [v for xy in POINTS for v in xy])
+    assert get_lines(memoryview(flat).cast("B").cast("q", (len(POINTS), 2))) == LINES
+
+    with pytest.raises(ValueError):
+        get_lines((xs, ys[:-1]))
+    with pytest.raises(ValueError):
+        get_lines(memoryview(flat))
+
+
+def test_numpy_array_inputs(monkeypatch):
+    np = pytest.importorskip("numpy")
+    assert get_lines(np.array(POINTS)) == LINES
+    assert get_lines(np.array(POINTS, dtype=np.float64)) == LINES
+    assert get_lines(np.array([[0.5, 0], [0.5, 1], [0.5, 2], [1, 2]])) == [(inf, 0.5)]
+    assert list(get_line_groups(np.array(POINTS))[0].indices) == [0, 1, 2, 3]
+
+    # Same results when deduplicated through Python tuples.
+    monkeypatch.setattr(points, "np", None)
+    assert get_lines(np.array(POINTS)) == LINES
+
+
+def test_raise_exception_if_coordinates_not_numeric():
+    with pytest.raises(TypeError) as exception_info:
+        get_lines([(0, 0), (1, 1), ("2", "2")])
+    assert "Expected numeric coordinates." in str(exception_info.value)
+
+    with pytest.raises(ValueError) as exception_info:
+        get_lines([(0, 0), (1, 1), (float("nan"), 2)])
+    assert "Expected finite coordinates." in str(exception_info.value)
@@ -0,0 +1,67 @@
+"""
+"""
+
+from math import inf
+from random import shuffle
+
+import pytest
+
+from collinear.get_collinears import get_lines, top_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def lines_of_sizes():
+    """Lines of 3 to 7 points, through the origin with distinct slopes, plus one vertical line of 8 points."""
+    points = [(x, size * x) for size in range(3, 8) for x in range(1, size + 1)]
+    points += [(-1, y) for y in range(8)]
+    shuffle(points)
+    return points
+
+
+def test_raise_exception_if_min_points_or_k_invalid():
+    with pytest.raises(ValueError) as exception_info:
+        get_lines([(0, 0), (1, 1), (2, 2)], min_points=1)
+    assert "Expected min_points is an int of 2 or more." in str(exception_info.value)
+
+    with pytest.raises(ValueError) as exception_info:
+        top_lines([(0, 0), (1, 1), (2, 2)], k=0)
+    assert "Expected k is a positive int." in str(exception_info.value)
+
+
+def test_min_points_all_engines():
+    points = lines_of_sizes()
+    for kwargs in (
+        {}, {"engine": "anchor"}, {"engine": "external"}, {"backend": "numpy"}, {"workers": 2},
+        {"workers": 2, "backend": "numpy"},
+    ):
+        assert sorted(get_lines(points, min_points=6, **kwargs)) == [(6, 0), (7, 0), (inf, -1)]
+        assert get_lines(points, min_points=3, **kwargs) == get_lines(points)
+        assert get_lines(points, min_points=9, **kwargs) == []
+        assert get_lines(points, min_points=2, **kwargs) == get_lines(points, min_points=2)
+
+        # Lines of 2 points from anchors whose partners all have distinct directions.
+        assert len(get_lines([(0, 0), (1, 5), (2, 3), (7, 1)], min_points=2, **kwargs)) == 6
+        assert len(get_lines([(0, 0), (1, 1), (2, 2), (5, 7)], min_points=2, **kwargs)) == 4
+
+
+def test_top_lines():
+    points = lines_of_sizes()
+    assert top_lines(points, k=3) == [((inf, -1), 8), ((7, 0), 7), ((6, 0), 6)]
+    assert top_lines(points, k=1, min_points=9) == []
+    assert len(top_lines(points, k=100)) == len(get_lines(points))
+
+
+def test_top_lines_same_as_sorted_get_lines():
+    mixed_points = random_collinear_points(
+        num_lines=30, min_collinear_points_per_line=3, max_collinear_points_per_line=9
+    ) + random_non_collinear_points(num_non_collinears=100)
+    shuffle(mixed_points)
+
+    top = top_lines(mixed_points, k=5)
+    assert [points for _, points in top] == sorted((points for _, points in top), reverse=True)
+    for line, points in top:
+        assert line in get_lines(mixed_points, min_points=points)
+        assert line not in get_lines(mixed_points, min_points=points + 1)
+    weakest = top[-1][1]
+    assert len(get_lines(mixed_points, min_points=weakest + 1)) < 5
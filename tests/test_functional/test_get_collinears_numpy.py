@@ -0,0 +1,37 @@
+"""
+"""
+
+from random import shuffle
+
+import pytest
+
+from collinear import scan_numpy
+from collinear.get_collinears import get_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_unknown_backend():
+    with pytest.raises(ValueError) as exception_info:
+        get_lines([(0, 0), (1, 1), (2, 2)], backend="cuda")
+    assert "Expected backend is one of" in str(exception_info.value)
+
+
+def test_numpy_backend_same_output_as_python():
+    pytest.importorskip("numpy")
+    mixed_points = random_collinear_points(
+        num_lines=50, min_collinear_points_per_line=3, max_collinear_points_per_line=6
+    ) + random_non_collinear_points(num_non_collinears=200)
+    mixed_points += [(7, y) for y in range(5)] + [(x, -3) for x in range(5)] + [(0.5, 0.5), (1.5, 1.5)]
+    shuffle(mixed_points)
+
+    assert get_lines(mixed_points, backend="numpy") == get_lines(mixed_points)
+
+
+def test_numpy_backend_falls_back_to_python(monkeypatch):
+    # Coordinates beyond int64 arithmetic are always handled by the pure Python engines.
+    huge = 10 ** 30
+    assert get_lines([(0, 0), (huge, huge), (2 * huge, 2 * huge)], backend="numpy") == [(1, 0)]
+
+    monkeypatch.setattr(scan_numpy, "np", None)
+    assert get_lines([(0, 0), (1, 1), (2, 2)], backend="numpy") == [(1, 0)]
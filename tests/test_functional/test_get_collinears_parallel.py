@@ -0,0 +1,45 @@
+"""
+"""
+
+from random import shuffle
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.parallel import anchor_ranges
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_workers_not_positive():
+    with pytest.raises(ValueError) as exception_info:
+        get_lines([(0, 0), (1, 1), (2, 2)], workers=0)
+    assert "Expected workers is a positive int." in str(exception_info.value)
+
+
+def test_anchor_ranges_cover_all_anchors_with_balanced_pairs():
+    ranges = anchor_ranges(1000, 8)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 998
+    assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+
+    pairs = [sum(1000 - 1 - i for i in range(start, stop)) for start, stop in ranges]
+    assert len(ranges) == 8
+    assert max(pairs) - min(pairs) < 1000
+    assert anchor_ranges(2, 4) == []
+
+
+def test_workers_same_output_as_single_process():
+    mixed_points = random_collinear_points(
+        num_lines=50, min_collinear_points_per_line=3, max_collinear_points_per_line=6
+    ) + random_non_collinear_points(num_non_collinears=200)
+    mixed_points += [(x, y) for x in range(5) for y in range(5)]
+    shuffle(mixed_points)
+
+    assert get_lines(mixed_points, workers=3) == get_lines(mixed_points)
+    assert get_lines(mixed_points, workers=3, backend="numpy") == get_lines(mixed_points)
+
+
+def test_workers_beyond_int64_coordinates():
+    huge = 10 ** 30
+    points = [(0, 0), (huge, huge), (2 * huge, 2 * huge), (1, 0), (2, 0), (3, 0)]
+    assert get_lines(points, workers=2) == get_lines(points)
@@ -0,0 +1,84 @@
+"""
+"""
+
+from math import inf, isclose
+from random import Random
+
+import pytest
+
+from collinear.get_collinears import get_lines
+
+pytest.importorskip("numpy")
+
+
+def noisy_line_points(random, slope, intercept, num_points, noise, span=200):
+    points = []
+    for _ in range(num_points):
+        x = random.uniform(-span / 2, span / 2)
+        points.append((x + random.uniform(-noise, noise), slope * x + intercept + random.uniform(-noise, noise)))
+    return points
+
+
+def test_raise_exception_if_invalid_tolerance():
+    for tolerance in (0, -1, float("nan"), float("inf"), "0.1"):
+        with pytest.raises(ValueError):
+            get_lines([(0, 0), (1, 1), (2, 2)], tolerance=tolerance)
+
+
+def test_exact_lines_with_tiny_tolerance():
+    points = [(x, y) for x in range(5) for y in range(5)] + [(0.5, 0.25)]
+    expected = get_lines(points)
+    lines = get_lines(points, tolerance=1e-9)
+    assert len(lines) == len(expected)
+    for slope, intercept in expected:
+        assert any(isclose(slope, found_slope) and isclose(intercept, found_intercept, abs_tol=1e-9)
+                   for found_slope, found_intercept in lines)
+
+
+def test_short_horizontal_and_steep_segments():
+    assert get_lines([(0, 5), (0.1, 5), (0.2, 5), (0.3, 5)], tolerance=0.2) == [(0, 5)]
+    assert get_lines([(5, 0), (5, 0.1), (5, 0.2), (5, 0.3)], tolerance=0.2) == [(inf, 5)]
+
+    (slope, intercept), = get_lines([(0, 0), (0.1, 1), (0.2, 2), (0.3, 3)], tolerance=0.2)
+    assert isclose(slope, 10) and isclose(intercept, 0, abs_tol=1e-9)
+    # Upright within tolerance over its extent
+    (slope, intercept), = get_lines([(0, 0), (0.01, 1), (0.02, 2), (0.03, 3)], tolerance=0.2)
+    assert slope == inf and isclose(intercept, 0.015)
+
+
+def test_noisy_lines_in_clutter():
+    random = Random(15)
+    lines = [(-2, 40), (0.5, 3), (0, -25)]  # By descending intercept
+    points = []
+    for slope, intercept in lines:
+        points += noisy_line_points(random, slope, intercept, 40, 0.05)
+    points += [(random.uniform(-100, 100) + 0.1, random.uniform(-100, 100)) for _ in range(100)]
+    vertical = [(12.34 + random.uniform(-0.05, 0.05), random.uniform(-100, 100)) for _ in range(30)]
+    random.shuffle(points)
+
+    found = get_lines(points + vertical, tolerance=0.1, min_points=20)
+    assert len(found) == 4
+    assert found[-1][0] == inf and isclose(found[-1][1], 12.34, abs_tol=0.05)
+    for (slope, intercept), (found_slope, found_intercept) in zip(lines, sorted(found[:3], key=lambda line: -line[1])):
+        assert isclose(slope, found_slope, abs_tol=0.01) and isclose(intercept, found_intercept, abs_tol=0.1)
+
+    assert get_lines(points, tolerance=1e-6, min_points=20) == []
+
+
+def test_noisy_lines_in_clutter_on_large_spans():
+    # Accumulator cells are many tolerances wide here, lines are pinned down within each candidate.
+    for span in (1000, 10000, 100000):
+        random = Random(span)
+        points = noisy_line_points(random, 0.7, span / 10, 50, 0.05, span)
+        points += noisy_line_points(random, -1.3, -span / 20, 50, 0.05, span)
+        points += [(random.uniform(-span / 2, span / 2), random.uniform(-span / 2, span / 2)) for _ in range(200)]
+        found = sorted(get_lines(points, tolerance=0.1, min_points=30))
+        assert len(found) == 2
+        for (slope, intercept), (found_slope, found_intercept) in zip([(-1.3, -span / 20), (0.7, span / 10)], found):
+            assert isclose(slope, found_slope, abs_tol=1e-3) and isclose(intercept, found_intercept, abs_tol=0.1)
+
+    clean = [(x, 2 * x + 1) for x in range(-500, 500, 20)] + [(x, 7 - x) for x in range(-500, 500, 20)]
+    found = sorted(get_lines(clean, tolerance=0.1, min_points=30))
+    assert len(found) == 2
+    for (slope, intercept), (found_slope, found_intercept) in zip([(-1, 7), (2, 1)], found):
+        assert isclose(slope, found_slope) and isclose(intercept, found_intercept)
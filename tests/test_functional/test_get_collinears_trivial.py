@@ -1,6 +1,8 @@
 """
 """
 
+from decimal import Decimal
+from math import inf
 from random import randint, shuffle
 
 import pytest
@@ -14,11 +16,11 @@ def test_raise_exception_if_missing_input():
         assert "Expected input argument is missing." in str(exception_info.value)
 
 
-def test_raise_exception_if_input_type_not_list():
+def test_raise_exception_if_input_type_not_sequence():
     with pytest.raises(TypeError) as exception_info:
-        xy_input = ((-1, -1), (3, 3), (6, 6), (0, 0))
+        xy_input = {(-1, -1), (3, 3), (6, 6), (0, 0)}
         get_lines(xy_input)
-        assert "Expected input type is list." in str(exception_info.value)
+    assert "Expected input type is a sequence of (x, y) points" in str(exception_info.value)
 
 
 def test_less_than_3_points_input():
@@ -105,3 +107,15 @@ def test_3_collinear_points_1_line():
     assert intercept == y2 - slop * x2
     assert intercept == y1 - slop * x1
     assert len(get_lines(points)) == 1
+
+
+def test_decimal_like_points_exact_lines():
+    # 0.1 + 0.2 != 0.3 in binary floating-point, but points are compared on an exact integer grid.
+    points = [(0.1, 0.3), (0.2, 0.5), (0.3, 0.7), (Decimal("0.4"), Decimal("0.9"))]
+    assert get_lines(points) == [(2.0, 0.1)]
+
+    points = [(1.5, 0), (1.5, 2), (Decimal("1.50"), 7), (3, 1)]
+    assert get_lines(points) == [(inf, 1.5)]
+
+    points = [(1, 1), (1.0, 1.0), (2, 2)]  # Duplicate points across types
+    assert get_lines(points) == []
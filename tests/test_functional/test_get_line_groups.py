@@ -0,0 +1,41 @@
+"""
+"""
+
+from math import inf
+from random import shuffle
+
+import pytest
+
+from collinear.get_collinears import get_line_groups, get_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_input_type_not_sequence():
+    with pytest.raises(TypeError):
+        get_line_groups({(-1, -1), (3, 3), (6, 6), (0, 0)})
+
+
+def test_line_groups_members_in_input_order():
+    points = [(5, 1), (0, 0), (0, 3), (1, 1), (0, 9), (2, 2), (1, 1), (7, 0)]
+    groups = get_line_groups(points)
+    assert [(group.slope, group.intercept) for group in groups] == [(inf, 0), (1, 0)]
+    assert list(groups[0].indices) == [1, 2, 4]
+    assert groups[0].count == 3
+    assert list(groups[1].indices) == [1, 3, 5, 6]  # Duplicate (1, 1) is a member too
+    assert groups[1].count == 3
+    assert get_line_groups([]) == []
+
+
+def test_line_groups_same_lines_as_get_lines():
+    mixed_points = random_collinear_points(
+        num_lines=30, min_collinear_points_per_line=3, max_collinear_points_per_line=6
+    ) + random_non_collinear_points(num_non_collinears=100)
+    shuffle(mixed_points)
+
+    groups = get_line_groups(mixed_points)
+    assert [(group.slope, group.intercept) for group in groups] == get_lines(mixed_points, engine="anchor")
+    for group in groups:
+        assert len(group.indices) == group.count
+        members = [mixed_points[i] for i in group.indices]
+        assert get_lines(members) == [(group.slope, group.intercept)]
@@ -0,0 +1,53 @@
+"""
+"""
+
+from random import randint
+
+import pytest
+
+from collinear import scan_numpy
+from collinear.get_collinears import get_lines, get_lines_batch
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def random_tiles(num_tiles):
+    return [
+        random_collinear_points(num_lines=randint(0, 3)) + random_non_collinear_points(randint(0, 20))
+        for _ in range(num_tiles)
+    ]
+
+
+def test_raise_exception_if_missing_or_invalid_input():
+    with pytest.raises(ValueError):
+        get_lines_batch()
+    with pytest.raises(ValueError):
+        get_lines_batch([[(0, 0)]], engine="triples")
+    with pytest.raises(TypeError):
+        get_lines_batch([[(0, 0), (1, 1), (2, 2)], {(0, 0)}])
+
+
+def test_batch_same_as_get_lines_in_input_order():
+    tiles = random_tiles(200) + [[], [(0, 0), (1, 1), (2, 2)]]
+    expected = [get_lines(tile) for tile in tiles]
+    assert get_lines_batch(tiles) == expected
+    assert get_lines_batch(iter(tiles), engine="pairs") == expected
+    assert get_lines_batch(tiles, min_points=4) == [get_lines(tile, min_points=4) for tile in tiles]
+
+
+def test_batch_numpy_backend_same_as_get_lines(monkeypatch):
+    pytest.importorskip("numpy")
+    tiles = random_tiles(100) + [[(x, y) for x in range(5) for y in range(5)], [(0.5, 0), (0.5, 1), (0.5, 2)]]
+    tiles.append([(0, 0), (10 ** 12, 10 ** 12), (2 * 10 ** 12, 2 * 10 ** 12)])  # Beyond int64 keys
+    tiles = [[(x % 10 ** 6, y % 10 ** 6) for x, y in tile] for tile in tiles[:100]] + tiles[100:]
+    assert get_lines_batch(tiles, backend="numpy") == [get_lines(tile) for tile in tiles]
+    assert get_lines_batch(tiles, backend="numpy", min_points=4) == [get_lines(tile, min_points=4) for tile in tiles]
+
+    # Sets above the pair cap of a segment are scanned one anchor at a time.
+    monkeypatch.setattr(scan_numpy, "SEGMENT_PAIRS", 20)
+    assert get_lines_batch(tiles, backend="numpy") == [get_lines(tile) for tile in tiles]
+
+
+def test_batch_workers_same_as_single_process():
+    tiles = random_tiles(100)
+    assert get_lines_batch(tiles, workers=2) == get_lines_batch(tiles)
@@ -0,0 +1,35 @@
+"""
+"""
+
+import pytest
+
+from collinear.get_collinears import first_collinear_triple, get_lines, has_collinear
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_missing_or_invalid_input():
+    with pytest.raises(ValueError):
+        has_collinear()
+    with pytest.raises(TypeError):
+        first_collinear_triple({(0, 0)})
+    with pytest.raises(TypeError):
+        has_collinear([(0, 0), (1, "1")])
+
+
+def test_first_triple_witness():
+    assert first_collinear_triple([]) is None
+    assert first_collinear_triple([(0, 0), (1, 1), (1, 1)]) is None  # Duplicates are not distinct points
+    assert first_collinear_triple([(0, 0), (5, 1), (1, 1), (2, 2)]) == ((0, 0), (1, 1), (2, 2))
+    assert first_collinear_triple([(0, 0.5), (3, 1), (0, 1.5), (0, 2)]) == ((0, 0.5), (0, 1.5), (0, 2))
+    assert first_collinear_triple([(7, 1), (0, 0), (1, 5), (2, 0), (3, 0)]) == ((0, 0), (2, 0), (3, 0))
+
+
+def test_same_answer_as_get_lines():
+    for _ in range(20):
+        points = random_non_collinear_points(30)
+        assert has_collinear(points) == bool(get_lines(points))
+        points += random_collinear_points(num_lines=1)
+        assert has_collinear(points)
+        a, b, c = first_collinear_triple(points)
+        assert get_lines([a, b, c]) and len({a, b, c}) == 3
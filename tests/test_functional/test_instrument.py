@@ -0,0 +1,73 @@
+"""
+"""
+
+import tracemalloc
+
+import pytest
+
+from collinear import instrument
+from collinear.get_collinears import get_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_no_hooks_by_default():
+    assert instrument.hooks == []
+
+
+def test_collect_phases_and_counts():
+    points = random_collinear_points(num_lines=4) + random_non_collinear_points(10)
+    expected = get_lines(points)
+
+    with instrument.collect() as calls:
+        assert get_lines(points + points[:3]) == expected
+        assert get_lines(points, engine="anchor") == expected
+    assert instrument.hooks == []
+    get_lines(points)
+
+    assert len(calls) == 2
+    pairs, anchor = calls
+    assert list(pairs.seconds) == list(instrument.PHASES)
+    assert all(seconds >= 0 for seconds in pairs.seconds.values())
+    num_points = len(set(points))
+    assert pairs[1:4] == (len(points) + 3, num_points, num_points * (num_points - 1) // 2)
+    assert pairs.lines == len(expected) and pairs.engine == "pairs" and pairs.peak_bytes is None
+    assert len(expected) <= pairs.table_size <= pairs.pairs
+    assert anchor.table_size is None and anchor.engine == "anchor"
+
+
+def test_hook_with_memory_and_errors():
+    reported = []
+    instrument.add_hook(reported.append, trace_memory=True)
+    try:
+        get_lines([(0, 0), (1, 1), (2, 2), (3, 3)])
+        with pytest.raises(ValueError):
+            get_lines([(0, 0)], engine="triples")
+    finally:
+        instrument.remove_hook(reported.append, trace_memory=True)
+
+    assert len(reported) == 1
+    assert reported[0].lines == 1 and reported[0].table_size == 1 and reported[0].peak_bytes > 0
+
+
+def test_peak_memory_while_already_tracing(monkeypatch):
+    tracemalloc.start()
+    try:
+        with instrument.collect(trace_memory=True) as calls:
+            get_lines([(0, 0), (1, 1), (2, 2)])
+            monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)  # Python 3.8
+            get_lines([(0, 0), (1, 1), (2, 2)])
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert calls[0].peak_bytes is None or calls[0].peak_bytes > 0
+    assert calls[1].peak_bytes is None
+
+
+def test_same_lines_with_hooks_for_every_engine():
+    points = random_collinear_points(num_lines=4) + random_non_collinear_points(10)
+    expected = get_lines(points)
+    for kwargs in ({"engine": "anchor"}, {"engine": "external"}, {"backend": "numpy"}, {"workers": 2}):
+        with instrument.collect() as calls:
+            assert get_lines(points, **kwargs) == expected
+        assert calls[0].lines == len(expected)
@@ -0,0 +1,42 @@
+"""
+"""
+
+from itertools import islice
+
+import pytest
+
+from collinear.get_collinears import get_lines, iter_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_on_call_if_missing_or_invalid_input():
+    with pytest.raises(ValueError):
+        iter_lines()
+    with pytest.raises(TypeError):
+        iter_lines({(0, 0)})
+    with pytest.raises(TypeError):
+        iter_lines([(0, 0), (1, 1), ("2", 2)])
+    with pytest.raises(ValueError):
+        iter_lines([(0, 0)], min_points=1)
+
+
+def test_same_lines_in_same_order_as_get_lines():
+    points = random_collinear_points(num_lines=20) + random_non_collinear_points(30) + [(0.5, 0), (0.5, 1), (0.5, 2)]
+    lines = iter_lines(points)
+    assert iter(lines) is lines
+    assert list(lines) == get_lines(points)
+    assert list(iter_lines(points, min_points=4)) == get_lines(points, min_points=4)
+    assert list(iter_lines([])) == []
+
+
+def test_numpy_backend_same_as_get_lines():
+    pytest.importorskip("numpy")
+    points = [(x, y) for x in range(6) for y in range(6)]
+    assert list(iter_lines(points, backend="numpy")) == get_lines(points)
+
+
+def test_first_lines_before_scan_is_done():
+    # The line through the first points is final after the first anchor, the rest is never scanned.
+    points = [(0, 0), (1, 1), (2, 2)] + random_non_collinear_points(5000)
+    assert list(islice(iter_lines(points), 1)) == [(1.0, 0.0)]
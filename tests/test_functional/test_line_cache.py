@@ -0,0 +1,108 @@
+"""
+"""
+
+from random import shuffle
+
+import pytest
+
+from collinear.cache import LineCache, fingerprint
+from collinear.get_collinears import get_lines
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_missing_or_invalid_input():
+    cache = LineCache()
+    with pytest.raises(ValueError):
+        cache.get_lines()
+    with pytest.raises(TypeError):
+        cache.get_lines({(0, 0)})
+    with pytest.raises(ValueError):
+        cache.get_lines([(0, 0)], engine="triples")
+    with pytest.raises(ValueError):
+        LineCache(max_entries=-1)
+
+
+def test_fingerprint_is_order_independent():
+    points = [(x, x * x) for x in range(-50, 50)]
+    reordered = points[::-1]
+    assert fingerprint(points) == fingerprint(reordered)
+    assert fingerprint(points) != fingerprint(points, scale=10)
+    assert fingerprint(points) != fingerprint(points[1:])
+    assert fingerprint([(2 ** 70, 0)]) != fingerprint([(2 ** 70 + 1, 0)])
+
+
+def test_hits_for_same_points_in_any_order_and_with_duplicates():
+    points = random_collinear_points(num_lines=5) + random_non_collinear_points(20)
+    expected = get_lines(points)
+    cache = LineCache()
+
+    assert cache.get_lines(points) == expected
+    reordered = points + points[:10]
+    shuffle(reordered)
+    assert set(cache.get_lines(reordered)) == set(expected)
+    assert cache.get_lines(points, engine="anchor") == expected
+    assert cache.stats()[:3] == (2, 0, 1)
+
+    # A different min_points is a different result.
+    assert cache.get_lines(points, min_points=4) == get_lines(points, min_points=4)
+    assert cache.stats().misses == 2
+
+    # Cached results are not changed through returned lists.
+    cache.get_lines(points).clear()
+    assert cache.get_lines(points) == expected
+
+
+def test_least_recently_used_eviction_by_entries_and_bytes():
+    sets = [[(0, i), (1, i), (2, i), (0, i + 1), (1, i + 2), (2, i + 3)] for i in range(4)]  # Two lines each
+    cache = LineCache(max_entries=2)
+    for points in sets[:3]:
+        cache.get_lines(points)
+    assert cache.stats().evictions == 1 and len(cache) == 2
+    cache.get_lines(sets[1])  # Most recently used now
+    cache.get_lines(sets[3])
+    cache.get_lines(sets[1])
+    assert cache.stats()[:4] == (2, 0, 4, 2)
+
+    cache = LineCache(max_bytes=2 * 32)
+    for points in sets:
+        cache.get_lines(points)
+    assert cache.stats()[3:] == (2, 2, 64)
+
+    cache = LineCache(max_bytes=16)
+    assert cache.get_lines(sets[0]) == get_lines(sets[0])
+    assert len(cache) == 0
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    points = [(0, 0), (0.5, 0.5), (1, 1), (0, 1), (0, 2), (3, 7)]
+    expected = get_lines(points)
+    assert LineCache(directory=str(tmp_path)).get_lines(points) == expected
+
+    cache = LineCache(directory=str(tmp_path))
+    assert cache.get_lines(points[::-1]) == expected
+    assert cache.get_lines(points) == expected
+    assert cache.stats()[:3] == (2, 1, 0)
+
+    cache.clear(disk=True)
+    assert cache.get_lines(points) == expected
+    assert cache.stats().misses == 1
+
+
+def test_disk_tier_bounded_and_corrupt_files_are_misses(tmp_path):
+    sets = [[(0, i), (1, i), (2, i), (0, i + 1), (1, i + 2), (2, i + 3)] for i in range(5)]
+    cache = LineCache(max_entries=0, directory=str(tmp_path), max_disk_entries=3)
+    for points in sets:
+        cache.get_lines(points)
+    assert len(list(tmp_path.glob("*.lines"))) == 3
+    assert cache.get_lines(sets[-1]) == get_lines(sets[-1])
+    assert cache.stats()[:3] == (1, 1, 5)
+
+    for path in tmp_path.glob("*.lines"):
+        path.write_bytes(path.read_bytes()[:-3])
+    assert cache.get_lines(sets[-1]) == get_lines(sets[-1])
+    assert cache.stats()[:3] == (1, 1, 6)
+    assert len(list(tmp_path.glob("*.lines"))) == 3
+
+    with pytest.raises(ValueError):
+        LineCache(max_disk_entries=0)
@@ -0,0 +1,69 @@
+"""
+"""
+
+from math import inf
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.lookup import get_line_lookup
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_missing_or_invalid_input():
+    with pytest.raises(ValueError):
+        get_line_lookup()
+    with pytest.raises(TypeError):
+        get_line_lookup({(0, 0)})
+    with pytest.raises(ValueError):
+        get_line_lookup([(0, 0)], min_points=1)
+
+
+def test_same_lines_as_get_lines():
+    points = random_collinear_points(num_lines=10) + random_non_collinear_points(20) + [(0.5, 0), (0.5, 1), (0.5, 2)]
+    for min_points in (2, 3, 4):
+        lookup = get_line_lookup(points, min_points)
+        assert lookup.lines == get_lines(points, engine="anchor", min_points=min_points)
+        assert len(lookup) == len(lookup.lines)
+
+
+def test_lines_through_points_and_by_key():
+    points = [(0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (2, 0), (7, 3)]
+    lookup = get_line_lookup(points)
+    assert lookup.lines == [(1, 0), (inf, 0), (-1, 2)]
+
+    assert lookup.lines_through((0, 0)) == [(1, 0), (inf, 0)]
+    assert lookup.lines_through((1.0, 1)) == [(1, 0), (-1, 2)]
+    assert lookup.lines_through((7, 3)) == []
+    assert lookup.lines_through((3, 3)) == []  # Not an input point
+    assert lookup.lines_through((0.5, 0.5)) == []
+    assert lookup.lines_through(("0", 0)) == []
+
+    assert lookup.lines_containing((3, 3)) == [(1, 0)]
+    assert lookup.lines_containing((0, 9)) == [(inf, 0)]
+    assert lookup.lines_containing((0.5, 0.5)) == [(1, 0)]
+    assert lookup.lines_containing((0.25, 1.75)) == [(-1, 2)]
+    assert lookup.lines_containing((0, 2)) == [(inf, 0), (-1, 2)]
+    assert lookup.lines_containing((0.1, 0.2)) == []
+
+    assert (inf, 0) in lookup and (inf, 1) not in lookup
+    assert lookup.support((1, 0)) == 3 and lookup.support((2, 0)) == 0
+
+
+def test_decimal_grid():
+    lookup = get_line_lookup([(0.5, 0), (0.5, 1), (0.5, 2.25), (1, 1)])
+    assert lookup.lines == [(inf, 0.5)]
+    assert lookup.lines_through((0.5, 2.25)) == [(inf, 0.5)]
+    assert lookup.lines_containing((0.5, -7.125)) == [(inf, 0.5)]
+    assert lookup.lines_containing((0.25, 0)) == []
+
+
+def test_exact_lines_with_same_float_line_kept_apart():
+    dx, dy = 3 * 10 ** 17 + 1, 10 ** 17  # Slope rounds to the float 1 / 3
+    points = [(0, 0), (3, 1), (6, 2), (9, 3), (dx, dy), (2 * dx, 2 * dy)]
+    lookup = get_line_lookup(points)
+    assert lookup.lines == [(1 / 3, 0), (1 / 3, 0)]
+    assert lookup.key_support((1, 3, 0)) == 4 and lookup.key_support((dy, dx, 0)) == 3
+    assert lookup.support((1 / 3, 0)) == 4
+    assert lookup.lines_through((2 * dx, 2 * dy)) == [(1 / 3, 0)]
@@ -0,0 +1,67 @@
+"""
+"""
+
+from array import array
+from decimal import Decimal
+from math import inf
+
+import pytest
+
+from collinear.cli import main
+from collinear.get_collinears import get_lines
+from collinear.loaders import iter_csv_chunks, load_points, map_binary, map_npy
+from collinear.points import distinct_grid_points, is_columns
+
+
+def test_csv_chunks_with_header_and_decimals(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n0,0\n1,1\n\n2,2\n0.5, 3\n0.5,4.25\n")
+    chunks = list(iter_csv_chunks(str(path), chunk_rows=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[2] == [(Decimal("0.5"), Decimal("4.25"))]
+
+    path.write_text("0,0\n1,one\n")
+    with pytest.raises(ValueError) as exception_info:
+        list(iter_csv_chunks(str(path)))
+    assert "line 2" in str(exception_info.value)
+
+
+def test_binary_and_npy_columns_are_memory_mapped(tmp_path):
+    path = tmp_path / "points.i64"
+    path.write_bytes(array("q", [0, 0, 1, 1, 2, 2, 5, -7]).tobytes())
+    xs, ys = map_binary(str(path))
+    assert (xs.tolist(), ys.tolist()) == ([0, 1, 2, 5], [0, 1, 2, -7])
+    assert is_columns(load_points(str(path)))
+    assert get_lines(load_points(str(path))) == [(1, 0)]
+    assert distinct_grid_points(load_points(str(path))) == ([(0, 0), (1, 1), (2, 2), (5, -7)], 1)
+
+    path = tmp_path / "points.f64"
+    path.write_bytes(array("d", [0.5, 0, 0.5, 1, 0.5, 2]).tobytes())
+    assert get_lines(load_points(str(path), dtype="float64")) == [(inf, 0.5)]
+
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "points.npy"
+    np.save(str(path), np.array([[0, 0], [1, 2], [2, 4], [9, 9]], dtype=np.int64))
+    xs, ys = map_npy(str(path))
+    assert (xs.tolist(), ys.tolist()) == ([0, 1, 2, 9], [0, 2, 4, 9])
+
+    np.save(str(path), np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        map_npy(str(path))
+
+
+def test_cli_writes_csv_and_json_lines(tmp_path, capsys):
+    path = tmp_path / "points.csv"
+    path.write_text("0,0\n1,1\n2,2\n7,0\n7,5\n7,-2\n")
+    main([str(path)])
+    assert capsys.readouterr().out.splitlines() == ["slope,intercept", "1.0,0.0", "inf,7.0"]
+
+    output = tmp_path / "lines.jsonl"
+    main([str(path), "--output", str(output), "--output-format", "jsonl", "--engine", "pairs"])
+    assert output.read_text().splitlines() == [
+        '{"slope": 1.0, "intercept": 0.0}',
+        '{"slope": null, "intercept": 7.0}',
+    ]
+
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "missing.csv")])
@@ -0,0 +1,53 @@
+"""
+"""
+
+from math import inf
+from random import Random
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.sampling import _verify, sample_lines, samples_needed
+
+
+def test_raise_exception_if_fraction_or_confidence_invalid():
+    with pytest.raises(ValueError) as exception_info:
+        sample_lines([(0, 0), (1, 1), (2, 2)], min_fraction=0)
+    assert "Expected min_fraction is in (0, 1]." in str(exception_info.value)
+
+    with pytest.raises(ValueError) as exception_info:
+        sample_lines([(0, 0), (1, 1), (2, 2)], confidence=1)
+    assert "Expected confidence is in (0, 1)." in str(exception_info.value)
+
+
+def test_samples_needed_grows_with_confidence():
+    assert samples_needed(1, 0.99, 100) == 1
+    assert samples_needed(0.1, 0.9, 1000) < samples_needed(0.1, 0.99, 1000) < samples_needed(0.05, 0.99, 1000)
+
+
+def test_verify_exact_support():
+    points = [(x, 3 * x + 1) for x in range(-5, 20, 2)] + [(7, y) for y in range(4)] + [(100, -100), (-50, 1000)]
+    bounds = (-50, 100, -100, 1000)
+    for line in ((3, 1, -1), (1, 0, 7), (0, 1, -1), (2, 3, 5), (-7, 2, 11), (1, 0, 8)):
+        dy, dx, c = line
+        expected = sum(1 for x, y in points if dy * x - dx * y == c)
+        assert _verify(line, points, set(points), bounds) == expected
+    assert _verify((3, 1, -1), points, set(points), bounds) == 13  # y = 3x + 1
+
+
+def test_sample_lines_finds_dominant_lines():
+    rng = Random(7)
+    points = [(x, 2 * x + 5) for x in range(300)] + [(-9, y) for y in range(200)]
+    points += [(rng.randrange(-10 ** 9, 10 ** 9), rng.randrange(-10 ** 9, 10 ** 9)) for _ in range(500)]
+
+    result = sample_lines(points, min_fraction=0.15, confidence=0.999, seed=1)
+    assert result.lines == [((2, 5), 300), ((inf, -9), 200)]
+    assert result.min_points == 150
+    assert result.confidence >= 0.999
+    assert result.samples == samples_needed(0.15, 0.999, len(points))
+    assert 2 <= result.candidates <= result.samples
+
+    # Every reported line is exact, even with a sample budget too small for the confidence target.
+    limited = sample_lines(points, min_fraction=0.15, max_samples=5, seed=1)
+    assert limited.samples == 5 and limited.confidence < 0.99
+    assert all(line in get_lines(points, min_points=150) for line, _ in limited.lines)
@@ -0,0 +1,112 @@
+"""
+"""
+
+import asyncio
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.service import LineClient, LineService, ServiceBusy, request_lines, serve
+from tests.test_functional.test_get_collinears_comprehensive_randomized import (
+    random_collinear_points, random_non_collinear_points)
+
+
+def test_raise_exception_if_invalid_options():
+    with pytest.raises(ValueError):
+        LineService(max_pending=0)
+    with pytest.raises(ValueError):
+        LineService(engine="triples")
+
+
+def test_coalescing_backpressure_and_time_budget():
+    points = random_collinear_points(num_lines=5) + random_non_collinear_points(20)
+    larger = [(x, x * x % 1009) for x in range(1500)]
+
+    async def requests():
+        with LineService(workers=1, max_pending=2) as service:
+            first, second, reordered = await asyncio.gather(
+                service.get_lines(points), service.get_lines(points), service.get_lines(points[::-1])
+            )
+            assert first == second == reordered == get_lines(points)
+            assert (service.computations, service.coalesced) == (1, 2)
+
+            with pytest.raises(ValueError):
+                await service.get_lines([(0, 0)], min_points=1)
+
+            slow = asyncio.ensure_future(service.get_lines(larger))
+            await asyncio.sleep(0)
+            with pytest.raises(TimeoutError):
+                await service.get_lines(larger, timeout=0.001)
+            with pytest.raises(ServiceBusy):
+                await asyncio.gather(service.get_lines([(0, 0)]), service.get_lines([(1, 1)]))
+            assert await slow == get_lines(larger)
+
+    asyncio.run(requests())
+
+
+def test_client_over_unix_socket_and_tcp(tmp_path):
+    points = random_collinear_points(num_lines=3) + [(0, 0.5), (0, 1.5), (0, 2.5)]
+    path = str(tmp_path / "collinear.sock")
+
+    async def requests():
+        with LineService(workers=1) as service:
+            server = await serve(service, path)
+            tcp_server = await serve(service, port=0)
+            port = tcp_server.sockets[0].getsockname()[1]
+            async with server, tcp_server:
+                async with await LineClient.connect(path) as client:
+                    lines, coalesced = await asyncio.gather(client.get_lines(points), client.get_lines(points))
+                    assert lines == coalesced == get_lines(points)
+                    with pytest.raises(TypeError):
+                        await client.get_lines([(0, 0), (1, 1), (2, None)])
+                async with await LineClient.connect(port=port) as client:
+                    assert await client.get_lines(points, min_points=4) == get_lines(points, min_points=4)
+
+                # Blocking client from another thread with its own event loop.
+                blocking = await asyncio.get_running_loop().run_in_executor(None, request_lines, points, path)
+                assert blocking == get_lines(points)
+
+    asyncio.run(requests())
+
+
+def test_close_cancels_waiting_scans():
+    sets = [[(x, (x * x + k) % 1009) for x in range(1200)] for k in range(6)]
+
+    async def requests():
+        service = LineService(workers=1)
+        try:
+            requested = [asyncio.ensure_future(service.get_lines(points)) for points in sets]
+            while len(service._scans) < len(sets):
+                await asyncio.sleep(0.01)
+        finally:
+            service.close()
+        results = await asyncio.gather(*requested, return_exceptions=True)
+        cancelled = [isinstance(result, asyncio.CancelledError) for result in results]
+        assert any(cancelled) and not all(cancelled)
+        for points, result, was_cancelled in zip(sets, results, cancelled):
+            assert was_cancelled or result == get_lines(points)
+
+    asyncio.run(requests())
+
+
+def test_standard_json_and_busy_requests_rejected_before_parsing(tmp_path):
+    path = str(tmp_path / "collinear.sock")
+    larger = [(x, x * x % 1009) for x in range(1500)]
+
+    async def requests():
+        with LineService(workers=1, max_pending=1) as service:
+            async with await serve(service, path):
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(b'{"id": 7, "points": [[0, 0], [0, 1], [0, 2]]}\n')
+                assert await reader.readline() == b'{"id": 7, "lines": [[null, 0.0]]}\n'
+
+                slow = asyncio.ensure_future(service.get_lines(larger))
+                while not service.busy:
+                    await asyncio.sleep(0.01)
+                writer.write(b'{"id": 8, "points": not parsed}\n')
+                response = await reader.readline()
+                assert response.startswith(b'{"id": 8, "error": "ServiceBusy"')
+                writer.close()
+                assert await slow == get_lines(larger)
+
+    asyncio.run(requests())
@@ -0,0 +1,75 @@
+"""
+"""
+
+from decimal import Decimal
+from math import inf
+from random import Random
+
+import pytest
+
+from collinear.get_collinears import get_line_groups, get_lines
+from collinear.window import APPEARED, DISAPPEARED, SlidingWindow, WindowEvent
+
+
+def test_raise_exception_if_invalid_options_or_events():
+    with pytest.raises(ValueError):
+        SlidingWindow()
+    with pytest.raises(ValueError):
+        SlidingWindow(seconds=0)
+    with pytest.raises(ValueError):
+        SlidingWindow(max_points=0)
+
+    window = SlidingWindow(seconds=10)
+    window.push(5, 0, 0)
+    with pytest.raises(ValueError):
+        window.push(4, 1, 1)
+    with pytest.raises(TypeError):
+        window.push(20, "1", 1)
+    assert len(window) == 1 and window.now == 5
+
+    window.push(6, Decimal("0.5"), 1.5)
+    assert len(window) == 2
+
+
+def test_time_window_events():
+    window = SlidingWindow(seconds=10)
+    assert window.push(0, 0, 0) == []
+    assert window.push(1, 1, 1) == []
+    assert window.push(2, 2, 2) == [WindowEvent(APPEARED, (1, 0), 2)]
+    assert window.push(3, 5, 0) == []
+    assert window.push(4, 5, 0.5) == []
+    assert window.push(9, 5, 7) == [WindowEvent(APPEARED, (inf, 5), 9)]
+    assert window.lines() == [(1, 0), (inf, 5)]
+
+    # (0, 0) expires at t=10, (1, 1) at t=11 and (5, 0) at t=13
+    assert window.push(10, 3, 3) == []
+    assert window.advance(11) == [WindowEvent(DISAPPEARED, (1, 0), 11)]
+    assert window.advance(12) == []
+    assert window.advance(13) == [WindowEvent(DISAPPEARED, (inf, 5), 13)]
+    assert len(window) == 3
+
+
+def test_point_count_window_and_reappearing_line():
+    window = SlidingWindow(max_points=3)
+    events = list(window.process([(0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 3), (4, 0, 9)]))
+    assert events == [WindowEvent(APPEARED, (1, 0), 2), WindowEvent(DISAPPEARED, (1, 0), 4)]
+    assert window.lines() == []
+
+
+def test_same_lines_as_get_lines_of_window():
+    random = Random(20)
+    window = SlidingWindow(seconds=30, max_points=40)
+    stream = []
+    current = set()
+    for step in range(300):
+        t = step * 0.5
+        x = random.randint(0, 6)
+        stream.append((t, x, random.choice((x, 2 * x, random.randint(0, 6)))))
+        for event in window.push(*stream[-1]):
+            assert (event.kind == APPEARED) == (event.line not in current)
+            current ^= {event.line}
+        recent = [(x, y) for s, x, y in stream[-40:] if s > t - 30]
+        assert set(window.lines()) == current == set(get_lines(recent))
+        assert sorted(window.line_counts()) == sorted(
+            ((group.slope, group.intercept), group.count) for group in get_line_groups(recent)
+        )
@@ -0,0 +1,62 @@
+"""
+"""
+
+from math import inf
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.lookup import get_line_lookup
+from collinear.snapshot import open_snapshot, write_snapshot
+from tests.test_functional.test_get_collinears_comprehensive_randomized import random_non_collinear_points
+
+
+def test_raise_exception_if_missing_or_invalid_input(tmp_path):
+    path = str(tmp_path / "lines.snapshot")
+    with pytest.raises(ValueError):
+        write_snapshot(path)
+    with pytest.raises(TypeError):
+        write_snapshot(path, {(0, 0)})
+    with pytest.raises(ValueError):
+        write_snapshot(path, [(0, 0), (2 ** 64, 0), (2 ** 65, 0)])
+
+    (tmp_path / "empty").write_bytes(b"")
+    (tmp_path / "other").write_bytes(b"x" * 100)
+    for name in ("empty", "other"):
+        with pytest.raises(ValueError):
+            open_snapshot(str(tmp_path / name))
+
+    write_snapshot(path, [(0, 0), (1, 1), (2, 2)])
+    with open(path, "ab") as snapshot_file:
+        snapshot_file.write(b"\0")
+    with pytest.raises(ValueError):
+        open_snapshot(path)
+
+
+def test_round_trip_lines_members_and_queries(tmp_path):
+    path = str(tmp_path / "lines.snapshot")
+    points = [(x, y) for x in range(4) for y in range(4)] + random_non_collinear_points(10)
+    assert write_snapshot(path, points) == len(get_lines(points))
+
+    lookup = get_line_lookup(points)
+    with open_snapshot(path) as snapshot:
+        assert len(snapshot) == len(lookup)
+        assert snapshot.lines == lookup.lines == get_lines(points, engine="anchor")
+        for xy in points + [(7, 7), (0.5, 0), ("1", 1)]:
+            assert snapshot.lines_through(xy) == lookup.lines_through(xy)
+        assert snapshot.members(0) == [(0, 0), (0, 1), (0, 2), (0, 3)]
+        assert snapshot.line(0) == (inf, 0)
+
+
+def test_decimal_grid_and_no_lines(tmp_path):
+    path = str(tmp_path / "lines.snapshot")
+    write_snapshot(path, [(0.5, 0), (0.5, 1.25), (0.5, 2), (1, 1)])
+    with open_snapshot(path) as snapshot:
+        assert snapshot.lines == [(inf, 0.5)]
+        assert snapshot.members(0) == [(0.5, 0), (0.5, 1.25), (0.5, 2)]
+        assert snapshot.lines_through((0.5, 1.25)) == [(inf, 0.5)]
+        assert snapshot.lines_through((1, 1)) == []
+
+    assert write_snapshot(path, [(0, 0), (1, 5)]) == 0
+    with open_snapshot(path) as snapshot:
+        assert snapshot.lines == [] and snapshot.lines_through((0, 0)) == []
@@ -0,0 +1,89 @@
+"""
+"""
+
+from decimal import Decimal
+from math import inf
+from random import Random
+
+import pytest
+
+from collinear.get_collinears import get_lines
+from collinear.loaders import load_points
+from collinear.synthetic import iter_batches, workload, write_workload
+
+
+def test_raise_exception_if_invalid_parameters():
+    with pytest.raises(ValueError):
+        workload(coordinates="complex")
+    with pytest.raises(ValueError):
+        workload(places=2)
+    with pytest.raises(ValueError):
+        workload(noise_points=5, noise_fraction=0.5)
+    with pytest.raises(ValueError):
+        workload(duplicate_fraction=1)
+    with pytest.raises(ValueError):
+        workload(points_per_line=(4, 3))
+    with pytest.raises(ValueError):
+        workload(coordinates="float", boundary=10 ** 10)
+    with pytest.raises(ValueError):
+        write_workload("points.bin", file_format="npy")
+
+
+def test_same_seed_same_points():
+    assert workload(5, (3, 6), noise_points=20, seed=7) == workload(5, (3, 6), noise_points=20, seed=7)
+    assert workload(5, (3, 6), noise_points=20, seed=7) != workload(5, (3, 6), noise_points=20, seed=8)
+    assert workload(seed=Random(7)) == workload(seed=7)
+    assert sorted(workload(noise_points=20, seed=7, shuffle=True)) == sorted(workload(noise_points=20, seed=7))
+
+    # Batches split the same points.
+    batches = list(iter_batches(10, 5, noise_points=100, seed=7, batch_points=16))
+    assert max(len(batch) for batch in batches) <= 16 + 4
+    assert [xy for batch in batches for xy in batch] == workload(10, 5, noise_points=100, seed=7)
+
+
+def test_counts_and_detected_lines():
+    points = workload(4, 5, vertical_lines=2, horizontal_lines=3, boundary=1000, slope_boundary=5, seed=3)
+    assert len(points) == 9 * 5
+    assert len(set(points)) == 9 * 5
+    lines = get_lines(points, min_points=5)
+    assert len(lines) == 9
+    assert len([line for line in lines if line[0] == inf]) == 2
+    assert len([line for line in lines if line[0] == 0]) >= 3
+
+    points = workload(10, 4, noise_fraction=0.2, duplicate_fraction=0.5, seed=3)
+    assert len(points) == 2 * (40 + 10)
+    assert len(set(points)) <= 50
+
+
+def test_float_and_decimal_coordinates():
+    points = workload(5, (3, 5), coordinates="float", places=2, boundary=10 ** 6, seed=11)
+    assert all(isinstance(x, float) and isinstance(y, float) for x, y in points)
+    assert len(get_lines(points)) == 5
+
+    # Default bounds of float workloads stay exactly collinear.
+    for places in (0, 3):
+        points = workload(num_lines=5, points_per_line=4, coordinates="float", places=places, seed=1)
+        assert len(get_lines(points, min_points=4)) == 5
+
+    points = workload(5, (3, 5), coordinates="decimal", places=3, duplicate_fraction=0.25, seed=11)
+    assert all(isinstance(x, Decimal) and isinstance(y, Decimal) for x, y in points)
+    assert len(get_lines(points)) == 5
+
+
+def test_write_workload_round_trip(tmp_path):
+    kwargs = dict(num_lines=6, points_per_line=4, noise_points=30, boundary=10 ** 6, seed=5, batch_points=8)
+    points = workload(**kwargs)
+    csv_path, binary_path, floats_path = (str(tmp_path / name) for name in ("points.csv", "points.bin", "floats.bin"))
+
+    assert write_workload(csv_path, **kwargs) == len(points)
+    assert list(load_points(csv_path)) == points
+
+    assert write_workload(binary_path, file_format="binary", **kwargs) == len(points)
+    assert list(zip(*load_points(binary_path))) == points
+
+    floats = dict(kwargs, coordinates="float", places=2)
+    write_workload(floats_path, file_format="binary", **floats)
+    assert list(zip(*load_points(floats_path, dtype="float64"))) == workload(**floats)
+
+    with pytest.raises(ValueError):
+        write_workload(str(tmp_path / "wide.bin"), file_format="binary", seed=5)
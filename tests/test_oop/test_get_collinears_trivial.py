@@ -1,6 +1,8 @@
 """
 """
 
+from decimal import Decimal
+from math import inf
 from random import randint, shuffle
 
 import pytest
@@ -105,3 +107,21 @@ def test_3_collinear_points_1_line():
     assert intercept == y2 - slop * x2
     assert intercept == y1 - slop * x1
     assert len(get_lines(points)) == 1
+
+
+def test_decimal_like_points_exact_lines():
+    # 0.1 + 0.2 != 0.3 in binary floating-point, but points are compared on an exact integer grid.
+    points = [(0.1, 0.3), (0.2, 0.5), (0.3, 0.7), (Decimal("0.4"), Decimal("0.9"))]
+    assert get_lines(points) == [(2.0, 0.1)]
+
+    points = [(1.5, 0), (1.5, 2), (Decimal("1.50"), 7), (3, 1)]
+    assert get_lines(points) == [(inf, 1.5)]
+
+    points = [(1, 1), (1.0, 1.0), (2, 2)]  # Duplicate points across types
+    assert get_lines(points) == []
+
+
+def test_lines_with_equal_hashes_stay_distinct():
+    # hash(-1) == hash(-2) in CPython, lines must be keyed exactly and not by their hash.
+    points = [(1, -1), (2, -2), (3, -3), (1, -2), (2, -4), (3, -6)]
+    assert sorted(get_lines(points)) == [(-2, 0), (-1, 0)]
@@ -1,47 +1,30 @@
 """
 """
 
-from random import choice, randint, shuffle
+from random import shuffle
 from typing import List
 
 from collinear.get_collinears_oop_dataset import get_lines
+from collinear.synthetic import workload
 
 
-def random_non_collinear_points(num_non_collinears=10) -> List[tuple]:
+def random_non_collinear_points(num_non_collinears=10, seed=None) -> List[tuple]:
     """Helper func to generate random (x, y) in 2D with possibility of duplicates.
     """
-    boundary = 10000000000
-    nums = range(-boundary, boundary)
-    return [(choice(nums), choice(nums)) for _ in range(num_non_collinears)]
+    return workload(num_lines=0, noise_points=num_non_collinears, seed=seed)
 
 
 def random_collinear_points(
-    num_lines=3, min_collinear_points_per_line=3, max_collinear_points_per_line=3
+    num_lines=3, min_collinear_points_per_line=3, max_collinear_points_per_line=3, seed=None
 ) -> List[tuple]:
     """Helper func to generate 3 to 5 (x, y) points from 3 random lines in 2D
     A line represented as y=mx+b where m is the slop and b is line crossing y
     """
-    boundary = 10000000000
-    nums = range(-boundary, boundary)
-    lines = [(choice(nums), choice(nums)) for _ in range(num_lines)]
-
-    points = []
-    seen = set()  # To prevent duplicate collinear points
-    for m, b in lines:
-        for _ in range(
-            randint(min_collinear_points_per_line, max_collinear_points_per_line)
-        ):
-
-            # Prevent duplicate collinear points
-            while True:
-                x = choice(nums)
-                if x not in seen:
-                    seen.add(x)
-                    break
-
-            points.append((x, x * m + b))
-
-    return list(points)
+    return workload(
+        num_lines=num_lines,
+        points_per_line=(min_collinear_points_per_line, max_collinear_points_per_line),
+        seed=seed,
+    )
 
 
 def test_200_non_collinear_points():